@@ -3,6 +3,8 @@ from pathlib import Path
 import tempfile
 import shutil
 
+from weeb_cli.services.database import Database
+
 
 @pytest.fixture
 def temp_dir():
@@ -11,6 +13,14 @@ def temp_dir():
     shutil.rmtree(temp_path, ignore_errors=True)
 
 
+@pytest.fixture
+def database(temp_dir):
+    db = Database()
+    db.db_path = temp_dir / "test.db"
+    yield db
+    db.close()
+
+
 @pytest.fixture
 def mock_config(temp_dir):
     return {
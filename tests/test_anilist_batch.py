@@ -0,0 +1,126 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from weeb_cli.services.tracker import ANILIST_BATCH_SIZE, AniListTracker
+
+
+MEDIA = {"angel beats": 6547, "cowboy bebop": 1, "monster": 19}
+
+
+@pytest.fixture
+def tracker(database):
+    tracker = AniListTracker()
+    tracker._db = database
+    tracker._token = "token"
+    tracker.sync_min_interval = 0
+    return tracker
+
+
+class FakeAniList:
+    """Answers aliased Media lookups and SaveMediaListEntry mutations."""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, url, json=None, **kwargs):
+        self.requests.append(json)
+        variables = json["variables"]
+        data = {}
+        status = 200
+        if json["query"].startswith("query"):
+            for name, title in variables.items():
+                media_id = MEDIA.get(title.lower())
+                data["m" + name[1:]] = {"id": media_id, "episodes": 12} if media_id else None
+                if media_id is None:
+                    status = 404
+        else:
+            for name, media_id in variables.items():
+                if name.startswith("m"):
+                    i = name[1:]
+                    data["u" + i] = {"id": media_id, "progress": variables["p" + i], "status": variables["s" + i]}
+        resp = MagicMock()
+        resp.status_code = status
+        resp.json.return_value = {"data": data}
+        return resp
+
+    @property
+    def mutations(self):
+        return [r for r in self.requests if r["query"].startswith("mutation")]
+
+
+class TestAniListBatch:
+    def test_updates_share_one_lookup_and_one_mutation(self, tracker, database):
+        api = FakeAniList()
+        updates = [
+            {"title": "Angel Beats", "episode": 1, "total": 13},
+            {"title": "Cowboy Bebop", "episode": 26, "total": 26},
+            {"title": "Angel Beats", "episode": 3, "total": 13},
+        ]
+        with patch("weeb_cli.services.tracker.http_client.post", side_effect=api):
+            assert tracker.update_progress_batch(updates) == [True, True, True]
+
+        assert len(api.requests) == 2
+        variables = api.mutations[0]["variables"]
+        assert sorted((variables[f"m{i}"], variables[f"p{i}"], variables[f"s{i}"]) for i in range(2)) == [
+            (1, 26, "COMPLETED"), (6547, 3, "CURRENT")
+        ]
+        assert database.get_tracker_id("anilist", "cowboy bebop")["media_id"] == "1"
+
+    def test_cached_ids_skip_lookup(self, tracker, database):
+        database.save_tracker_id("anilist", "monster", 19)
+        api = FakeAniList()
+        with patch("weeb_cli.services.tracker.http_client.post", side_effect=api):
+            assert tracker.update_progress_batch([{"title": "Monster", "episode": 4}]) == [True]
+
+        assert len(api.requests) == 1 and api.mutations
+
+    def test_missing_title_keeps_partial_results(self, tracker):
+        api = FakeAniList()
+        updates = [{"title": "Monster", "episode": 2}, {"title": "Unknown Show", "episode": 1}]
+        with patch("weeb_cli.services.tracker.http_client.post", side_effect=api):
+            assert tracker.update_progress_batch(updates) == [True, False]
+
+        assert len(api.mutations[0]["variables"]) == 3
+
+    def test_large_batches_are_chunked(self, tracker):
+        titles = [f"Show {i}" for i in range(ANILIST_BATCH_SIZE + 1)]
+        MEDIA.update({t.lower(): 1000 + i for i, t in enumerate(titles)})
+        api = FakeAniList()
+        try:
+            with patch("weeb_cli.services.tracker.http_client.post", side_effect=api):
+                results = tracker.update_progress_batch([{"title": t, "episode": 1} for t in titles])
+        finally:
+            for t in titles:
+                MEDIA.pop(t.lower())
+
+        assert all(results)
+        assert len(api.requests) == 4
+
+    def test_sync_pending_drains_outbox_in_one_batch(self, tracker, database):
+        for title, episode in [("Angel Beats", 4), ("Cowboy Bebop", 2), ("Monster", 7)]:
+            database.queue_tracker_update("anilist", title, episode)
+        api = FakeAniList()
+        with patch("weeb_cli.services.tracker.http_client.post", side_effect=api):
+            assert tracker.sync_pending() == 3
+
+        assert len(api.requests) == 2
+        assert database.count_tracker_outbox("anilist") == 0
+
+    def test_failed_mutation_leaves_outbox(self, tracker, database):
+        database.save_tracker_id("anilist", "monster", 19)
+        database.queue_tracker_update("anilist", "Monster", 7)
+        resp = MagicMock(status_code=500)
+        resp.json.return_value = {"data": None, "errors": [{"message": "Internal error"}]}
+        with patch("weeb_cli.services.tracker.http_client.post", return_value=resp):
+            assert tracker.sync_pending() == 0
+
+        assert database.get_tracker_outbox("anilist")[0]["attempts"] == 1
+
+    def test_push_progress_sends_backlog_with_new_episode(self, tracker, database):
+        database.queue_tracker_update("anilist", "Cowboy Bebop", 5)
+        api = FakeAniList()
+        with patch("weeb_cli.services.tracker.http_client.post", side_effect=api):
+            assert tracker.push_progress("Monster", 1, 74) == 2
+
+        assert len(api.mutations) == 1
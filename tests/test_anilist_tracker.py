@@ -7,6 +7,7 @@ from weeb_cli.services.tracker import AniListTracker
 def anilist_tracker():
     tracker = AniListTracker()
     tracker._db = MagicMock()
+    tracker._db.get_tracker_id.return_value = None
     return tracker
 
 
@@ -65,7 +66,7 @@ class TestAniListGraphQL:
         mock_resp.status_code = 200
         mock_resp.json.return_value = {"data": {"Media": {"id": 1}}}
         
-        with patch("requests.post", return_value=mock_resp):
+        with patch("weeb_cli.services.tracker.http_client.post", return_value=mock_resp):
             result = anilist_tracker._graphql("query { Media { id } }")
         
         assert result == {"Media": {"id": 1}}
@@ -81,7 +82,7 @@ class TestAniListGraphQL:
         mock_resp = MagicMock()
         mock_resp.status_code = 400
         
-        with patch("requests.post", return_value=mock_resp):
+        with patch("weeb_cli.services.tracker.http_client.post", return_value=mock_resp):
             result = anilist_tracker._graphql("invalid query")
         
         assert result is None
@@ -121,9 +122,7 @@ class TestAniListProgressUpdate:
         result = anilist_tracker.update_progress("Angel Beats", 5, 13)
         
         assert result is False
-        pending_calls = [call for call in anilist_tracker.db.set_config.call_args_list 
-                        if "anilist_pending" in str(call)]
-        assert len(pending_calls) > 0
+        anilist_tracker.db.queue_tracker_update.assert_called_once_with("anilist", "Angel Beats", 5, 13)
     
     def test_update_progress_anime_not_found(self, anilist_tracker):
         anilist_tracker._token = "test_token"
@@ -168,55 +167,55 @@ class TestAniListPendingSync:
         
         anilist_tracker._queue_update("Angel Beats", 5, 13)
         
-        set_calls = anilist_tracker.db.set_config.call_args_list
-        pending_call = [call for call in set_calls if "anilist_pending" in str(call)][0]
-        pending_data = pending_call[0][1]
-        
-        assert len(pending_data) == 1
-        assert pending_data[0]["title"] == "Angel Beats"
-        assert pending_data[0]["episode"] == 5
-        assert pending_data[0]["total"] == 13
+        anilist_tracker.db.queue_tracker_update.assert_called_once_with("anilist", "Angel Beats", 5, 13)
+        anilist_tracker.db.set_config.assert_not_called()
     
     def test_sync_pending_success(self, anilist_tracker):
         anilist_tracker._token = "test_token"
         anilist_tracker.db.get_config.side_effect = lambda key: {
-            "anilist_token": "test_token",
-            "anilist_pending": [
-                {"title": "Anime1", "episode": 5, "total": 12, "timestamp": 123456},
-                {"title": "Anime2", "episode": 3, "total": 24, "timestamp": 123457}
-            ]
+            "anilist_token": "test_token"
         }.get(key, None)
+        anilist_tracker.db.get_tracker_outbox.return_value = [
+            {"title": "Anime1", "episode": 5, "total": 12},
+            {"title": "Anime2", "episode": 3, "total": 24}
+        ]
+        anilist_tracker.sync_min_interval = 0
         
-        with patch.object(anilist_tracker, "update_progress", return_value=True):
+        with patch.object(anilist_tracker, "update_progress_batch", return_value=[True, True]) as batch:
             synced = anilist_tracker.sync_pending()
         
+        batch.assert_called_once()
+        
         assert synced == 2
     
     def test_sync_pending_partial_failure(self, anilist_tracker):
         anilist_tracker._token = "test_token"
         anilist_tracker.db.get_config.side_effect = lambda key: {
-            "anilist_token": "test_token",
-            "anilist_pending": [
-                {"title": "Anime1", "episode": 5, "total": 12, "timestamp": 123456},
-                {"title": "Anime2", "episode": 3, "total": 24, "timestamp": 123457}
-            ]
+            "anilist_token": "test_token"
         }.get(key, None)
+        anilist_tracker.db.get_tracker_outbox.return_value = [
+            {"title": "Anime1", "episode": 5, "total": 12},
+            {"title": "Anime2", "episode": 3, "total": 24}
+        ]
+        anilist_tracker.sync_min_interval = 0
         
-        with patch.object(anilist_tracker, "update_progress", side_effect=[True, False]):
+        with patch.object(anilist_tracker, "update_progress_batch", return_value=[True, False]):
             synced = anilist_tracker.sync_pending()
         
         assert synced == 1
+        anilist_tracker.db.complete_tracker_update.assert_called_once()
+        anilist_tracker.db.fail_tracker_update.assert_called_once()
     
     def test_get_pending_count(self, anilist_tracker):
-        anilist_tracker.db.get_config.return_value = [
-            {"title": "Anime1", "episode": 5},
-            {"title": "Anime2", "episode": 3}
-        ]
+        anilist_tracker.db.get_config.return_value = None
+        anilist_tracker.db.count_tracker_outbox.return_value = 2
         
         count = anilist_tracker.get_pending_count()
         assert count == 2
+        anilist_tracker.db.count_tracker_outbox.assert_called_once_with("anilist")
     
     def test_get_pending_count_empty(self, anilist_tracker):
-        anilist_tracker.db.get_config.return_value = []
+        anilist_tracker.db.get_config.return_value = None
+        anilist_tracker.db.count_tracker_outbox.return_value = 0
         count = anilist_tracker.get_pending_count()
         assert count == 0
@@ -54,7 +54,7 @@ class TestAniWorldProvider:
         assert provider._extract_quality("HD quality") == "HD"
         assert provider._extract_quality("no quality info") == "N/A"
 
-    @patch('weeb_cli.providers.de.aniworld.requests.Session.post')
+    @patch('requests.Session.post')
     def test_search_success(self, mock_post, provider):
         """Test search returns results"""
         mock_response = Mock()
@@ -68,7 +68,7 @@ class TestAniWorldProvider:
         assert results[0].id == "one-piece"
         assert results[0].type == "series"
 
-    @patch('weeb_cli.providers.de.aniworld.requests.Session.post')
+    @patch('requests.Session.post')
     def test_search_filters_non_anime(self, mock_post, provider):
         """Test search filters out non-anime results"""
         mock_response = Mock()
@@ -83,7 +83,7 @@ class TestAniWorldProvider:
         assert len(results) == 1
         assert results[0].id == "one-piece"
 
-    @patch('weeb_cli.providers.de.aniworld.requests.Session.post')
+    @patch('requests.Session.post')
     def test_search_empty_results(self, mock_post, provider):
         """Test search with no results"""
         mock_response = Mock()
@@ -94,7 +94,7 @@ class TestAniWorldProvider:
         
         assert len(results) == 0
 
-    @patch('weeb_cli.providers.de.aniworld.requests.Session.get')
+    @patch('requests.Session.get')
     def test_get_episodes_with_cache(self, mock_get, provider):
         """Test episode fetching uses cache"""
         mock_response = Mock()
@@ -120,7 +120,7 @@ class TestAniWorldProvider:
     def test_html_cache_functionality(self, provider):
         """Test HTML caching works correctly"""
         with patch.object(provider, '_get', wraps=provider._get) as mock_get:
-            with patch('weeb_cli.providers.de.aniworld.requests.Session.get') as mock_session_get:
+            with patch('requests.Session.get') as mock_session_get:
                 mock_response = Mock()
                 mock_response.text = "<html>test</html>"
                 mock_response.raise_for_status = Mock()
@@ -136,7 +136,7 @@ class TestAniWorldProvider:
                 assert result1 == result2
                 assert mock_session_get.call_count == 1
 
-    @patch('weeb_cli.providers.de.aniworld.requests.Session.get')
+    @patch('requests.Session.get')
     def test_extract_video_from_embed_vidmoly(self, mock_get, provider):
         """Test Vidmoly video extraction"""
         mock_response = Mock()
@@ -158,7 +158,7 @@ class TestAniWorldProvider:
         url = provider._extract_video_from_embed("https://unknown.com/embed", "UnknownHoster")
         assert url is None
 
-    @patch('weeb_cli.providers.de.aniworld.requests.Session.get')
+    @patch('requests.Session.get')
     def test_get_streams_with_fallback(self, mock_get, provider):
         """Test stream extraction tries multiple hosters"""
         # Mock episode page with multiple hosters
@@ -201,7 +201,7 @@ class TestAniWorldProvider:
         assert len(streams) >= 1
         assert any("GerDub" in s.quality for s in streams)
 
-    @patch('weeb_cli.providers.de.aniworld.requests.Session.get')
+    @patch('requests.Session.get')
     def test_get_details_extracts_title_correctly(self, mock_get, provider):
         """Test anime details extraction with proper title parsing"""
         mock_response = Mock()
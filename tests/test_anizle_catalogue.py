@@ -0,0 +1,104 @@
+import json
+import time
+from unittest.mock import Mock, patch
+
+from weeb_cli.providers.tr.anizle_catalogue import AnizleCatalogue, CatalogueIndex, normalize
+
+
+ITEMS = [
+    {"info_slug": "angel-beats", "info_title": "Angel Beats!", "info_titleenglish": "Angel Beats"},
+    {"info_slug": "shingeki", "info_title": "Shingeki no Kyojin", "info_titleenglish": "Attack on Titan"},
+    {"info_slug": "kimi-no-na-wa", "info_title": "Kimi no Na wa.", "info_titleenglish": "Your Name"},
+    {"info_slug": "one-piece", "info_title": "One Piece", "info_titleoriginal": "ワンピース"},
+]
+
+
+def _response(status, items=None, headers=None):
+    response = Mock()
+    response.status_code = status
+    response.json.return_value = items
+    response.headers = headers or {}
+    return response
+
+
+class TestCatalogueIndex:
+    def test_normalize(self):
+        assert normalize("Kimi no Na wa.") == "kimi no na wa"
+        assert normalize("Çağrı: Kızıl") == "cagri kizil"
+
+    def test_slug_lookup(self):
+        index = CatalogueIndex(ITEMS)
+        assert index.by_slug["one-piece"]["info_title"] == "One Piece"
+
+    def test_candidates_share_tokens(self):
+        index = CatalogueIndex(ITEMS)
+        slugs = [i["info_slug"] for i in index.candidates("titan")]
+        assert slugs == ["shingeki"]
+
+    def test_candidates_tolerate_typos_and_partial_words(self):
+        index = CatalogueIndex(ITEMS)
+        assert "angel-beats" in [i["info_slug"] for i in index.candidates("angle beat")]
+        assert "shingeki" in [i["info_slug"] for i in index.candidates("shinge")]
+
+    def test_unrelated_query_has_no_candidates(self):
+        index = CatalogueIndex(ITEMS)
+        assert index.candidates("zzzz") == []
+        assert index.candidates("!!") == []
+
+
+class TestAnizleCatalogue:
+    def test_first_load_fetches_and_stores(self, temp_dir):
+        path = temp_dir / "anizle.json"
+        fetch = Mock(return_value=_response(200, ITEMS, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}))
+
+        assert AnizleCatalogue(path, fetch).items() == ITEMS
+        fetch.assert_called_once_with({})
+
+        stored = json.loads(path.read_text(encoding="utf-8"))
+        assert stored["etag"] == '"v1"' and stored["items"] == ITEMS
+
+    def test_fresh_store_is_not_refetched(self, temp_dir):
+        path = temp_dir / "anizle.json"
+        path.write_text(json.dumps({"items": ITEMS, "fetched_at": time.time()}))
+        fetch = Mock()
+
+        assert AnizleCatalogue(path, fetch).items() == ITEMS
+        fetch.assert_not_called()
+
+    def test_stale_store_is_revalidated_in_background(self, temp_dir):
+        path = temp_dir / "anizle.json"
+        path.write_text(json.dumps({
+            "items": ITEMS, "etag": '"v1"', "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT", "fetched_at": 0
+        }))
+        fetch = Mock(return_value=_response(304))
+        catalogue = AnizleCatalogue(path, fetch)
+
+        assert catalogue.items() == ITEMS
+        catalogue._refreshing.join(2)
+
+        fetch.assert_called_once_with({
+            "If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"
+        })
+        stored = json.loads(path.read_text(encoding="utf-8"))
+        assert stored["fetched_at"] > 0 and stored["etag"] == '"v1"'
+
+    def test_failed_refresh_keeps_stored_list(self, temp_dir):
+        path = temp_dir / "anizle.json"
+        path.write_text(json.dumps({"items": ITEMS, "fetched_at": 0}))
+        catalogue = AnizleCatalogue(path, Mock(return_value=None))
+
+        assert catalogue.refresh() is False
+        assert catalogue.items() == ITEMS
+
+
+class TestAnizleSearch:
+    def test_search_scores_only_candidates(self):
+        from weeb_cli.providers.tr.anizle import AnizleProvider
+
+        provider = AnizleProvider()
+        with patch("weeb_cli.providers.tr.anizle._load_database", return_value=ITEMS), \
+             patch.object(AnizleProvider, "_similarity", wraps=provider._similarity) as similarity:
+            results = provider.search("attack on titan")
+
+        assert [r.id for r in results] == ["shingeki"]
+        assert similarity.call_count == 3
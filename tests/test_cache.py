@@ -1,6 +1,10 @@
 import pytest
 import time
-from weeb_cli.services.cache import CacheManager, cached
+import json
+import threading
+from weeb_cli.services.cache import (
+    CacheManager, FileCacheBackend, SQLiteCacheBackend, cached, _hash_key
+)
 
 
 class TestCacheManager:
@@ -77,3 +81,288 @@ class TestCachedDecorator:
         result3 = expensive_function(10)
         assert result3 == 20
         assert call_count == 2
+
+
+class TestMemoryTier:
+    def test_lru_evicts_by_entry_count(self, temp_dir):
+        cache = CacheManager(temp_dir / "cache", max_memory_entries=2)
+        
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert list(cache._memory_cache.keys()) == ["a", "c"]
+        assert cache.get_stats()["evictions"] == 1
+    
+    def test_lru_evicts_by_size(self, temp_dir):
+        cache = CacheManager(temp_dir / "cache", max_memory_bytes=100)
+        
+        cache.set("big1", "x" * 60)
+        cache.set("big2", "y" * 60)
+        
+        stats = cache.get_stats()
+        assert stats["memory_entries"] == 1
+        assert stats["memory_size_bytes"] <= 100
+        assert "big2" in cache._memory_cache
+    
+    def test_evicted_entry_falls_back_to_file(self, temp_dir):
+        cache = CacheManager(temp_dir / "cache", max_memory_entries=1)
+        
+        cache.set("a", "value_a")
+        cache.set("b", "value_b")
+        
+        assert "a" not in cache._memory_cache
+        assert cache.get("a") == "value_a"
+    
+    def test_per_key_ttl_overrides_max_age(self, temp_dir):
+        cache = CacheManager(temp_dir / "cache")
+        
+        cache.set("long", "kept", ttl=3600)
+        cache.set("short", "gone", ttl=0)
+        
+        assert cache.get("long", max_age=0) == "kept"
+        assert not cache._memory_cache["short"].is_fresh(3600, time.time())
+    
+    def test_hit_and_miss_counters(self, temp_dir):
+        cache = CacheManager(temp_dir / "cache")
+        
+        cache.set("key", "value")
+        cache.get("key")
+        cache.get("missing")
+        
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+
+def _backend(kind, cache_dir):
+    if kind == "sqlite":
+        return SQLiteCacheBackend(cache_dir / "cache.db")
+    return FileCacheBackend(cache_dir)
+
+
+class TestPersistentBackends:
+    @pytest.mark.parametrize("kind", ["sqlite", "file"])
+    def test_survives_new_manager(self, temp_dir, kind):
+        cache_dir = temp_dir / "cache"
+        cache_dir.mkdir()
+        cache = CacheManager(cache_dir, backend=_backend(kind, cache_dir))
+        cache.set("details:animecix:1", {"title": "Naruto"})
+        
+        fresh = CacheManager(cache_dir, backend=_backend(kind, cache_dir))
+        assert fresh.get("details:animecix:1") == {"title": "Naruto"}
+        assert fresh.get_stats()["file_entries"] == 1
+    
+    @pytest.mark.parametrize("kind", ["sqlite", "file"])
+    def test_persisted_ttl_overrides_max_age(self, temp_dir, kind):
+        cache_dir = temp_dir / "cache"
+        cache_dir.mkdir()
+        CacheManager(cache_dir, backend=_backend(kind, cache_dir)).set("mal_id:x", 21, ttl=3600)
+        
+        fresh = CacheManager(cache_dir, backend=_backend(kind, cache_dir))
+        assert fresh.get("mal_id:x", max_age=0) == 21
+    
+    @pytest.mark.parametrize("kind", ["sqlite", "file"])
+    def test_invalidate_provider_is_namespace_precise(self, temp_dir, kind):
+        cache_dir = temp_dir / "cache"
+        cache_dir.mkdir()
+        cache = CacheManager(cache_dir, max_memory_entries=1, backend=_backend(kind, cache_dir))
+        cache.set("skip_times:naruto:1", [[0, 90]])
+        cache.set("search:animecix:naruto", [1])
+        cache.set("details:animecix:1", {"id": 1})
+        cache.set("search:hianime:naruto", [2])
+        cache.set("details:animecixx:1", {"id": 2})
+        
+        assert cache.invalidate_provider("animecix") == 2
+        assert cache.get("search:hianime:naruto") == [2]
+        assert cache.get("details:animecixx:1") == {"id": 2}
+        assert cache.get("search:animecix:naruto") is None
+        assert cache.get("skip_times:naruto:1") == [[0, 90]]
+    
+    @pytest.mark.parametrize("kind", ["sqlite", "file"])
+    def test_clear_pattern_counts_disk_only_entries(self, temp_dir, kind):
+        cache_dir = temp_dir / "cache"
+        cache_dir.mkdir()
+        CacheManager(cache_dir, backend=_backend(kind, cache_dir)).set("details:hianime:1", {"id": 1})
+        
+        fresh = CacheManager(cache_dir, backend=_backend(kind, cache_dir))
+        fresh.set("details:hianime:2", {"id": 2})
+        fresh.set("search:hianime:x", [])
+        
+        assert fresh.clear_pattern("details:hianime:") == 2
+        assert fresh.get("details:hianime:1") is None
+        assert fresh.get("search:hianime:x") == []
+    
+    def test_file_manifest_survives_reopen(self, temp_dir):
+        cache_dir = temp_dir / "cache"
+        backend = FileCacheBackend(cache_dir)
+        cache = CacheManager(cache_dir, backend=backend)
+        cache.set("a:1", 1)
+        cache.set("a:2", 2)
+        cache.delete("a:2")
+        
+        reopened = FileCacheBackend(cache_dir)
+        assert reopened.delete_prefix("a:") == {_hash_key("a:1")}
+        assert list(cache_dir.glob("*.cache")) == []
+    
+    def test_clear_pattern_reaches_persisted_rows(self, temp_dir):
+        cache = CacheManager(temp_dir / "cache", max_memory_entries=1)
+        cache.set("skip_times:naruto:1", [1])
+        cache.set("skip_times:naruto:2", [2])
+        cache.set("mal_id:naruto", 20)
+        
+        assert cache.clear_pattern("naruto:") == 2
+        assert cache.get("mal_id:naruto") == 20
+    
+    def test_cleanup_removes_only_expired_rows(self, temp_dir):
+        cache = CacheManager(temp_dir / "cache")
+        cache.set("old", "value")
+        cache.set("kept", "value", ttl=3600)
+        cache.set("gone", "value", ttl=0)
+        
+        with cache.backend._lock, cache.backend._conn:
+            cache.backend._conn.execute(
+                "UPDATE cache_entries SET stored_at = stored_at - 7200 WHERE key = 'old'"
+            )
+        cache._memory_cache.clear()
+        
+        assert cache.cleanup(max_age=3600) == 2
+        assert cache.get_stats()["file_entries"] == 1
+        assert cache.get("kept") == "value"
+    
+    def test_legacy_cache_files_are_removed(self, temp_dir):
+        cache_dir = temp_dir / "cache"
+        cache_dir.mkdir()
+        legacy = cache_dir / f"{_hash_key('search:animecix:naruto')}.cache"
+        legacy.write_text(json.dumps([{"id": "1"}]), encoding="utf-8")
+        (cache_dir / "broken.cache").write_text("{not json", encoding="utf-8")
+        
+        cache = CacheManager(cache_dir)
+        
+        assert list(cache_dir.glob("*.cache")) == []
+        assert cache.get_stats()["file_entries"] == 0
+        assert cache.get("search:animecix:naruto") is None
+    
+    def test_keyless_rows_are_purged_on_open(self, temp_dir):
+        cache_dir = temp_dir / "cache"
+        cache = CacheManager(cache_dir)
+        cache.set("search:animecix:naruto", [{"id": "1"}])
+        with cache.backend._lock, cache.backend._conn:
+            cache.backend._conn.execute(
+                "INSERT INTO cache_entries (hash, value, size, stored_at) VALUES ('h', '[]', 2, 0)"
+            )
+        cache.backend.close()
+        
+        reopened = CacheManager(cache_dir)
+        assert reopened.get_stats()["file_entries"] == 1
+
+def _age_entry(cache, key, seconds):
+    cache._memory_cache[key].stored_at -= seconds
+    with cache.backend._lock, cache.backend._conn:
+        cache.backend._conn.execute(
+            "UPDATE cache_entries SET stored_at = stored_at - ? WHERE key = ?", (seconds, key)
+        )
+
+
+class TestGetOrLoad:
+    def test_fresh_entry_skips_loader(self, temp_dir):
+        cache = CacheManager(temp_dir / "cache")
+        cache.set("k", "cached")
+        
+        assert cache.get_or_load("k", lambda: pytest.fail("loader called"), max_age=60) == "cached"
+    
+    def test_stale_entry_served_while_refreshing_once(self, temp_dir):
+        cache = CacheManager(temp_dir / "cache")
+        cache.set("k", "old")
+        _age_entry(cache, "k", 120)
+        
+        release = threading.Event()
+        calls = []
+        
+        def loader():
+            calls.append(1)
+            release.wait(2)
+            return "new"
+        
+        assert cache.get_or_load("k", loader, max_age=60, stale_ttl=600) == "old"
+        assert cache.get_or_load("k", loader, max_age=60, stale_ttl=600) == "old"
+        release.set()
+        
+        deadline = time.time() + 2
+        while cache.get("k", max_age=60) != "new" and time.time() < deadline:
+            time.sleep(0.01)
+        assert cache.get("k", max_age=60) == "new"
+        assert len(calls) == 1
+    
+    def test_past_hard_ttl_loads_synchronously(self, temp_dir):
+        cache = CacheManager(temp_dir / "cache")
+        cache.set("k", "old")
+        _age_entry(cache, "k", 1000)
+        
+        assert cache.get_or_load("k", lambda: "new", max_age=60, stale_ttl=600) == "new"
+    
+    def test_concurrent_misses_are_coalesced(self, temp_dir):
+        cache = CacheManager(temp_dir / "cache")
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        results = []
+        
+        def loader():
+            calls.append(1)
+            started.set()
+            release.wait(2)
+            return {"id": 1}
+        
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_load("k", loader)))
+            for _ in range(5)
+        ]
+        threads[0].start()
+        started.wait(2)
+        for t in threads[1:]:
+            t.start()
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join(2)
+        
+        assert len(calls) == 1
+        assert results == [{"id": 1}] * 5
+    
+    def test_loader_error_is_shared_and_not_cached(self, temp_dir):
+        cache = CacheManager(temp_dir / "cache")
+        
+        def loader():
+            raise RuntimeError("upstream down")
+        
+        with pytest.raises(RuntimeError):
+            cache.get_or_load("k", loader)
+        assert cache.get_or_load("k", lambda: "ok") == "ok"
+    
+    def test_none_result_is_not_cached(self, temp_dir):
+        cache = CacheManager(temp_dir / "cache")
+        
+        assert cache.get_or_load("k", lambda: None) is None
+        assert cache.get_or_load("k", lambda: "later") == "later"
+    
+    def test_cache_if_rejected_value_is_returned_not_stored(self, temp_dir):
+        cache = CacheManager(temp_dir / "cache")
+        
+        assert cache.get_or_load("k", lambda: [], cache_if=bool) == []
+        assert cache.get_or_load("k", lambda: ["hit"], cache_if=bool) == ["hit"]
+        assert cache.get_or_load("k", lambda: pytest.fail("loader called"), cache_if=bool) == ["hit"]
+    
+    def test_decorator_stale_ttl(self, temp_dir):
+        cache = CacheManager(temp_dir / "cache")
+        values = iter(["first", "second"])
+        
+        @cached(max_age=60, cache_manager=cache, stale_ttl=600)
+        def fetch(x):
+            return next(values)
+        
+        assert fetch(1) == "first"
+        _age_entry(cache, "fetch:1", 120)
+        assert fetch(1) == "first"
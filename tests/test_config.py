@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+import pytest
+
+from weeb_cli.config import Config
+from weeb_cli.services.database import Database
+
+
+@pytest.fixture
+def cfg(database):
+    c = Config()
+    c._db = database
+    return c
+
+
+class TestConfigCache:
+    def test_reads_are_served_from_memory(self, cfg, database):
+        database.set_config("language", "tr")
+        assert cfg.get("language") == "tr"
+
+        with patch.object(database, "get_config_snapshot", wraps=database.get_config_snapshot) as snap, \
+             patch.object(database, "get_config_version", wraps=database.get_config_version) as version:
+            for _ in range(100):
+                assert cfg.get("language") == "tr"
+                assert cfg.get("aria2_max_connections") == 16
+
+        assert snap.call_count == 0
+        assert version.call_count == 0
+
+    def test_own_writes_are_visible_immediately(self, cfg):
+        assert cfg.get("language") is None
+        cfg.set("language", "de")
+        assert cfg.get("language") == "de"
+
+    def test_direct_database_writes_are_visible(self, cfg, database):
+        assert cfg.get("anilist_username") is None
+        database.set_config("anilist_username", "someone")
+        assert cfg.get("anilist_username") == "someone"
+
+    def test_detects_writes_from_other_processes(self, cfg, database, temp_dir):
+        cfg.set("language", "en")
+        assert cfg.get("language") == "en"
+
+        other = Database()
+        other.db_path = database.db_path
+        other.set_config("language", "ja")
+        other.close()
+
+        assert cfg.get("language") == "en"
+        with patch("weeb_cli.config.CONFIG_RECHECK_INTERVAL", 0):
+            assert cfg.get("language") == "ja"
+
+    def test_version_check_skips_reload_when_unchanged(self, cfg, database):
+        cfg.set("language", "en")
+        cfg.get("language")
+
+        with patch("weeb_cli.config.CONFIG_RECHECK_INTERVAL", 0), \
+             patch.object(database, "get_config_snapshot", wraps=database.get_config_snapshot) as snap:
+            for _ in range(10):
+                assert cfg.get("language") == "en"
+
+        assert snap.call_count == 0
+
+    def test_mutable_values_are_copied(self, cfg):
+        cfg.set("pending", [1, 2])
+        cfg.get("pending").append(3)
+        assert cfg.get("pending") == [1, 2]
@@ -0,0 +1,223 @@
+import io
+import struct
+import threading
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from weeb_cli.constants import ConfigKey
+from weeb_cli.exceptions import DownloadError
+from weeb_cli.services.download.context import DownloadContext
+from weeb_cli.services.download.queue import QueueManager
+from weeb_cli.services.download.strategies import Aria2Strategy, YtdlpStrategy
+from weeb_cli.services.host_scoreboard import HostScoreboard
+
+
+class FakeQueueDB:
+    def __init__(self, rows=None):
+        self.rows = list(rows or [])
+        self.get_queue_calls = 0
+
+    def get_queue(self):
+        self.get_queue_calls += 1
+        return [dict(r) for r in self.rows]
+
+    def add_to_queue(self, item):
+        self.rows.append(dict(item))
+        return True
+
+    def update_queue_item(self, episode_id, **kwargs):
+        for row in self.rows:
+            if row["episode_id"] == episode_id:
+                row.update(kwargs)
+
+    def update_queue_items(self, updates):
+        for episode_id, fields in updates.items():
+            self.update_queue_item(episode_id, **fields)
+
+    def clear_completed_queue(self):
+        self.rows = [r for r in self.rows if r["status"] in ("pending", "processing")]
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def manager():
+    qm = QueueManager()
+    qm._db = FakeQueueDB()
+    qm._check_disk_space = lambda: True
+    with patch("weeb_cli.services.download.queue.progress_sink._db", qm._db), \
+         patch("weeb_cli.services.download.queue.config.get", side_effect=lambda key, default=None: default), \
+         patch("weeb_cli.services.error_handler.handle_download_error"), \
+         patch("weeb_cli.services.notifier.send_notification"), \
+         patch.object(QueueManager, "_max_workers", return_value=3):
+        yield qm
+    qm.stop_queue()
+
+
+def _episodes(count, start=1):
+    return [{"id": f"ep{i}", "number": i} for i in range(start, start + count)]
+
+
+class TestQueueManagerScheduler:
+    def test_fills_all_free_slots_immediately(self, manager):
+        release = threading.Event()
+        started = []
+
+        def fake_download(item):
+            started.append(item["episode_id"])
+            release.wait(2)
+
+        manager._download_item = fake_download
+        manager.add_to_queue("Anime", _episodes(5), "anime")
+        manager.start_queue()
+
+        assert _wait_for(lambda: len(started) == 3)
+        time.sleep(0.05)
+        assert len(started) == 3
+        assert manager.get_active_count() == 3
+        assert manager.get_pending_count() == 2
+
+        release.set()
+        assert _wait_for(lambda: manager.get_pending_count() == 0 and manager.get_active_count() == 0)
+        assert _wait_for(lambda: not manager.is_running())
+        assert sorted(started) == [f"ep{i}" for i in range(1, 6)]
+        assert all(r["status"] == "completed" for r in manager.db.rows)
+
+    def test_add_to_queue_wakes_idle_workers(self, manager):
+        release = threading.Event()
+        started = []
+
+        def fake_download(item):
+            started.append(item["episode_id"])
+            release.wait(2)
+
+        manager._download_item = fake_download
+        manager.add_to_queue("Anime", _episodes(1), "anime")
+        manager.start_queue()
+        assert _wait_for(lambda: len(started) == 1)
+
+        manager.add_to_queue("Anime", _episodes(2, start=2), "anime")
+        assert _wait_for(lambda: len(started) == 3)
+        release.set()
+
+    def test_retry_failed_requeues_and_restarts(self, manager):
+        attempts = []
+
+        def fake_download(item):
+            attempts.append(item["episode_id"])
+            if len(attempts) == 1:
+                raise Exception("404 not found")
+
+        manager._download_item = fake_download
+        manager.add_to_queue("Anime", _episodes(1), "anime")
+        manager.start_queue()
+        assert _wait_for(lambda: manager.get_failed_count() == 1)
+        assert _wait_for(lambda: not manager.is_running())
+
+        assert manager.retry_failed() == 1
+        assert _wait_for(lambda: manager.queue[0]["status"] == "completed")
+
+    def test_queue_reads_from_index_not_database(self, manager):
+        manager.add_to_queue("Anime", _episodes(3), "anime")
+        for _ in range(5):
+            manager.queue
+            manager.get_pending_count()
+
+        assert manager.db.get_queue_calls == 1
+        assert manager.is_downloading("anime", "ep2")
+        assert not manager.is_downloading("other")
+
+
+class TestScoreboardRecording:
+    ITEM = {"anime_title": "Anime", "episode_number": 1, "slug": "anime", "episode_id": "ep1"}
+
+    @pytest.fixture
+    def scoreboard(self, temp_dir):
+        stream = {"data": {"url": "https://cdn.example/ep1.mp4", "server": "SIBNET"}}
+        with patch("weeb_cli.services.download.queue.config.get", return_value=str(temp_dir)), \
+             patch("weeb_cli.services.watch.get_streams", return_value=stream), \
+             patch("weeb_cli.services.download.queue.host_scoreboard") as scoreboard:
+            yield scoreboard
+
+    def test_single_url_success_counts_fetched_bytes_only(self, scoreboard):
+        qm = QueueManager()
+        qm.download_manager = MagicMock()
+        qm.download_manager.download.return_value = DownloadContext(
+            url="https://cdn.example/ep1.mp4", output_path="ep1.mp4", fetched_bytes=1000
+        )
+
+        qm._download_item(dict(self.ITEM))
+
+        args, kwargs = scoreboard.record_download.call_args
+        assert args == ("https://cdn.example/ep1.mp4", "SIBNET", True)
+        assert kwargs["size_bytes"] == 1000
+
+    def test_single_url_failure_is_recorded(self, scoreboard):
+        qm = QueueManager()
+        qm.download_manager = MagicMock()
+        qm.download_manager.download.side_effect = DownloadError("boom", code="HTTP_FAILED")
+
+        with pytest.raises(DownloadError):
+            qm._download_item(dict(self.ITEM))
+
+        scoreboard.record_download.assert_called_once_with("https://cdn.example/ep1.mp4", "SIBNET", False)
+
+
+class TestToolThroughput:
+    ITEM = {"anime_title": "Anime", "episode_number": 1, "slug": "anime", "episode_id": "ep1"}
+    URL = "https://cdn.example/ep1.mp4"
+
+    @pytest.fixture
+    def board(self, temp_dir):
+        board = HostScoreboard(temp_dir / "host_scores.db")
+        stream = {"data": {"url": self.URL, "server": "SIBNET"}}
+        settings = {ConfigKey.DOWNLOAD_DIR.value: str(temp_dir)}
+        with patch("weeb_cli.services.download.queue.config.get",
+                   side_effect=lambda key, default=None: settings.get(key, default)), \
+             patch("weeb_cli.services.dependency_manager.dependency_manager.check_dependency", return_value="yt-dlp"), \
+             patch("weeb_cli.services.watch.get_streams", return_value=stream), \
+             patch("weeb_cli.services.download.queue.host_scoreboard", board):
+            yield board
+        board.close()
+
+    def test_ytdlp_download_records_throughput(self, board, temp_dir):
+        output = temp_dir / "Anime" / "Anime - S1E1.mp4"
+        output.parent.mkdir()
+        output.write_bytes(b"x" * 4000)
+
+        def fake_popen(cmd, **kwargs):
+            with open(cmd[cmd.index("-o") + 1], "ab") as f:
+                f.write(b"x" * 6000)
+            time.sleep(0.01)
+            return MagicMock(returncode=0, stdout=io.StringIO(), poll=lambda: 0)
+
+        qm = QueueManager()
+        qm.download_manager.strategies = [YtdlpStrategy()]
+        with patch.object(YtdlpStrategy, "can_handle", return_value=True), \
+             patch("weeb_cli.services.download.strategies.ytdlp.subprocess.Popen", side_effect=fake_popen), \
+             patch.object(board, "record_download", wraps=board.record_download) as record:
+            qm._download_item(dict(self.ITEM))
+
+        assert record.call_args.kwargs["size_bytes"] == 6000
+        assert board.get_stats(self.URL)["host"].throughput is not None
+
+    def test_aria2_skips_pieces_done_before_resume(self, temp_dir):
+        output = temp_dir / "ep.mp4"
+        output.write_bytes(b"\0" * 10_000)
+        bitfield = bytes([0b11000000])
+        control = b"\x00\x01" + b"\0" * 4 + struct.pack(">I", 0)
+        control += struct.pack(">IQQI", 4096, 10_000, 0, len(bitfield)) + bitfield
+        (temp_dir / "ep.mp4.aria2").write_bytes(control)
+
+        assert Aria2Strategy()._resumed_bytes(output) == 8192
+        (temp_dir / "ep.mp4.aria2").unlink()
+        assert Aria2Strategy()._resumed_bytes(output) == 10_000
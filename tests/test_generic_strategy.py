@@ -0,0 +1,141 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from weeb_cli.exceptions import DownloadError
+from weeb_cli.services.download.context import DownloadContext
+from weeb_cli.services.download.strategies.generic import GenericStrategy
+
+CONTENT = os.urandom(300_000)
+
+
+class FileServer:
+    """Local HTTP server serving CONTENT, optionally with byte ranges."""
+
+    def __init__(self, ranges=True, probe_only=False):
+        self.ranges = ranges
+        self.probe_only = probe_only
+        self.served = 0
+        self.range_requests = []
+        self.fail_from = None
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                header = self.headers.get("Range")
+                if server.probe_only and header != "bytes=0-0":
+                    header = None
+                if server.ranges and header:
+                    start, _, end = header[len("bytes="):].partition("-")
+                    start, end = int(start), int(end or len(CONTENT) - 1)
+                    if server.fail_from is not None and end >= server.fail_from and start > 0:
+                        self.send_response(503)
+                        self.end_headers()
+                        return
+                    body = CONTENT[start:end + 1]
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{len(CONTENT)}")
+                    with server._lock:
+                        server.range_requests.append((start, end))
+                else:
+                    body = CONTENT
+                    self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with server._lock:
+                    server.served += len(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/episode.mp4"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def small_split():
+    with patch("weeb_cli.services.download.strategies.generic.MIN_SPLIT_SIZE", 1024), \
+         patch("weeb_cli.services.download.strategies.generic.progress_sink._db", MagicMock()), \
+         patch("weeb_cli.services.download.strategies.generic.time.sleep"):
+        yield
+
+
+def _download(server, temp_dir, connections=4):
+    output = temp_dir / "episode.mp4"
+    GenericStrategy(connections=connections).download(
+        DownloadContext(url=server.url, output_path=str(output))
+    )
+    return output
+
+
+class TestGenericStrategy:
+    def test_parallel_ranged_download(self, temp_dir):
+        with FileServer() as server:
+            output = _download(server, temp_dir)
+
+        assert output.read_bytes() == CONTENT
+        assert len([r for r in server.range_requests if r != (0, 0)]) == 4
+        assert not (temp_dir / "episode.mp4.part").exists()
+        assert not (temp_dir / "episode.mp4.part.json").exists()
+
+    def test_single_stream_without_range_support(self, temp_dir):
+        with FileServer(ranges=False) as server:
+            output = _download(server, temp_dir)
+
+        assert output.read_bytes() == CONTENT
+        assert server.range_requests == []
+
+    def test_resumes_only_missing_ranges(self, temp_dir):
+        with FileServer() as server:
+            server.fail_from = 200_000
+            with pytest.raises(DownloadError):
+                _download(server, temp_dir)
+
+            range_map = json.loads((temp_dir / "episode.mp4.part.json").read_text())
+            missing = sum(end + 1 - start - done for start, end, done in range_map["ranges"])
+            assert 0 < missing < len(CONTENT)
+            assert not (temp_dir / "episode.mp4").exists()
+
+            server.fail_from = None
+            server.served = 0
+            context = DownloadContext(url=server.url, output_path=str(temp_dir / "episode.mp4"))
+            GenericStrategy(connections=4).download(context)
+
+        assert (temp_dir / "episode.mp4").read_bytes() == CONTENT
+        assert server.served == missing + 1
+        assert context.fetched_bytes == missing
+
+    def test_restarts_when_file_size_changes(self, temp_dir):
+        part = temp_dir / "episode.mp4.part"
+        part.write_bytes(b"x" * 10)
+        (temp_dir / "episode.mp4.part.json").write_text(
+            json.dumps({"size": 10, "ranges": [[0, 9, 10]]})
+        )
+        with FileServer() as server:
+            output = _download(server, temp_dir)
+
+        assert output.read_bytes() == CONTENT
+
+    def test_falls_back_when_ranges_are_ignored_after_probe(self, temp_dir):
+        with FileServer(probe_only=True) as server:
+            output = _download(server, temp_dir)
+
+        assert output.read_bytes() == CONTENT
+        assert not (temp_dir / "episode.mp4.part").exists()
+        assert not (temp_dir / "episode.mp4.part.json").exists()
@@ -0,0 +1,202 @@
+import json
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad
+
+from weeb_cli.exceptions import DownloadError
+from weeb_cli.services.download.context import DownloadContext
+from weeb_cli.services.download.strategies.hls import (
+    HLSStrategy,
+    parse_master_playlist,
+    parse_media_playlist,
+)
+
+KEY = bytes(range(16))
+SEGMENTS = [bytes([i]) * (1000 + i) for i in range(6)]
+
+
+class PlaylistServer:
+    """Local HTTP server serving a generated HLS stream."""
+
+    def __init__(self, encrypted=False):
+        self.routes = {}
+        self.hits = Counter()
+        self.fail = set()
+        self._build(encrypted)
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.hits[self.path] += 1
+                if self.path in server.fail or self.path not in server.routes:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = server.routes[self.path]
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def _build(self, encrypted):
+        lines = ["#EXTM3U", "#EXT-X-TARGETDURATION:4", "#EXT-X-MEDIA-SEQUENCE:7"]
+        if encrypted:
+            lines.append('#EXT-X-KEY:METHOD=AES-128,URI="/key.bin"')
+            self.routes["/key.bin"] = KEY
+        for i, data in enumerate(SEGMENTS):
+            lines += ["#EXTINF:4.0,", f"seg{i}.ts"]
+            if encrypted:
+                iv = (7 + i).to_bytes(16, "big")
+                data = AES.new(KEY, AES.MODE_CBC, iv).encrypt(pad(data, 16))
+            self.routes[f"/hi/seg{i}.ts"] = data
+        lines.append("#EXT-X-ENDLIST")
+        self.routes["/hi/index.m3u8"] = "\n".join(lines).encode()
+        self.routes["/master.m3u8"] = "\n".join([
+            "#EXTM3U",
+            '#EXT-X-STREAM-INF:BANDWIDTH=800000,RESOLUTION=640x360,CODECS="avc1,mp4a"',
+            "lo/index.m3u8",
+            '#EXT-X-STREAM-INF:BANDWIDTH=2800000,RESOLUTION=1280x720,CODECS="avc1,mp4a"',
+            "hi/index.m3u8",
+        ]).encode()
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def no_ffmpeg():
+    sink_db = MagicMock()
+    with patch("weeb_cli.services.download.strategies.hls.dependency_manager.check_dependency", return_value=None), \
+         patch("weeb_cli.services.download.strategies.hls.progress_sink._db", sink_db), \
+         patch("weeb_cli.services.download.strategies.hls.time.sleep"):
+        yield
+
+
+def _download(server, temp_dir, item=None):
+    output = temp_dir / "episode.mp4"
+    context = DownloadContext(url=f"{server.url}/master.m3u8", output_path=str(output), item=item)
+    HLSStrategy(workers=3).download(context)
+    return Path(context.saved_path)
+
+
+class TestPlaylistParsing:
+    def test_master_playlist_variants(self):
+        text = (
+            "#EXTM3U\n"
+            '#EXT-X-STREAM-INF:BANDWIDTH=800000,CODECS="avc1,mp4a",RESOLUTION=640x360\n'
+            "lo.m3u8\n"
+        )
+        variants = parse_master_playlist(text, "https://cdn.example.com/a/master.m3u8")
+        assert len(variants) == 1
+        assert variants[0].uri == "https://cdn.example.com/a/lo.m3u8"
+        assert variants[0].bandwidth == 800000
+        assert variants[0].resolution == "640x360"
+
+    def test_media_playlist_keys_and_sequence(self):
+        text = (
+            "#EXTM3U\n#EXT-X-MEDIA-SEQUENCE:3\n"
+            '#EXT-X-KEY:METHOD=AES-128,URI="k",IV=0x000102030405060708090a0b0c0d0e0f\n'
+            "#EXTINF:4.0,\na.ts\n"
+            "#EXT-X-KEY:METHOD=NONE\n"
+            "#EXTINF:2.5,\nb.ts\n"
+        )
+        playlist = parse_media_playlist(text, "https://cdn.example.com/v/index.m3u8")
+        first, second = playlist.segments
+        assert first.sequence == 3 and second.sequence == 4
+        assert first.key.uri == "https://cdn.example.com/v/k"
+        assert first.key.iv == bytes(range(16))
+        assert second.key is None
+        assert second.duration == 2.5
+
+    def test_sample_aes_is_rejected(self):
+        with pytest.raises(DownloadError):
+            parse_media_playlist('#EXT-X-KEY:METHOD=SAMPLE-AES,URI="k"\n#EXTINF:4,\na.ts\n', "https://x/")
+
+
+class TestHLSStrategy:
+    def test_handles_only_hls(self):
+        strategy = HLSStrategy()
+        assert strategy.can_handle("https://cdn.example.com/master.m3u8?token=1")
+        assert not strategy.can_handle("https://cdn.example.com/video.mp4")
+
+    def test_downloads_best_variant(self, temp_dir):
+        with PlaylistServer() as server:
+            output = _download(server, temp_dir)
+
+        assert output == temp_dir / "episode.ts"
+        assert output.read_bytes() == b"".join(SEGMENTS)
+        assert not (temp_dir / "episode.mp4").exists()
+        assert server.hits["/lo/index.m3u8"] == 0
+        assert not (temp_dir / "episode.mp4.hls").exists()
+
+    def test_remuxes_with_ffmpeg_into_output_path(self, temp_dir):
+        def fake_ffmpeg(cmd, **kwargs):
+            Path(cmd[-1]).write_bytes(b"mp4")
+            return MagicMock(returncode=0)
+
+        with PlaylistServer() as server, \
+             patch("weeb_cli.services.download.strategies.hls.dependency_manager.check_dependency",
+                   return_value="ffmpeg"), \
+             patch("weeb_cli.services.download.strategies.hls.subprocess.run", side_effect=fake_ffmpeg):
+            output = _download(server, temp_dir)
+
+        assert output == temp_dir / "episode.mp4"
+        assert output.read_bytes() == b"mp4"
+
+    def test_decrypts_aes128_segments(self, temp_dir):
+        with PlaylistServer(encrypted=True) as server:
+            output = _download(server, temp_dir)
+
+        assert output.read_bytes() == b"".join(SEGMENTS)
+        assert server.hits["/key.bin"] == 1
+
+    def test_resumes_from_segment_manifest(self, temp_dir):
+        with PlaylistServer() as server:
+            server.fail.add("/hi/seg4.ts")
+            with pytest.raises(DownloadError):
+                _download(server, temp_dir)
+            work_dir = temp_dir / "episode.mp4.hls"
+            journal = (work_dir / "done.log").read_text().split()
+            done = {int(i) for i in journal}
+            assert 4 not in done
+            assert "done" not in json.loads((work_dir / "manifest.json").read_text())
+
+            server.fail.clear()
+            server.hits.clear()
+            output = _download(server, temp_dir)
+
+        assert output.read_bytes() == b"".join(SEGMENTS)
+        fetched = {p for p in server.hits if p.endswith(".ts")}
+        missing = {f"/hi/seg{i}.ts" for i in range(len(SEGMENTS)) if i not in done}
+        assert fetched == missing
+
+    def test_reports_byte_and_segment_progress(self, temp_dir):
+        reports = []
+        with PlaylistServer() as server, \
+             patch("weeb_cli.services.download.strategies.hls.progress_sink.report",
+                   side_effect=lambda _id, **fields: reports.append(fields)):
+            _download(server, temp_dir, item={"episode_id": "ep1"})
+
+        final = reports[-1]
+        assert final["progress"] == 100
+        assert final["segments_done"] == final["segments_total"] == len(SEGMENTS)
+        assert final["downloaded_bytes"] == sum(len(s) for s in SEGMENTS)
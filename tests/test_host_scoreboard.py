@@ -0,0 +1,86 @@
+import time
+
+import pytest
+
+from weeb_cli.services import host_scoreboard as scoreboard_module
+from weeb_cli.services.host_scoreboard import HostScoreboard, HostStats
+from weeb_cli.providers.base import StreamLink
+
+
+@pytest.fixture
+def scoreboard(temp_dir):
+    board = HostScoreboard(temp_dir / "host_scores.db")
+    yield board
+    board.close()
+
+
+def _stream(host, server="S", quality="auto"):
+    return {"url": f"https://{host}/ep.mp4", "server": server, "quality": quality}
+
+
+class TestHostScoreboard:
+    def test_unknown_hosts_keep_tiebreak_order(self, scoreboard):
+        streams = [_stream("b", "B"), _stream("a", "A")]
+        order = {"A": 0, "B": 1}
+
+        ranked = scoreboard.rank(streams, tiebreak_key=lambda s: order[s["server"]])
+
+        assert [s["server"] for s in ranked] == ["A", "B"]
+
+    def test_failing_mirror_goes_last_despite_priority(self, scoreboard):
+        for _ in range(4):
+            scoreboard.record_download("https://slow.example/x", "ALUCARD", False)
+        scoreboard.record_download("https://fast.example/x", "SIBNET", True, size_bytes=10_000_000, seconds=2)
+
+        streams = [_stream("slow.example", "ALUCARD"), _stream("fast.example", "SIBNET")]
+        ranked = scoreboard.rank(streams, tiebreak_key=lambda s: 0 if s["server"] == "ALUCARD" else 1)
+
+        assert ranked[0]["server"] == "SIBNET"
+
+    def test_quality_key_stays_primary_for_healthy_mirrors(self, scoreboard):
+        scoreboard.record_download("https://fast.example/x", None, True, size_bytes=50_000_000, seconds=1)
+        streams = [_stream("fast.example", quality="720p"), _stream("new.example", quality="1080p")]
+
+        ranked = scoreboard.rank(streams, quality_key=lambda s: int(s["quality"][:-1]))
+
+        assert ranked[0]["quality"] == "1080p"
+
+    def test_faster_throughput_ranks_higher(self, scoreboard):
+        scoreboard.record_download("https://slow.example/x", None, True, size_bytes=100_000, seconds=10)
+        scoreboard.record_download("https://fast.example/x", None, True, size_bytes=100_000_000, seconds=10)
+
+        ranked = scoreboard.rank([_stream("slow.example"), _stream("fast.example")])
+
+        assert [s["url"] for s in ranked][0].startswith("https://fast.example")
+
+    def test_accepts_stream_link_objects(self, scoreboard):
+        scoreboard.record_probe("https://bad.example/x", "BAD", False)
+        links = [StreamLink(url="https://bad.example/x", server="BAD"), StreamLink(url="https://ok.example/x", server="OK")]
+
+        assert scoreboard.rank(links)[0].server == "OK"
+
+    def test_persists_across_instances(self, scoreboard, temp_dir):
+        scoreboard.record_probe("https://cdn.example/x", "MEGA", True, latency=0.25)
+        scoreboard.close()
+
+        reopened = HostScoreboard(temp_dir / "host_scores.db")
+        stats = reopened.get_stats(url="https://cdn.example/y", server="mega")
+        reopened.close()
+
+        assert stats["host"].ttfb == pytest.approx(0.25)
+        assert stats["server"].successes == pytest.approx(1, rel=1e-3)
+
+    def test_observations_decay(self):
+        stats = HostStats(samples=10, successes=0, updated_at=time.time() - scoreboard_module.HALF_LIFE)
+
+        decayed = stats.decayed(time.time())
+
+        assert decayed.samples == pytest.approx(5, rel=1e-3)
+        assert stats.unhealthy
+
+    def test_ewma_smooths_ttfb(self, scoreboard):
+        scoreboard.record_probe("https://cdn.example/x", None, True, latency=1.0)
+        scoreboard.record_probe("https://cdn.example/x", None, True, latency=2.0)
+
+        ttfb = scoreboard.get_stats(url="https://cdn.example/x")["host"].ttfb
+        assert ttfb == pytest.approx(1.0 + scoreboard_module.EWMA_ALPHA)
@@ -0,0 +1,80 @@
+import pytest
+from unittest.mock import patch, MagicMock
+
+import requests
+
+from weeb_cli.services import http_client as http_module
+from weeb_cli.services.http_client import HttpClient
+from weeb_cli.providers.base import BaseProvider
+
+
+@pytest.fixture
+def client():
+    client = HttpClient(pool_hosts=4, pool_size=8, timeout=7)
+    yield client
+    client.close()
+
+
+class DummyProvider(BaseProvider):
+    def search(self, query):
+        return []
+
+    def get_details(self, anime_id):
+        return None
+
+    def get_episodes(self, anime_id):
+        return []
+
+    def get_streams(self, anime_id, episode_id):
+        return []
+
+
+class TestHttpClient:
+    def test_session_is_shared(self, client):
+        assert client.session() is client.session()
+        assert isinstance(client.session(), requests.Session)
+
+    def test_adapter_uses_configured_pool_sizes(self, client):
+        adapter = client.session().get_adapter("https://example.com")
+
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 8
+
+    def test_advertises_compressed_encodings(self, client):
+        assert "gzip" in client.session().headers["Accept-Encoding"]
+
+    def test_default_timeout_applied(self, client):
+        with patch.object(requests.Session, "request", return_value=MagicMock()) as mock_request:
+            client.get("https://example.com", params={"q": 1})
+            client.get("https://example.com", timeout=2)
+
+        assert mock_request.call_args_list[0].kwargs["timeout"] == 7
+        assert mock_request.call_args_list[1].kwargs["timeout"] == 2
+
+    def test_impersonate_falls_back_to_separate_requests_session(self, client):
+        with patch.object(http_module, "HAS_CURL_CFFI", False):
+            fallback = client.session(impersonate="firefox")
+
+        assert isinstance(fallback, requests.Session)
+        assert fallback is not client.session()
+        assert fallback is client.session(impersonate="firefox")
+
+    def test_invalid_config_uses_defaults(self):
+        with patch.object(http_module.config, "get", return_value="bad"):
+            client = HttpClient()
+            assert client.pool_size == http_module.DEFAULT_POOL_SIZE
+            assert client.timeout == http_module.DEFAULT_TIMEOUT
+
+
+class TestProviderSession:
+    def test_providers_share_global_session(self):
+        assert DummyProvider().session is DummyProvider().session
+        assert DummyProvider().session is http_module.http_client.session()
+
+    def test_provider_can_override_session(self):
+        provider = DummyProvider()
+        own = requests.Session()
+        provider.session = own
+
+        assert provider.session is own
+        assert DummyProvider().session is not own
@@ -0,0 +1,55 @@
+"""Import-time budgets for the CLI entry points.
+
+Each command runs in a fresh interpreter under ``python -X importtime``.
+The total import time is the best of a few runs, to keep noise from failing
+the suite, and is compared against a budget. Set
+``WEEB_IMPORT_BUDGET_SCALE`` to loosen the budgets on slow machines. The
+module checks are exact and catch the usual regression: a top-level import
+that drags the TUI stack into non-interactive commands.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+RUNS = 3
+SCALE = float(os.environ.get("WEEB_IMPORT_BUDGET_SCALE", "1"))
+TUI_MODULES = {"questionary", "prompt_toolkit", "weeb_cli.ui.menu", "weeb_cli.commands.search"}
+
+
+def _import_profile(args, home):
+    """Run ``python -m weeb_cli <args>`` and return (total_ms, modules)."""
+    env = dict(os.environ, HOME=str(home), USERPROFILE=str(home))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "weeb_cli", *args],
+        capture_output=True, text=True, env=env, timeout=60
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    total_us = 0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split(":", 1)[1].split("|")
+        modules.add(name.strip())
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+@pytest.mark.parametrize("args, budget_ms, forbidden", [
+    (["--help"], 400, TUI_MODULES | {"weeb_cli.sdk", "requests"}),
+    (["api", "providers"], 550, TUI_MODULES | {"weeb_cli.commands.serve"}),
+    (["serve", "restful", "--help"], 400, TUI_MODULES | {"weeb_cli.commands.api"}),
+])
+def test_import_budget(args, budget_ms, forbidden, temp_dir):
+    best = None
+    for _ in range(RUNS):
+        total_ms, modules = _import_profile(args, temp_dir)
+        best = total_ms if best is None else min(best, total_ms)
+
+    assert not forbidden & modules, f"unexpected imports: {sorted(forbidden & modules)}"
+    assert best <= budget_ms * SCALE, f"weeb-cli {' '.join(args)}: {best:.0f} ms > {budget_ms} ms"
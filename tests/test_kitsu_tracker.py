@@ -7,6 +7,7 @@ from weeb_cli.services.tracker import KitsuTracker
 def kitsu_tracker():
     tracker = KitsuTracker()
     tracker._db = MagicMock()
+    tracker._db.get_tracker_id.return_value = None
     return tracker
 
 
@@ -26,8 +27,8 @@ class TestKitsuAuthentication:
             }]
         }
         
-        with patch("requests.post", return_value=mock_resp):
-            with patch("requests.get", return_value=mock_user_resp):
+        with patch("weeb_cli.services.tracker.http_client.post", return_value=mock_resp):
+            with patch("weeb_cli.services.tracker.http_client.get", return_value=mock_user_resp):
                 result = kitsu_tracker.authenticate("test@example.com", "password")
         
         assert result is True
@@ -39,7 +40,7 @@ class TestKitsuAuthentication:
         mock_resp = MagicMock()
         mock_resp.status_code = 401
         
-        with patch("requests.post", return_value=mock_resp):
+        with patch("weeb_cli.services.tracker.http_client.post", return_value=mock_resp):
             result = kitsu_tracker.authenticate("test@example.com", "wrong_password")
         
         assert result is False
@@ -77,7 +78,7 @@ class TestKitsuSearch:
             }]
         }
         
-        with patch("requests.get", return_value=mock_resp):
+        with patch("weeb_cli.services.tracker.http_client.get", return_value=mock_resp):
             result = kitsu_tracker.search_anime("Cowboy Bebop")
         
         assert result is not None
@@ -88,7 +89,7 @@ class TestKitsuSearch:
         mock_resp.status_code = 200
         mock_resp.json.return_value = {"data": []}
         
-        with patch("requests.get", return_value=mock_resp):
+        with patch("weeb_cli.services.tracker.http_client.get", return_value=mock_resp):
             result = kitsu_tracker.search_anime("NonexistentAnime")
         
         assert result is None
@@ -103,8 +104,7 @@ class TestKitsuProgressUpdate:
         result = kitsu_tracker.update_progress("Cowboy Bebop", 5, 26)
         
         assert result is False
-        pending = kitsu_tracker.db.set_config.call_args_list
-        assert any("kitsu_pending" in str(call) for call in pending)
+        kitsu_tracker.db.queue_tracker_update.assert_called_once_with("kitsu", "Cowboy Bebop", 5, 26)
     
     def test_update_progress_anime_not_found(self, kitsu_tracker):
         kitsu_tracker._access_token = "test_token"
@@ -118,7 +118,7 @@ class TestKitsuProgressUpdate:
         mock_search_resp.status_code = 200
         mock_search_resp.json.return_value = {"data": []}
         
-        with patch("requests.get", return_value=mock_search_resp):
+        with patch("weeb_cli.services.tracker.http_client.get", return_value=mock_search_resp):
             result = kitsu_tracker.update_progress("NonexistentAnime", 1, 12)
         
         assert result is False
@@ -144,8 +144,8 @@ class TestKitsuProgressUpdate:
         mock_update_resp = MagicMock()
         mock_update_resp.status_code = 201
         
-        with patch("requests.get", side_effect=[mock_search_resp, mock_entry_resp]):
-            with patch("requests.post", return_value=mock_update_resp):
+        with patch("weeb_cli.services.tracker.http_client.get", side_effect=[mock_search_resp, mock_entry_resp]):
+            with patch("weeb_cli.services.tracker.http_client.post", return_value=mock_update_resp):
                 result = kitsu_tracker.update_progress("Cowboy Bebop", 5, 26)
         
         assert result is True
@@ -158,11 +158,12 @@ class TestKitsuPendingSync:
         kitsu_tracker._user_id = "123"
         kitsu_tracker.db.get_config.side_effect = lambda key: {
             "kitsu_access_token": "test_token",
-            "kitsu_user_id": "123",
-            "kitsu_pending": [
-                {"title": "Anime1", "episode": 5, "total": 12, "timestamp": 123456}
-            ]
+            "kitsu_user_id": "123"
         }.get(key, None)
+        kitsu_tracker.db.get_tracker_outbox.return_value = [
+            {"title": "Anime1", "episode": 5, "total": 12}
+        ]
+        kitsu_tracker.sync_min_interval = 0
         
         with patch.object(kitsu_tracker, "update_progress", return_value=True):
             synced = kitsu_tracker.sync_pending()
@@ -170,10 +171,9 @@ class TestKitsuPendingSync:
         assert synced == 1
     
     def test_get_pending_count(self, kitsu_tracker):
-        kitsu_tracker.db.get_config.return_value = [
-            {"title": "Anime1", "episode": 5},
-            {"title": "Anime2", "episode": 3}
-        ]
+        kitsu_tracker.db.get_config.return_value = None
+        kitsu_tracker.db.count_tracker_outbox.return_value = 2
         
         count = kitsu_tracker.get_pending_count()
         assert count == 2
+        kitsu_tracker.db.count_tracker_outbox.assert_called_once_with("kitsu")
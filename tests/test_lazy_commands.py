@@ -0,0 +1,44 @@
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from weeb_cli.commands._lazy import lazy_group
+
+
+def _write_module(path, name, body):
+    (path / f"{name}.py").write_text(body)
+
+
+@pytest.fixture
+def modules(temp_dir, monkeypatch):
+    monkeypatch.syspath_prepend(str(temp_dir))
+    _write_module(temp_dir, "lazy_ok", "import typer\napp = typer.Typer()\n@app.command()\ndef hello():\n    print('hi')\n")
+    _write_module(temp_dir, "lazy_extra", "import flask_not_installed_xyz\n")
+    _write_module(temp_dir, "lazy_broken", "import weeb_cli.no_such_module\n")
+    return temp_dir
+
+
+def _app(commands, monkeypatch):
+    monkeypatch.setattr("weeb_cli.commands._lazy.OPTIONAL_DEPENDENCIES", frozenset({"flask_not_installed_xyz"}))
+    app = typer.Typer(cls=lazy_group(commands))
+
+    @app.callback()
+    def main():
+        pass
+
+    return app
+
+
+class TestLazyTyperGroup:
+    def test_command_is_imported_on_use(self, modules, monkeypatch):
+        result = CliRunner().invoke(_app({"ok": "lazy_ok:app"}, monkeypatch), ["ok"])
+        assert result.exit_code == 0 and "hi" in result.output
+
+    def test_missing_optional_extra_hides_command(self, modules, monkeypatch):
+        result = CliRunner().invoke(_app({"extra": "lazy_extra:app"}, monkeypatch), ["extra"])
+        assert result.exit_code != 0 and "No such command" in result.output
+
+    def test_broken_import_is_raised(self, modules, monkeypatch):
+        result = CliRunner().invoke(_app({"broken": "lazy_broken:app"}, monkeypatch), ["broken"])
+        assert isinstance(result.exception, ModuleNotFoundError)
+        assert result.exception.name == "weeb_cli.no_such_module"
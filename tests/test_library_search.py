@@ -0,0 +1,82 @@
+import sqlite3
+
+from weeb_cli.services.database import Database
+
+
+def _index(db, *titles, source="/mnt/a"):
+    for title in titles:
+        db.index_anime(title, source, "A", f"{source}/{title}", 12)
+
+
+class TestIndexedAnimeSearch:
+    def test_substring_match_case_insensitive(self, database):
+        _index(database, "Shingeki no Kyojin", "Kimi no Na wa", "One Piece")
+        titles = [r["title"] for r in database.search_indexed_anime("KYOJ")]
+        assert titles == ["Shingeki no Kyojin"]
+
+    def test_results_are_ranked(self, database):
+        _index(database, "Naruto Shippuden Naruto Movie Naruto", "A Naruto Story", "Bleach")
+        titles = [r["title"] for r in database.search_indexed_anime("naruto")]
+        assert set(titles) == {"Naruto Shippuden Naruto Movie Naruto", "A Naruto Story"}
+        assert titles[0] == "Naruto Shippuden Naruto Movie Naruto"
+
+    def test_short_query_falls_back_to_like(self, database):
+        _index(database, "K-On!", "One Piece")
+        assert [r["title"] for r in database.search_indexed_anime("k-")] == ["K-On!"]
+
+    def test_quotes_in_query(self, database):
+        _index(database, 'The "Quoted" Show')
+        assert len(database.search_indexed_anime('"Quoted"')) == 1
+
+    def test_index_follows_deletes_and_reindex(self, database):
+        _index(database, "Mushishi", "Monster", source="/mnt/a")
+        _index(database, "Mononoke", source="/mnt/b")
+
+        database.remove_indexed_anime("/mnt/a/Monster")
+        database.clear_source_index("/mnt/b")
+        assert database.search_indexed_anime("mon") == []
+
+        database.index_anime("Mushishi Zoku Shou", "/mnt/a", "A", "/mnt/a/Mushishi", 10)
+        assert [r["title"] for r in database.search_indexed_anime("zoku")] == ["Mushishi Zoku Shou"]
+        assert len(database.search_indexed_anime("mushishi")) == 1
+
+    def test_existing_rows_are_indexed_on_migration(self, temp_dir):
+        path = temp_dir / "old.db"
+        conn = sqlite3.connect(path)
+        conn.execute('''
+            CREATE TABLE anime_index (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT, source_path TEXT,
+                source_name TEXT, folder_path TEXT, episode_count INTEGER DEFAULT 0, indexed_at TEXT
+            )
+        ''')
+        conn.execute("INSERT INTO anime_index (title, folder_path) VALUES ('Haikyuu!!', '/x')")
+        conn.commit()
+        conn.close()
+
+        db = Database()
+        db.db_path = path
+        try:
+            assert [r["title"] for r in db.search_indexed_anime("haikyu")] == ["Haikyuu!!"]
+        finally:
+            db.close()
+
+    def test_lookup_columns_are_indexed(self, database):
+        database.get_all_indexed_anime()
+        with database._conn() as conn:
+            for column in ("folder_path", "source_path"):
+                plan = conn.execute(
+                    f"EXPLAIN QUERY PLAN DELETE FROM anime_index WHERE {column} = ?", ("x",)
+                ).fetchall()
+                assert f"idx_anime_{column.split('_')[0]}" in " ".join(row[-1] for row in plan)
+
+
+class TestVirtualLibrarySearch:
+    def test_search_and_remove(self, database):
+        database.add_to_virtual_library("1", "Cowboy Bebop", "hianime")
+        database.add_to_virtual_library("2", "Samurai Champloo", "hianime")
+
+        assert [r["anime_id"] for r in database.search_virtual_library("bebop")] == ["1"]
+
+        database.remove_from_virtual_library("1", "hianime")
+        assert database.search_virtual_library("bebop") == []
+        assert [r["anime_id"] for r in database.search_virtual_library("")] == ["2"]
@@ -0,0 +1,201 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from weeb_cli.services.local_library import IndexReport, LocalLibrary
+
+OLD_NS = 1_600_000_000 * 10**9
+
+
+@pytest.fixture
+def library(database):
+    lib = LocalLibrary()
+    lib._db = database
+    return lib
+
+
+@pytest.fixture
+def source(temp_dir):
+    root = temp_dir / "anime"
+    root.mkdir()
+    return root
+
+
+def _make(root, title, episodes):
+    folder = root / title
+    folder.mkdir(exist_ok=True)
+    for ep in episodes:
+        (folder / f"{title} - S1E{ep}.mp4").write_bytes(b"x" * ep)
+    _age(folder)
+    return folder
+
+
+def _age(folder):
+    os.utime(folder, ns=(OLD_NS, OLD_NS))
+
+
+class TestSmartIndex:
+    def test_first_run_adds_folders(self, library, source):
+        _make(source, "Bebop", [1, 2])
+        _make(source, "Monster", [1])
+        (source / "empty").mkdir()
+
+        report = library.smart_index_source(str(source), "Local")
+
+        assert report == IndexReport(skipped=0, rescanned=0, added=2, removed=0)
+        counts = {a["title"]: a["episode_count"] for a in library.get_indexed_anime()}
+        assert counts == {"Bebop": 2, "Monster": 1}
+
+    def test_unchanged_folders_are_not_listed(self, library, source):
+        _make(source, "Bebop", [1, 2])
+        _make(source, "Monster", [1])
+        library.smart_index_source(str(source), "Local")
+
+        with patch.object(library, "_scan_anime_folder_with_stats", wraps=library._scan_anime_folder_with_stats) as scan:
+            report = library.smart_index_source(str(source), "Local")
+
+        scan.assert_not_called()
+        assert report == IndexReport(skipped=2)
+
+    def test_only_dirty_folders_are_rescanned(self, library, source):
+        bebop = _make(source, "Bebop", [1, 2])
+        _make(source, "Monster", [1])
+        library.smart_index_source(str(source), "Local")
+
+        (bebop / "Bebop - S1E3.mp4").write_bytes(b"x")
+        _make(source, "Mushishi", [1])
+        os.utime(bebop, ns=(OLD_NS + 10**9, OLD_NS + 10**9))
+
+        with patch.object(library, "_scan_anime_folder_with_stats", wraps=library._scan_anime_folder_with_stats) as scan:
+            report = library.smart_index_source(str(source), "Local")
+
+        assert sorted(call.args[0].name for call in scan.call_args_list) == ["Bebop", "Mushishi"]
+        assert report == IndexReport(skipped=1, rescanned=1, added=1)
+        counts = {a["title"]: a["episode_count"] for a in library.get_indexed_anime()}
+        assert counts == {"Bebop": 3, "Monster": 1, "Mushishi": 1}
+
+    def test_recently_modified_folder_is_rescanned(self, library, source):
+        folder = source / "Fresh"
+        folder.mkdir()
+        (folder / "Fresh - S1E1.mp4").write_bytes(b"x")
+
+        library.smart_index_source(str(source), "Local")
+        report = library.smart_index_source(str(source), "Local")
+
+        assert report.skipped == 0 and report.rescanned == 1
+
+    def test_removed_and_emptied_folders(self, library, source):
+        _make(source, "Bebop", [1])
+        monster = _make(source, "Monster", [1])
+        library.smart_index_source(str(source), "Local")
+
+        for f in (source / "Bebop").iterdir():
+            f.unlink()
+        (source / "Bebop").rmdir()
+        (monster / "Monster - S1E1.mp4").unlink()
+        os.utime(monster, ns=(OLD_NS + 10**9, OLD_NS + 10**9))
+
+        report = library.smart_index_source(str(source), "Local")
+
+        assert report == IndexReport(rescanned=1, removed=2)
+        assert library.get_indexed_anime() == []
+        assert library.db.get_folder_signatures(str(source)).keys() == {str(monster)}
+
+    def test_full_index_stores_signatures(self, library, source):
+        _make(source, "Bebop", [1, 2])
+        assert library.index_source(str(source), "Local") == 1
+
+        signature = library.db.get_folder_signatures(str(source))[str(source / "Bebop")]
+        assert signature["entry_count"] == 2 and signature["total_size"] == 3
+        assert library.smart_index_source(str(source), "Local") == IndexReport(skipped=1)
+
+
+class TestFolderEpisodes:
+    def _indexed(self, library, source, title):
+        return next(a for a in library.get_indexed_anime() if a["title"] == title)
+
+    def test_indexer_stores_episode_rows(self, library, source):
+        _make(source, "Bebop", [2, 1])
+        library.smart_index_source(str(source), "Local")
+
+        rows = library.db.get_folder_episodes(str(source / "Bebop"))
+        assert [(r["season"], r["number"], r["size"]) for r in rows] == [(1, 1, 1), (1, 2, 2)]
+        assert rows[0]["path"] == str(source / "Bebop" / "Bebop - S1E1.mp4")
+
+    def test_opening_unchanged_folder_reads_the_index(self, library, source):
+        _make(source, "Bebop", [1, 2])
+        library.smart_index_source(str(source), "Local")
+        anime = self._indexed(library, source, "Bebop")
+
+        with patch.object(library, "_scan_anime_folder_with_stats") as scan:
+            episodes = library.get_folder_episodes(anime)
+
+        scan.assert_not_called()
+        assert [e["number"] for e in episodes] == [1, 2]
+        assert episodes[1]["filename"] == "Bebop - S1E2.mp4"
+
+    def test_changed_folder_is_revalidated(self, library, source):
+        bebop = _make(source, "Bebop", [1])
+        library.smart_index_source(str(source), "Local")
+        anime = self._indexed(library, source, "Bebop")
+
+        (bebop / "Bebop - S2E1.mkv").write_bytes(b"xyz")
+        os.utime(bebop, ns=(OLD_NS + 10**9, OLD_NS + 10**9))
+
+        episodes = library.get_folder_episodes(anime)
+        assert [(e["season"], e["number"]) for e in episodes] == [(1, 1), (2, 1)]
+        assert self._indexed(library, source, "Bebop")["episode_count"] == 2
+        assert library.db.get_folder_signature(str(bebop))["mtime_ns"] == OLD_NS + 10**9
+
+    def test_removing_folder_drops_episode_rows(self, library, source):
+        bebop = _make(source, "Bebop", [1])
+        library.smart_index_source(str(source), "Local")
+
+        (bebop / "Bebop - S1E1.mp4").unlink()
+        bebop.rmdir()
+        library.smart_index_source(str(source), "Local")
+
+        assert library.db.get_folder_episodes(str(bebop)) == []
+
+
+class TestLibraryView:
+    def test_view_joins_progress_and_checks_sources_once(self, library, source, temp_dir):
+        _make(source, "Cowboy Bebop", [1, 2, 3])
+        _make(source, "Monster", [1])
+        library.smart_index_source(str(source), "Local")
+        library.db.save_progress("cowboy-bebop", "Cowboy Bebop", 2, 3, [1, 2])
+
+        with patch.object(library, "is_source_available", return_value=True) as available:
+            view = library.get_library_view()
+
+        available.assert_called_once_with(str(source))
+        by_title = {a["title"]: a for a in view}
+        assert by_title["Cowboy Bebop"]["watched"] == 2
+        assert by_title["Cowboy Bebop"]["last_watched"] == 2
+        assert by_title["Monster"]["watched"] == 0
+        assert all(a["available"] for a in view)
+
+    def test_view_is_memoized_until_index_or_progress_changes(self, library, source):
+        _make(source, "Monster", [1, 2])
+        library.smart_index_source(str(source), "Local")
+        library.get_library_view()
+
+        with patch.object(library.db, "get_library_view", wraps=library.db.get_library_view) as query:
+            library.get_library_view()
+            query.assert_not_called()
+
+            library.db.save_progress("monster", "Monster", 1, 2, [1])
+            assert library.get_library_view()[0]["watched"] == 1
+
+            _make(source, "Bebop", [1])
+            library.smart_index_source(str(source), "Local")
+            assert len(library.get_library_view()) == 2
+
+        assert query.call_count == 2
+
+    def test_rows_indexed_without_slug_are_filled(self, library, source):
+        library.db.index_anime("Kimi no Na wa", str(source), "Local", str(source / "Kimi no Na wa"), 1)
+        library.db.save_progress("kimi-no-na-wa", "Kimi no Na wa", 1, 1, [1])
+
+        assert library.get_library_view()[0]["watched"] == 1
@@ -8,6 +8,7 @@ from weeb_cli.services.tracker import MALTracker
 def mal_tracker():
     tracker = MALTracker()
     tracker._db = MagicMock()
+    tracker._db.get_tracker_id.return_value = None
     return tracker
 
 
@@ -80,7 +81,7 @@ class TestMALTokenManagement:
         
         mock_user = {"id": 123, "name": "TestUser"}
         
-        with patch("requests.post", return_value=mock_resp):
+        with patch("weeb_cli.services.tracker.http_client.post", return_value=mock_resp):
             with patch.object(mal_tracker, "_get_user", return_value=mock_user):
                 result = mal_tracker._exchange_code("auth_code", "code_verifier")
         
@@ -90,7 +91,7 @@ class TestMALTokenManagement:
         mock_resp = MagicMock()
         mock_resp.status_code = 400
         
-        with patch("requests.post", return_value=mock_resp):
+        with patch("weeb_cli.services.tracker.http_client.post", return_value=mock_resp):
             result = mal_tracker._exchange_code("invalid_code", "code_verifier")
         
         assert result is None
@@ -106,7 +107,7 @@ class TestMALTokenManagement:
             "expires_in": 3600
         }
         
-        with patch("requests.post", return_value=mock_resp):
+        with patch("weeb_cli.services.tracker.http_client.post", return_value=mock_resp):
             result = mal_tracker._refresh_access_token()
         
         assert result is True
@@ -118,7 +119,7 @@ class TestMALTokenManagement:
         mock_resp = MagicMock()
         mock_resp.status_code = 401
         
-        with patch("requests.post", return_value=mock_resp):
+        with patch("weeb_cli.services.tracker.http_client.post", return_value=mock_resp):
             result = mal_tracker._refresh_access_token()
         
         assert result is False
@@ -145,7 +146,7 @@ class TestMALUserOperations:
         mock_resp.status_code = 200
         mock_resp.json.return_value = {"id": 123, "name": "TestUser"}
         
-        with patch("requests.get", return_value=mock_resp):
+        with patch("weeb_cli.services.tracker.http_client.get", return_value=mock_resp):
             user = mal_tracker._get_user()
         
         assert user is not None
@@ -177,7 +178,7 @@ class TestMALSearch:
             ]
         }
         
-        with patch("requests.get", return_value=mock_resp):
+        with patch("weeb_cli.services.tracker.http_client.get", return_value=mock_resp):
             result = mal_tracker.search_anime("Angel Beats")
         
         assert result is not None
@@ -194,7 +195,7 @@ class TestMALSearch:
         mock_resp.status_code = 200
         mock_resp.json.return_value = {"data": []}
         
-        with patch("requests.get", return_value=mock_resp):
+        with patch("weeb_cli.services.tracker.http_client.get", return_value=mock_resp):
             result = mal_tracker.search_anime("NonexistentAnime")
         
         assert result is None
@@ -216,9 +217,7 @@ class TestMALProgressUpdate:
         result = mal_tracker.update_progress("Angel Beats", 5, 13)
         
         assert result is False
-        pending_calls = [call for call in mal_tracker.db.set_config.call_args_list 
-                        if "mal_pending" in str(call)]
-        assert len(pending_calls) > 0
+        mal_tracker.db.queue_tracker_update.assert_called_once_with("mal", "Angel Beats", 5, 13)
     
     def test_update_progress_anime_not_found(self, mal_tracker):
         mal_tracker._access_token = "test_token"
@@ -244,7 +243,7 @@ class TestMALProgressUpdate:
         mock_resp.status_code = 200
         
         with patch.object(mal_tracker, "search_anime", return_value=mock_anime):
-            with patch("requests.post", return_value=mock_resp):
+            with patch("weeb_cli.services.tracker.http_client.post", return_value=mock_resp):
                 result = mal_tracker.update_progress("Angel Beats", 5, 13)
         
         assert result is True
@@ -261,7 +260,7 @@ class TestMALProgressUpdate:
         mock_resp.status_code = 200
         
         with patch.object(mal_tracker, "search_anime", return_value=mock_anime):
-            with patch("requests.post", return_value=mock_resp):
+            with patch("weeb_cli.services.tracker.http_client.post", return_value=mock_resp):
                 result = mal_tracker.update_progress("Angel Beats", 13, 13)
         
         assert result is True
@@ -274,25 +273,20 @@ class TestMALPendingSync:
         
         mal_tracker._queue_update("Angel Beats", 5, 13)
         
-        set_calls = mal_tracker.db.set_config.call_args_list
-        pending_call = [call for call in set_calls if "mal_pending" in str(call)][0]
-        pending_data = pending_call[0][1]
-        
-        assert len(pending_data) == 1
-        assert pending_data[0]["title"] == "Angel Beats"
-        assert pending_data[0]["episode"] == 5
-        assert pending_data[0]["total"] == 13
+        mal_tracker.db.queue_tracker_update.assert_called_once_with("mal", "Angel Beats", 5, 13)
+        mal_tracker.db.set_config.assert_not_called()
     
     def test_sync_pending_success(self, mal_tracker):
         mal_tracker._access_token = "test_token"
         mal_tracker.db.get_config.side_effect = lambda key: {
             "mal_access_token": "test_token",
-            "mal_expires_at": str(time.time() + 3600),
-            "mal_pending": [
-                {"title": "Anime1", "episode": 5, "total": 12, "timestamp": 123456},
-                {"title": "Anime2", "episode": 3, "total": 24, "timestamp": 123457}
-            ]
+            "mal_expires_at": str(time.time() + 3600)
         }.get(key, None)
+        mal_tracker.db.get_tracker_outbox.return_value = [
+            {"title": "Anime1", "episode": 5, "total": 12},
+            {"title": "Anime2", "episode": 3, "total": 24}
+        ]
+        mal_tracker.sync_min_interval = 0
         
         with patch.object(mal_tracker, "update_progress", return_value=True):
             synced = mal_tracker.sync_pending()
@@ -307,16 +301,15 @@ class TestMALPendingSync:
         assert synced == 0
     
     def test_get_pending_count(self, mal_tracker):
-        mal_tracker.db.get_config.return_value = [
-            {"title": "Anime1", "episode": 5},
-            {"title": "Anime2", "episode": 3},
-            {"title": "Anime3", "episode": 1}
-        ]
+        mal_tracker.db.get_config.return_value = None
+        mal_tracker.db.count_tracker_outbox.return_value = 3
         
         count = mal_tracker.get_pending_count()
         assert count == 3
+        mal_tracker.db.count_tracker_outbox.assert_called_once_with("mal")
     
     def test_get_pending_count_empty(self, mal_tracker):
-        mal_tracker.db.get_config.return_value = []
+        mal_tracker.db.get_config.return_value = None
+        mal_tracker.db.count_tracker_outbox.return_value = 0
         count = mal_tracker.get_pending_count()
         assert count == 0
@@ -0,0 +1,173 @@
+import json
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from weeb_cli.services.player import Player
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="mpv IPC monitor uses Unix sockets")
+
+
+class FakeMpv:
+    """Unix socket server that records commands and sends scripted events."""
+
+    def __init__(self, path):
+        self.path = path
+        self.commands = []
+        self.conn = None
+        self.connected = threading.Event()
+        self._server = None
+
+    def listen(self):
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.path)
+        self._server.listen(1)
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        self.conn, _ = self._server.accept()
+        self.connected.set()
+        buffer = b""
+        while True:
+            try:
+                chunk = self.conn.recv(4096)
+            except OSError:
+                return
+            if not chunk:
+                return
+            *lines, buffer = (buffer + chunk).split(b"\n")
+            self.commands.extend(json.loads(line)["command"] for line in lines if line)
+
+    def send(self, name, data):
+        event = {"event": "property-change", "id": 1, "name": name, "data": data}
+        self.conn.sendall((json.dumps(event) + "\n").encode())
+
+    def wait_for(self, predicate, timeout=3):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def close(self):
+        if self.conn:
+            self.conn.shutdown(socket.SHUT_RDWR)
+            self.conn.close()
+        if self._server:
+            self._server.close()
+
+
+@pytest.fixture
+def ipc_dir():
+    # AF_UNIX paths are limited to ~100 bytes, so avoid deep pytest temp dirs
+    path = tempfile.mkdtemp(prefix="mpv-")
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def player():
+    with patch("weeb_cli.services.player.dependency_manager.check_dependency", return_value=None):
+        p = Player()
+    p._current_anime_data = {"slug": "bebop", "episode_number": 3, "total_episodes": 26}
+    return p
+
+
+@pytest.fixture
+def saves():
+    from weeb_cli.services.database import db
+    with patch.object(db, "save_playback_position") as save:
+        yield save
+
+
+def _start_monitor(player, path, on_watched=None):
+    thread = threading.Thread(
+        target=player._monitor_mpv, args=(path, "bebop", "Cowboy Bebop", on_watched), daemon=True
+    )
+    thread.start()
+    return thread
+
+
+class TestMpvMonitor:
+    def test_connects_when_socket_appears(self, player, ipc_dir, saves):
+        mpv = FakeMpv(os.path.join(ipc_dir, "s"))
+        thread = _start_monitor(player, mpv.path)
+        time.sleep(0.3)
+        mpv.listen()
+        try:
+            assert mpv.connected.wait(1)
+            assert mpv.wait_for(lambda: len(mpv.commands) == 3)
+            assert [c[2] for c in mpv.commands] == ["time-pos", "duration", "pause"]
+            assert all(c[0] == "observe_property" for c in mpv.commands)
+        finally:
+            player._stop_monitor.set()
+            thread.join(2)
+            mpv.close()
+
+    def test_skips_segment_on_position_event(self, player, ipc_dir, saves):
+        player._skip_times = {"op": (10.0, 20.0)}
+        mpv = FakeMpv(os.path.join(ipc_dir, "s"))
+        mpv.listen()
+        with patch("weeb_cli.services.player.aniskip_service.is_enabled", return_value=True):
+            thread = _start_monitor(player, mpv.path)
+            try:
+                assert mpv.connected.wait(2)
+                mpv.send("duration", 1400.0)
+                mpv.send("time-pos", 9.9)
+                time.sleep(0.1)
+                assert not any(c[0] == "seek" for c in mpv.commands)
+
+                sent = time.monotonic()
+                mpv.send("time-pos", 10.05)
+                assert mpv.wait_for(lambda: ["seek", 20.0, "absolute"] in mpv.commands)
+                assert time.monotonic() - sent < 0.5
+
+                mpv.send("time-pos", 12.0)
+                time.sleep(0.1)
+                assert sum(c[0] == "seek" for c in mpv.commands) == 1
+            finally:
+                player._stop_monitor.set()
+                thread.join(2)
+                mpv.close()
+
+    def test_next_check_delay(self, player):
+        player._skip_times = {"op": (90.0, 180.0), "ed": (1300.0, 1390.0)}
+        assert player._next_check_delay(10.0) == 1.0
+        assert player._next_check_delay(89.5) == pytest.approx(0.25)
+        assert player._next_check_delay(89.9) == 0.0
+        player._skipped_segments = {"op", "ed"}
+        assert player._next_check_delay(89.9) == 1.0
+
+    def test_saves_on_pause_and_exit_only_when_moved(self, player, ipc_dir, saves):
+        on_watched = Mock()
+        mpv = FakeMpv(os.path.join(ipc_dir, "s"))
+        mpv.listen()
+        thread = _start_monitor(player, mpv.path, on_watched)
+        try:
+            assert mpv.connected.wait(2)
+            mpv.send("duration", 100.0)
+            mpv.send("time-pos", 50.0)
+            mpv.send("pause", True)
+            assert mpv.wait_for(lambda: saves.call_count == 1)
+            saves.assert_called_with("bebop", "Cowboy Bebop", 3, 26, current_time=50.0, duration=100.0)
+
+            mpv.send("pause", False)
+            mpv.send("time-pos", 81.0)
+            assert mpv.wait_for(lambda: on_watched.called)
+            assert saves.call_count == 1
+        finally:
+            mpv.close()
+            thread.join(3)
+
+        assert not thread.is_alive()
+        assert saves.call_count == 2
+        assert saves.call_args.kwargs["current_time"] == 81.0
+        on_watched.assert_called_once()
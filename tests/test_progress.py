@@ -0,0 +1,110 @@
+import json
+import sqlite3
+
+import pytest
+
+from weeb_cli.services.database import Database
+from weeb_cli.services.progress import ProgressTracker
+
+
+@pytest.fixture
+def tracker(database):
+    tracker = ProgressTracker()
+    tracker._db = database
+    return tracker
+
+
+def _watched_rows(db, slug):
+    with db._conn() as conn:
+        return [tuple(r) for r in conn.execute(
+            'SELECT season, episode FROM watched_episodes WHERE slug = ? ORDER BY season, episode', (slug,)
+        )]
+
+
+class TestWatchedEpisodes:
+    def test_mark_watched_inserts_rows(self, tracker, database):
+        tracker.mark_watched("bebop", 2, title="Cowboy Bebop", total_episodes=26)
+        tracker.mark_watched("bebop", 1)
+        tracker.mark_watched("bebop", 1)
+        tracker.mark_watched("bebop", 1, season=2)
+
+        assert _watched_rows(database, "bebop") == [(1, 1), (1, 2), (2, 1)]
+        progress = tracker.get_anime_progress("bebop")
+        assert progress["completed"] == [1, 2]
+        assert progress["last_watched"] == 2
+        assert progress["title"] == "Cowboy Bebop"
+        assert progress["total_episodes"] == 26
+
+    def test_mark_watched_without_title_uses_slug(self, tracker):
+        tracker.mark_watched("monster", 1)
+        assert tracker.get_anime_progress("monster")["title"] == "monster"
+
+    def test_playback_position_keeps_watched_episodes(self, tracker, database):
+        tracker.mark_watched("bebop", 1, title="Cowboy Bebop", total_episodes=26)
+        database.save_playback_position("bebop", "Cowboy Bebop", 2, 26, current_time=300, duration=1400)
+
+        progress = database.get_progress("bebop")
+        assert progress["completed"] == [1]
+        assert progress["current_time"] == 300
+
+    def test_save_progress_with_completed_replaces_set(self, database):
+        database.save_progress("bebop", "Cowboy Bebop", 3, 26, [1, 2, 3])
+        database.save_progress("bebop", "Cowboy Bebop", 3, 26, [1, 3])
+        assert database.get_progress("bebop")["completed"] == [1, 3]
+
+    def test_json_arrays_are_migrated(self, temp_dir):
+        path = temp_dir / "old.db"
+        conn = sqlite3.connect(path)
+        conn.execute('''
+            CREATE TABLE progress (
+                slug TEXT PRIMARY KEY, title TEXT, last_watched INTEGER DEFAULT 0,
+                total_episodes INTEGER DEFAULT 0, completed TEXT DEFAULT '[]', last_watched_at TEXT
+            )
+        ''')
+        conn.execute(
+            "INSERT INTO progress VALUES ('bebop', 'Cowboy Bebop', 3, 26, ?, '2024-01-01T00:00:00')",
+            (json.dumps([1, 2, 3]),)
+        )
+        conn.commit()
+        conn.close()
+
+        db = Database()
+        db.db_path = path
+        try:
+            assert db.get_progress("bebop")["completed"] == [1, 2, 3]
+            assert db.get_all_progress()["bebop"]["completed"] == [1, 2, 3]
+            db.close()
+            db._initialized = False
+            assert db.get_progress("bebop")["completed"] == [1, 2, 3]
+        finally:
+            db.close()
+
+
+class TestProgressStats:
+    def test_stats_from_aggregates(self, tracker):
+        assert tracker.get_stats() == {
+            "total_anime": 0, "total_episodes": 0, "total_hours": 0.0, "last_watched": None
+        }
+
+        for ep in range(1, 6):
+            tracker.mark_watched("bebop", ep, title="Cowboy Bebop", total_episodes=26)
+        tracker.mark_watched("monster", 1, title="Monster", total_episodes=74)
+
+        stats = tracker.get_stats()
+        assert stats["total_anime"] == 2
+        assert stats["total_episodes"] == 6
+        assert stats["total_hours"] == 2.4
+        assert stats["last_watched"]["slug"] == "monster"
+
+    def test_completed_and_in_progress(self, tracker):
+        for ep in (1, 2):
+            tracker.mark_watched("short", ep, title="Short", total_episodes=2)
+        tracker.mark_watched("long", 1, title="Long", total_episodes=12)
+        tracker.mark_watched("airing", 3, title="Airing")
+
+        completed = tracker.get_completed_anime()
+        assert [(a["slug"], a["watched"]) for a in completed] == [("short", 2)]
+
+        in_progress = tracker.get_in_progress_anime()
+        assert [a["slug"] for a in in_progress] == ["airing", "long"]
+        assert in_progress[1]["watched"] == 1 and in_progress[1]["total_episodes"] == 12
@@ -0,0 +1,59 @@
+import pytest
+from unittest.mock import Mock
+
+from weeb_cli.services.download.progress_sink import ProgressSink
+
+
+@pytest.fixture
+def sink():
+    sink = ProgressSink(interval=60)
+    sink._db = Mock()
+    return sink
+
+
+class TestProgressSink:
+    def test_report_coalesces_per_episode(self, sink):
+        for pct in range(100):
+            sink.report("ep1", progress=pct, eta=f"{100 - pct}s")
+        sink.report("ep2", progress=5)
+
+        assert sink.flush() == 2
+        sink._db.update_queue_items.assert_called_once_with({
+            "ep1": {"progress": 99, "eta": "1s"},
+            "ep2": {"progress": 5},
+        })
+
+    def test_flush_without_pending_updates_skips_db(self, sink):
+        assert sink.flush() == 0
+        sink._db.update_queue_items.assert_not_called()
+
+    def test_live_state_is_readable_before_flush(self, sink):
+        sink.report("ep1", progress=10, speed="1.0MB/s")
+        sink.report("ep1", progress=20)
+
+        assert sink.get("ep1") == {"progress": 20, "speed": "1.0MB/s"}
+        assert sink.snapshot() == {"ep1": {"progress": 20, "speed": "1.0MB/s"}}
+        sink._db.update_queue_items.assert_not_called()
+
+    def test_finish_merges_pending_and_drops_live_state(self, sink):
+        sink.report("ep1", progress=50, eta="10s")
+        sink.finish("ep1", status="completed", progress=100, eta="-")
+
+        sink._db.update_queue_items.assert_called_once_with({
+            "ep1": {"progress": 100, "eta": "-", "status": "completed"},
+        })
+        assert sink.get("ep1") == {}
+        assert sink.flush() == 0
+
+    def test_overlay_applies_live_fields(self, sink):
+        rows = [
+            {"episode_id": "ep1", "status": "processing", "progress": 0},
+            {"episode_id": "ep2", "status": "pending", "progress": 0},
+        ]
+        sink.report("ep1", progress=75)
+
+        merged = sink.overlay(rows)
+
+        assert merged[0]["progress"] == 75
+        assert merged[1] is rows[1]
+        assert rows[0]["progress"] == 0
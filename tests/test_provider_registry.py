@@ -0,0 +1,113 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from weeb_cli.providers import registry
+
+
+@pytest.fixture
+def fresh_registry(temp_dir):
+    """Registry state with every provider imported once, then reset."""
+    with patch.object(registry, "PROVIDER_CACHE_FILE", temp_dir / "seed.json"):
+        registry._discover_providers()
+    meta = dict(registry._provider_meta)
+    classes = {name: registry._load_provider_class(name) for name in meta}
+
+    def fake_import(module):
+        # Modules are already imported in this process; replay their registration
+        for name, cls in classes.items():
+            if cls.__module__ == module:
+                m = meta[name]
+                registry.register_provider(name, m["lang"], m["region"], m["disabled"])(cls)
+
+    state = {
+        "_providers": {},
+        "_provider_meta": {},
+        "_provider_modules": {},
+        "_initialized": False,
+    }
+    with patch.multiple(registry, PROVIDER_CACHE_FILE=temp_dir / "provider_cache.json", **state), \
+         patch.object(registry.importlib, "import_module", side_effect=fake_import) as imports:
+        yield imports, classes, meta
+
+
+def _reset():
+    registry._providers.clear()
+    registry._provider_meta.clear()
+    registry._provider_modules.clear()
+    registry._initialized = False
+
+
+class TestProviderManifest:
+    def test_scan_writes_manifest_with_metadata(self, fresh_registry):
+        imports, classes, meta = fresh_registry
+        providers = registry.list_providers()
+
+        assert {p["name"] for p in providers} == set(meta)
+        assert imports.call_count >= len({c.__module__ for c in classes.values()})
+
+        manifest = json.loads(registry.PROVIDER_CACHE_FILE.read_text())
+        from weeb_cli import __version__
+        assert manifest["version"] == __version__
+        assert "tr/animecix.py" in manifest["files"]
+        entry = next(p for p in manifest["providers"] if p["name"] == "animecix")
+        assert entry["module"] == "weeb_cli.providers.tr.animecix"
+        assert entry["lang"] == "tr" and entry["class"] == classes["animecix"].__name__
+
+    def test_listing_from_manifest_imports_nothing(self, fresh_registry):
+        imports, _, meta = fresh_registry
+        registry.list_providers()
+        _reset()
+        imports.reset_mock()
+
+        assert {p["name"]: p for p in registry.list_providers()} == meta
+        assert registry.get_providers_for_lang("tr")
+        assert registry.get_default_provider("en") in meta
+        imports.assert_not_called()
+
+    def test_get_provider_imports_only_its_module(self, fresh_registry):
+        imports, classes, _ = fresh_registry
+        registry.list_providers()
+        _reset()
+        imports.reset_mock()
+
+        provider = registry.get_provider("animecix")
+        assert isinstance(provider, classes["animecix"])
+        imports.assert_called_once_with("weeb_cli.providers.tr.animecix")
+
+    def test_unknown_provider(self, fresh_registry):
+        assert registry.get_provider("does-not-exist") is None
+
+    def test_manifest_invalidated_by_file_change(self, fresh_registry):
+        imports, _, _ = fresh_registry
+        registry.list_providers()
+        _reset()
+        imports.reset_mock()
+
+        manifest = json.loads(registry.PROVIDER_CACHE_FILE.read_text())
+        manifest["files"]["tr/animecix.py"] -= 1
+        registry.PROVIDER_CACHE_FILE.write_text(json.dumps(manifest))
+
+        registry.list_providers()
+        assert imports.call_count > 1
+
+    def test_manifest_invalidated_by_version(self, fresh_registry):
+        imports, _, _ = fresh_registry
+        registry.list_providers()
+        _reset()
+        imports.reset_mock()
+
+        manifest = json.loads(registry.PROVIDER_CACHE_FILE.read_text())
+        manifest["version"] = "0.0.1"
+        registry.PROVIDER_CACHE_FILE.write_text(json.dumps(manifest))
+
+        registry.list_providers()
+        assert imports.call_count > 1
+
+    def test_legacy_module_cache_is_rebuilt(self, fresh_registry):
+        imports, _, meta = fresh_registry
+        registry.PROVIDER_CACHE_FILE.write_text(json.dumps({"modules": ["weeb_cli.providers.tr.animecix"]}))
+
+        assert sorted(p["name"] for p in registry.list_providers()) == sorted(meta)
+        assert "providers" in json.loads(registry.PROVIDER_CACHE_FILE.read_text())
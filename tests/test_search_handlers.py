@@ -0,0 +1,46 @@
+from unittest.mock import patch
+
+import pytest
+
+from weeb_cli.commands.search import search_handlers
+from weeb_cli.services.cache import CacheManager
+from weeb_cli.services.scraper import provider_bound_loader
+
+
+@pytest.fixture
+def cache(temp_dir):
+    cache = CacheManager(temp_dir / "cache")
+    with patch.object(search_handlers, "get_cache", return_value=cache), \
+         patch.object(search_handlers.time, "sleep"):
+        yield cache
+
+
+def _printed(console):
+    return " ".join(str(call.args[0]) for call in console.print.call_args_list)
+
+
+class TestFetchSearchResults:
+    def test_empty_result_prints_no_results(self, cache):
+        with patch.object(search_handlers, "search", return_value=[]), \
+             patch.object(search_handlers, "console") as console:
+            assert search_handlers._fetch_search_results("nothing") is None
+
+        assert search_handlers.i18n.t("search.no_results") in _printed(console)
+
+    def test_empty_result_is_not_cached(self, cache):
+        with patch.object(search_handlers, "search", side_effect=[[], [{"id": "1", "title": "Bebop"}]]), \
+             patch.object(search_handlers, "console"):
+            search_handlers._fetch_search_results("bebop")
+            results = search_handlers._fetch_search_results("bebop")
+
+        assert [r["id"] for r in results] == ["1"]
+
+
+class TestProviderBoundLoader:
+    def test_returns_none_after_source_switch(self):
+        sources = {"scraping_source": "animecix"}
+        with patch("weeb_cli.services.scraper.config.get", side_effect=lambda key, default=None: sources.get(key, default)):
+            load = provider_bound_loader("animecix", lambda: ["result"])
+            assert load() == ["result"]
+            sources["scraping_source"] = "hianime"
+            assert load() is None
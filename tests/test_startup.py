@@ -0,0 +1,91 @@
+import threading
+import time
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from rich.console import Console
+
+from weeb_cli.services.startup import StartupPipeline, TIMED_OUT
+
+
+class TestStartupPipeline:
+    def test_runs_tasks_concurrently(self):
+        pipeline = StartupPipeline()
+        start = time.perf_counter()
+        results = pipeline.run_parallel({
+            "a": lambda: time.sleep(0.2) or "a",
+            "b": lambda: time.sleep(0.2) or "b",
+            "c": lambda: time.sleep(0.2) or "c",
+        })
+        assert time.perf_counter() - start < 0.5
+        assert results == {"a": "a", "b": "b", "c": "c"}
+        assert all(t.status == "ok" and t.kind == "parallel" for t in pipeline.timings)
+
+    def test_deadline_reports_timeout(self):
+        release = threading.Event()
+        pipeline = StartupPipeline(deadline=0.1)
+        start = time.perf_counter()
+        results = pipeline.run_parallel({"fast": lambda: 1, "slow": lambda: release.wait(2)})
+        release.set()
+
+        assert time.perf_counter() - start < 1
+        assert results["fast"] == 1
+        assert results["slow"] is TIMED_OUT
+        assert {t.name: t.status for t in pipeline.timings}["slow"] == "timeout"
+
+    def test_exceptions_are_returned(self):
+        pipeline = StartupPipeline()
+
+        def boom():
+            raise ValueError("nope")
+
+        results = pipeline.run_parallel({"boom": boom})
+        assert isinstance(results["boom"], ValueError)
+        assert pipeline.timings[0].status == "error"
+
+    def test_defer_does_not_block(self):
+        release = threading.Event()
+        pipeline = StartupPipeline()
+        start = time.perf_counter()
+        pipeline.defer("bg", lambda: release.wait(2))
+        assert time.perf_counter() - start < 0.1
+        assert pipeline.timings[0].status == "running"
+
+        release.set()
+        pipeline.join_background(timeout=1)
+        assert pipeline.timings[0].status == "ok"
+
+    def test_phase_timing_and_report(self):
+        pipeline = StartupPipeline()
+        with pipeline.phase("setup"):
+            time.sleep(0.01)
+        with pytest.raises(RuntimeError):
+            with pipeline.phase("broken"):
+                raise RuntimeError()
+
+        out = StringIO()
+        pipeline.print_report(Console(file=out, width=120))
+        report = out.getvalue()
+        assert "setup" in report and "broken" in report
+        assert "error" in report
+        assert pipeline.timings[0].duration >= 0.01
+
+
+class TestCheckNetwork:
+    def test_any_reachable_url_is_enough(self):
+        from weeb_cli.main import check_network
+
+        def head(url, **kwargs):
+            if "1.1.1.1" in url:
+                raise OSError("blocked")
+            return object()
+
+        with patch("weeb_cli.services.http_client.http_client.head", side_effect=head):
+            assert check_network() is True
+
+    def test_offline(self):
+        from weeb_cli.main import check_network
+
+        with patch("weeb_cli.services.http_client.http_client.head", side_effect=OSError("down")):
+            assert check_network() is False
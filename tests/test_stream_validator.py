@@ -0,0 +1,107 @@
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+
+from weeb_cli.services.host_scoreboard import HostScoreboard
+from weeb_cli.services.stream_validator import StreamValidator
+
+
+def _links(*specs):
+    return [{"url": f"https://{host}/video.mp4", "server": host} for host in specs]
+
+
+@pytest.fixture
+def validator(temp_dir):
+    scoreboard = HostScoreboard(temp_dir / "host_scores.db")
+    yield StreamValidator(scoreboard=scoreboard)
+    scoreboard.close()
+
+
+def fake_probe(delays, invalid=()):
+    def validate_url(url, headers=None, timeout=5):
+        host = url.split("/")[2]
+        time.sleep(delays.get(host, 0))
+        if host in invalid:
+            return False, "HTTP 404"
+        return True, None
+    return validate_url
+
+
+class TestIterValid:
+    def test_yields_in_rank_order(self, validator):
+        probe = fake_probe({"best": 0.2, "good": 0.0}, invalid={"bad"})
+        with patch.object(StreamValidator, "validate_url", side_effect=probe):
+            result = list(validator.iter_valid(_links("best", "bad", "good")))
+
+        assert [link["server"] for link in result] == ["best", "good"]
+
+    def test_best_valid_link_returned_without_waiting_for_slow_probes(self, validator):
+        probe = fake_probe({"slow": 1.0})
+        with patch.object(StreamValidator, "validate_url", side_effect=probe):
+            start = time.monotonic()
+            candidates = validator.iter_valid(_links("fast", "slow"))
+            first = next(candidates)
+            elapsed = time.monotonic() - start
+            candidates.close()
+
+        assert first["server"] == "fast"
+        assert elapsed < 0.5
+
+    def test_budget_skips_hanging_probes(self, validator):
+        probe = fake_probe({"hang": 1.0})
+        with patch.object(StreamValidator, "validate_url", side_effect=probe):
+            start = time.monotonic()
+            result = list(validator.iter_valid(_links("hang", "ok"), budget=0.2))
+            elapsed = time.monotonic() - start
+
+        assert [link["server"] for link in result] == ["ok"]
+        assert elapsed < 0.8
+
+    def test_concurrency_is_bounded(self, validator):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def validate_url(url, headers=None, timeout=5):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return True, None
+
+        with patch.object(StreamValidator, "validate_url", side_effect=validate_url):
+            result = list(validator.iter_valid(_links(*[f"h{i}" for i in range(8)]), max_workers=3))
+
+        assert len(result) == 8
+        assert peak <= 3
+
+    def test_records_host_latency(self, validator):
+        probe = fake_probe({"cdn.example": 0.05})
+        with patch.object(StreamValidator, "validate_url", side_effect=probe):
+            list(validator.iter_valid(_links("cdn.example")))
+
+        latency = validator.get_host_latency("https://cdn.example/other.mp4")
+        assert latency is not None and latency >= 0.05
+        assert validator.get_host_latency("https://unknown.example/") is None
+
+    def test_records_failures_by_server(self, validator):
+        probe = fake_probe({}, invalid={"dead"})
+        with patch.object(StreamValidator, "validate_url", side_effect=probe):
+            list(validator.iter_valid(_links("dead")))
+
+        stats = validator.scoreboard.get_stats(server="dead")["server"]
+        assert stats.samples == pytest.approx(1)
+        assert stats.successes == 0
+
+    def test_validate_streams_does_not_mutate_stream_headers(self, validator):
+        stream = {"url": "https://a/video.mp4", "headers": {"Referer": "x"}}
+        with patch.object(StreamValidator, "validate_url", return_value=(True, None)) as mock_validate:
+            assert validator.validate_streams([stream], headers={"User-Agent": "ua"}) == [stream]
+
+        assert stream["headers"] == {"Referer": "x"}
+        assert mock_validate.call_args.args[1] == {"Referer": "x", "User-Agent": "ua"}
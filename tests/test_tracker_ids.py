@@ -0,0 +1,95 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from weeb_cli.services.tracker import AniListTracker, KitsuTracker, MALTracker
+
+
+def _response(status, data=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.json.return_value = data
+    return resp
+
+
+class TestAniListIdCache:
+    @pytest.fixture
+    def tracker(self, database):
+        tracker = AniListTracker()
+        tracker._db = database
+        tracker._token = "token"
+        return tracker
+
+    def test_search_runs_once_per_title(self, tracker, database):
+        result = {"SaveMediaListEntry": {"id": 1}}
+        with patch.object(tracker, "search_anime", return_value={"id": 6547}) as search, \
+             patch.object(tracker, "_graphql", return_value=result) as graphql:
+            assert tracker.update_progress("Angel Beats!", 1, 13)
+            assert tracker.update_progress("angel beats", 2, 13)
+
+        search.assert_called_once_with("Angel Beats!")
+        assert graphql.call_args.args[1]["mediaId"] == 6547
+        assert database.get_tracker_id("anilist", "angel beats") == {"media_id": "6547", "entry_id": None}
+
+    def test_failed_update_is_not_cached(self, tracker, database):
+        with patch.object(tracker, "search_anime", return_value={"id": 6547}), \
+             patch.object(tracker, "_graphql", return_value=None):
+            assert tracker.update_progress("Angel Beats", 1, 13) is False
+
+        assert database.get_tracker_id("anilist", "angel beats") is None
+
+
+class TestMALIdCache:
+    def test_cached_id_skips_search(self, database):
+        tracker = MALTracker()
+        tracker._db = database
+        tracker._access_token = "token"
+        database.save_tracker_id("mal", "angel beats", 6547)
+
+        with patch.object(tracker, "search_anime") as search, \
+             patch("weeb_cli.services.tracker.http_client.post", return_value=_response(200)) as post:
+            assert tracker.update_progress("Angel Beats", 5, 13)
+
+        search.assert_not_called()
+        assert post.call_args.kwargs["json"]["anime_id"] == 6547
+
+
+class TestKitsuIdCache:
+    @pytest.fixture
+    def tracker(self, database):
+        tracker = KitsuTracker()
+        tracker._db = database
+        tracker._access_token = "token"
+        tracker._user_id = "123"
+        return tracker
+
+    def test_entry_id_from_create_is_reused(self, tracker, database):
+        with patch.object(tracker, "search_anime", return_value={"id": "1"}) as search, \
+             patch.object(tracker, "_get_library_entry", return_value=None) as lookup, \
+             patch("weeb_cli.services.tracker.http_client.post",
+                   return_value=_response(201, {"data": {"id": "99"}})), \
+             patch("weeb_cli.services.tracker.http_client.patch", return_value=_response(200)) as patch_entry:
+            assert tracker.update_progress("Cowboy Bebop", 1, 26)
+            assert tracker.update_progress("Cowboy Bebop", 2, 26)
+
+        search.assert_called_once()
+        lookup.assert_called_once_with("1")
+        assert patch_entry.call_args.args[0].endswith("/library-entries/99")
+        assert database.get_tracker_id("kitsu", "cowboy bebop") == {"media_id": "1", "entry_id": "99"}
+
+    def test_stale_entry_is_looked_up_again(self, tracker, database):
+        database.save_tracker_id("kitsu", "cowboy bebop", "1", "99")
+
+        with patch.object(tracker, "_get_library_entry", return_value={"id": "100"}) as lookup, \
+             patch("weeb_cli.services.tracker.http_client.patch",
+                   side_effect=[_response(404), _response(200)]) as patch_entry:
+            assert tracker.update_progress("Cowboy Bebop", 3, 26)
+
+        lookup.assert_called_once_with("1")
+        assert patch_entry.call_args.args[0].endswith("/library-entries/100")
+        assert database.get_tracker_id("kitsu", "cowboy bebop")["entry_id"] == "100"
+
+    def test_logout_forgets_entries_only(self, tracker, database):
+        database.save_tracker_id("kitsu", "cowboy bebop", "1", "99")
+        tracker.logout()
+        assert database.get_tracker_id("kitsu", "cowboy bebop") == {"media_id": "1", "entry_id": None}
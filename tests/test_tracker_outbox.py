@@ -0,0 +1,163 @@
+import threading
+import time
+
+from weeb_cli.services._tracker_base import BaseTracker
+
+
+class FakeTracker(BaseTracker):
+    sync_min_interval = 0
+
+    def __init__(self, db, results=None, delay=0.0):
+        super().__init__("fake")
+        self._db = db
+        self.authenticated = True
+        self.results = results or {}
+        self.delay = delay
+        self.calls = []
+        self.starts = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def is_authenticated(self):
+        return self.authenticated
+
+    def update_progress(self, anime_title, episode, total_episodes=None):
+        if not self.authenticated:
+            self._queue_update(anime_title, episode, total_episodes)
+            return False
+        with self._lock:
+            self.calls.append((anime_title, episode, total_episodes))
+            self.starts.append(time.monotonic())
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        result = self.results.get(anime_title, True)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class TestOutboxQueue:
+    def test_updates_coalesce_per_title(self, database):
+        database.queue_tracker_update("fake", "Bebop", 3, None, queued_at=1)
+        database.queue_tracker_update("fake", "Bebop", 5, 26, queued_at=2)
+        database.queue_tracker_update("fake", "Bebop", 4, None, queued_at=3)
+        database.queue_tracker_update("other", "Bebop", 1, None)
+
+        rows = database.get_tracker_outbox("fake")
+        assert [(r["title"], r["episode"], r["total"]) for r in rows] == [("Bebop", 5, 26)]
+        assert database.count_tracker_outbox("other") == 1
+
+    def test_complete_keeps_newer_episode(self, database):
+        database.queue_tracker_update("fake", "Bebop", 5)
+        database.queue_tracker_update("fake", "Bebop", 6)
+
+        assert database.complete_tracker_update("fake", "Bebop", 5) is False
+        assert database.get_tracker_outbox("fake")[0]["episode"] == 6
+        assert database.complete_tracker_update("fake", "Bebop", 6) is True
+        assert database.count_tracker_outbox("fake") == 0
+
+    def test_unauthenticated_update_is_queued(self, database):
+        tracker = FakeTracker(database)
+        tracker.authenticated = False
+        tracker.update_progress("Bebop", 1, 26)
+        tracker.update_progress("Bebop", 2, 26)
+
+        assert tracker.get_pending_count() == 1
+        assert database.get_tracker_outbox("fake")[0]["episode"] == 2
+
+
+class TestOutboxSync:
+    def test_sync_drains_in_queue_order(self, database):
+        for i, title in enumerate(["C", "A", "B"]):
+            database.queue_tracker_update("fake", title, i + 1, queued_at=i)
+        tracker = FakeTracker(database)
+        tracker.sync_concurrency = 1
+
+        assert tracker.sync_pending() == 3
+        assert [c[0] for c in tracker.calls] == ["C", "A", "B"]
+        assert tracker.get_pending_count() == 0
+
+    def test_failed_items_stay_queued(self, database):
+        database.queue_tracker_update("fake", "Bebop", 5)
+        database.queue_tracker_update("fake", "Monster", 2)
+        database.queue_tracker_update("fake", "Mushishi", 1)
+        tracker = FakeTracker(database, results={"Monster": False, "Mushishi": RuntimeError("boom")})
+
+        assert tracker.sync_pending() == 1
+        rows = {r["title"]: r for r in database.get_tracker_outbox("fake")}
+        assert set(rows) == {"Monster", "Mushishi"}
+        assert rows["Monster"]["attempts"] == 1
+
+        tracker.results = {}
+        assert tracker.sync_pending() == 2
+        assert tracker.get_pending_count() == 0
+
+    def test_concurrency_is_bounded(self, database):
+        for i in range(6):
+            database.queue_tracker_update("fake", f"Anime{i}", 1, queued_at=i)
+        tracker = FakeTracker(database, delay=0.05)
+        tracker.sync_concurrency = 2
+
+        assert tracker.sync_pending() == 6
+        assert tracker.max_active == 2
+
+    def test_requests_respect_min_interval(self, database):
+        for i in range(3):
+            database.queue_tracker_update("fake", f"Anime{i}", 1, queued_at=i)
+        tracker = FakeTracker(database)
+        tracker.sync_concurrency = 3
+        tracker.sync_min_interval = 0.1
+
+        tracker.sync_pending()
+
+        starts = sorted(tracker.starts)
+        assert all(b - a >= 0.09 for a, b in zip(starts, starts[1:]))
+        assert [c[0] for c in tracker.calls] == ["Anime0", "Anime1", "Anime2"]
+
+    def test_push_during_running_sync_is_sent(self, database):
+        database.queue_tracker_update("fake", "Bebop", 5)
+        tracker = FakeTracker(database, delay=0.2)
+        runner = threading.Thread(target=tracker.sync_pending)
+        runner.start()
+        while not tracker.calls:
+            time.sleep(0.01)
+
+        tracker.push_progress("Monster", 2, 74)
+        runner.join(2)
+
+        assert ("Monster", 2, 74) in tracker.calls
+        assert tracker.get_pending_count() == 0
+
+    def test_failed_items_are_tried_once_per_sync(self, database):
+        database.queue_tracker_update("fake", "Monster", 2)
+        tracker = FakeTracker(database, results={"Monster": False})
+
+        assert tracker.sync_pending() == 0
+        assert tracker.calls == [("Monster", 2, None)]
+
+    def test_not_authenticated_does_not_sync(self, database):
+        database.queue_tracker_update("fake", "Bebop", 5)
+        tracker = FakeTracker(database)
+        tracker.authenticated = False
+
+        assert tracker.sync_pending() == 0
+        assert tracker.get_pending_count() == 1
+
+
+class TestLegacyPending:
+    def test_config_list_is_moved_to_outbox(self, database):
+        database.set_config("fake_pending", [
+            {"title": "Bebop", "episode": 3, "total": 26, "timestamp": 1},
+            {"title": "Bebop", "episode": 4, "total": 26, "timestamp": 2},
+            {"title": "Monster", "episode": 1, "total": None, "timestamp": 3},
+        ])
+        tracker = FakeTracker(database)
+
+        assert tracker.get_pending_count() == 2
+        assert database.get_config("fake_pending") == []
+        assert tracker.sync_pending() == 2
+        assert sorted(tracker.calls) == [("Bebop", 4, 26), ("Monster", 1, None)]
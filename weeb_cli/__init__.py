@@ -33,8 +33,16 @@ Attributes:
 
 __version__ = "3.0.0"
 
-# SDK exports for easy import
-from weeb_cli.sdk import WeebSDK, list_providers, get_provider_info
+# SDK exports for easy import, loaded on first access so the CLI does not
+# import the SDK (and every provider dependency) just to start up.
+_SDK_EXPORTS = ("WeebSDK", "list_providers", "get_provider_info")
+
+
+def __getattr__(name):
+    if name in _SDK_EXPORTS:
+        from weeb_cli import sdk
+        return getattr(sdk, name)
+    raise AttributeError(f"module 'weeb_cli' has no attribute {name!r}")
 
 __all__ = [
     "__version__",
@@ -0,0 +1,74 @@
+"""Lazily loaded Typer subcommands.
+
+Subcommand apps are registered by import path and only imported when the
+command is resolved, so ``weeb-cli api ...`` never pays for the TUI stack
+and ``weeb-cli --help`` only imports the small command modules it lists.
+
+Example:
+    Registering lazy subcommands::
+
+        app = typer.Typer(cls=lazy_group({
+            "api": "weeb_cli.commands.api:api_app",
+            "serve": "weeb_cli.commands.serve:serve_app",
+        }))
+"""
+
+import importlib
+from typing import Any, Dict, Optional, Type
+
+import typer
+from typer.core import TyperGroup
+
+# Top-level packages of the optional extras in pyproject.toml
+OPTIONAL_DEPENDENCIES = frozenset({"flask", "flask_cors", "yaml"})
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that imports registered subcommands on first use.
+
+    Attributes:
+        lazy_commands: Mapping of command name to ``"module:attribute"``
+            of a ``typer.Typer`` app or click command.
+    """
+
+    lazy_commands: Dict[str, str] = {}
+
+    def list_commands(self, ctx: typer.Context):
+        commands = list(super().list_commands(ctx))
+        return commands + [name for name in self.lazy_commands if name not in commands]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> Optional[Any]:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            command = self._load(cmd_name)
+            if command is not None:
+                self.commands[cmd_name] = command
+        return command
+
+    def _load(self, cmd_name: str) -> Optional[Any]:
+        module_name, _, attr = self.lazy_commands[cmd_name].partition(":")
+        try:
+            target = getattr(importlib.import_module(module_name), attr)
+        except ModuleNotFoundError as e:
+            # Only a missing optional extra hides the command; anything else is a bug
+            if (e.name or "").partition(".")[0] not in OPTIONAL_DEPENDENCIES:
+                raise
+            from weeb_cli.services.logger import debug
+            debug(f"[CLI] Command '{cmd_name}' unavailable: {e}")
+            return None
+
+        command = typer.main.get_command(target) if isinstance(target, typer.Typer) else target
+        command.name = cmd_name
+        return command
+
+
+def lazy_group(commands: Dict[str, str]) -> Type[LazyTyperGroup]:
+    """Create a group class with the given lazy subcommands.
+
+    Args:
+        commands: Mapping of command name to ``"module:attribute"``.
+
+    Returns:
+        A ``LazyTyperGroup`` subclass to pass as ``typer.Typer(cls=...)``.
+    """
+    return type("LazyTyperGroup", (LazyTyperGroup,), {"lazy_commands": dict(commands)})
@@ -1,5 +1,4 @@
 import questionary
-from pathlib import Path
 from rich.console import Console
 from rich.live import Live
 from rich.table import Table
@@ -124,16 +123,12 @@ def search_all_sources():
         console.clear()
         show_header(i18n.t("downloads.search_all"))
         
-        all_indexed = local_library.get_indexed_anime()
-        
         anime_map = {}
-        for anime in all_indexed:
-            progress = local_library.get_anime_progress(anime["title"])
-            watched = len(progress.get("completed", []))
+        for anime in local_library.get_library_view():
+            watched = anime["watched"]
             total = anime["episode_count"]
-            available = local_library.is_source_available(anime["source_path"])
             
-            status_icon = "●" if available else "○"
+            status_icon = "●" if anime["available"] else "○"
             
             if watched >= total and total > 0:
                 watch_status = " [✓]"
@@ -175,7 +170,7 @@ def search_all_sources():
                     "title": anime_info["title"],
                     "path": anime_info["folder_path"],
                     "episode_count": anime_info["episode_count"],
-                    "episodes": local_library._scan_anime_folder(Path(anime_info["folder_path"]))
+                    "episodes": local_library.get_folder_episodes(anime_info)
                 }
                 show_anime_episodes(anime_data)
             
@@ -187,7 +182,7 @@ def show_offline_library(source):
         console.clear()
         show_header(f"{source['name']} ({i18n.t('downloads.offline')})")
         
-        indexed = [a for a in local_library.get_indexed_anime() if a["source_path"] == source["path"]]
+        indexed = [a for a in local_library.get_library_view() if a["source_path"] == source["path"]]
         
         if not indexed:
             console.print(f"[dim]{i18n.t('downloads.no_indexed')}[/dim]")
@@ -197,8 +192,7 @@ def show_offline_library(source):
         ep_short = i18n.t("downloads.episode_short")
         anime_map = {}
         for anime in indexed:
-            progress = local_library.get_anime_progress(anime["title"])
-            watched = len(progress.get("completed", []))
+            watched = anime["watched"]
             total = anime["episode_count"]
             
             if watched >= total and total > 0:
@@ -249,7 +243,7 @@ def show_offline_library(source):
                             "title": anime_info["title"],
                             "path": anime_info["folder_path"],
                             "episode_count": anime_info["episode_count"],
-                            "episodes": local_library._scan_anime_folder(Path(anime_info["folder_path"]))
+                            "episodes": local_library.get_folder_episodes(anime_info)
                         }
                         show_anime_episodes(anime_data)
             elif selected in anime_map:
@@ -263,7 +257,7 @@ def show_offline_library(source):
                         "title": anime_info["title"],
                         "path": anime_info["folder_path"],
                         "episode_count": anime_info["episode_count"],
-                        "episodes": local_library._scan_anime_folder(Path(anime_info["folder_path"]))
+                        "episodes": local_library.get_folder_episodes(anime_info)
                     }
                     show_anime_episodes(anime_data)
             
@@ -484,9 +478,10 @@ def show_queue_live():
         table.add_column("Hız", width=10)
         table.add_column("ETA", width=8)
         
-        active = [i for i in queue_manager.queue if i["status"] == "processing"]
-        pending = [i for i in queue_manager.queue if i["status"] == "pending"]
-        finished = [i for i in queue_manager.queue if i["status"] in ["completed", "failed"]]
+        queue = queue_manager.queue
+        active = [i for i in queue if i["status"] == "processing"]
+        pending = [i for i in queue if i["status"] == "pending"]
+        finished = [i for i in queue if i["status"] in ["completed", "failed"]]
         finished = finished[-10:]
         
         display_list = active + pending + finished
@@ -4,6 +4,7 @@ from rich.console import Console
 from weeb_cli.i18n import i18n
 from weeb_cli.ui.header import show_header
 from weeb_cli.services.search import search
+from weeb_cli.services.scraper import provider_bound_loader
 from weeb_cli.services.progress import progress_tracker
 from weeb_cli.services.cache import get_cache
 from .episode_utils import normalize_search_results
@@ -70,14 +71,13 @@ def _fetch_search_results(query):
     from weeb_cli.config import config
     cache = get_cache()
     provider = config.get("scraping_source", "None")
-    cache_key = f"search:{provider}:{query}"
-    data = cache.get(cache_key, max_age=1800)
     
-    if data is None:
-        with console.status(i18n.t("search.searching"), spinner="dots"):
-            data = search(query)
-            if data:
-                cache.set(cache_key, data)
+    load = provider_bound_loader(provider, lambda: search(query))
+    
+    with console.status(i18n.t("search.searching"), spinner="dots"):
+        data = cache.get_or_load(
+            f"search:{provider}:{query}", load, max_age=1800, stale_ttl=3600, cache_if=bool
+        )
     
     if data is None:
         return None
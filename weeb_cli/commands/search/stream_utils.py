@@ -1,3 +1,5 @@
+from weeb_cli.services.host_scoreboard import host_scoreboard
+
 PLAYER_PRIORITY = [
     "ALUCARD", "AMATERASU", "SIBNET", "MP4UPLOAD", "UQLOAD",
     "MAIL", "DAILYMOTION", "SENDVID", "ODNOKLASSNIKI", "VK",
@@ -12,7 +14,9 @@ def get_player_priority(server_name: str) -> int:
     return 999
 
 def sort_streams(streams: list) -> list:
-    return sorted(streams, key=lambda s: get_player_priority(s.get("server", "")))
+    return host_scoreboard.rank(
+        streams, tiebreak_key=lambda s: get_player_priority(s.get("server") or "")
+    )
 
 def extract_streams_from_response(stream_resp):
     if not stream_resp or not isinstance(stream_resp, dict):
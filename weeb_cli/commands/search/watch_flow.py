@@ -171,14 +171,7 @@ def _fetch_and_validate_streams(slug, ep_id):
         valid_streams = streams_list
     else:
         console.print(f"[dim]{i18n.t('details.validating_streams')}...[/dim]")
-        
-        def check_stream(stream):
-            is_valid, _ = stream_validator.validate_url(stream.get("url"), timeout=3)
-            return stream if is_valid else None
-            
-        with ThreadPoolExecutor(max_workers=len(streams_list) if streams_list else 1) as executor:
-            results = executor.map(check_stream, streams_list)
-            valid_streams = [s for s in results if s is not None]
+        valid_streams = stream_validator.validate_streams(streams_list)
 
     if not valid_streams:
         console.print(f"[red]{i18n.t('details.no_valid_streams')}[/red]")
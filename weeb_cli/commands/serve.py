@@ -18,6 +18,8 @@ from xml.etree.ElementTree import Element, SubElement, tostring
 
 import typer
 
+from weeb_cli.commands._lazy import lazy_group
+
 log = logging.getLogger("weeb-cli")
 
 
@@ -30,11 +32,13 @@ def _sanitize_for_release(name: str) -> str:
     name = name.strip('. ')
     return name or 'download'
 
+# restful is loaded on use; it is skipped when its imports are unavailable
 serve_app = typer.Typer(
     name="serve",
     help="Start server modes: Torznab for Sonarr/*arr integration or RESTful API server.",
     add_completion=False,
     invoke_without_command=True,
+    cls=lazy_group({"restful": "weeb_cli.commands.serve_restful:restful_app"}),
 )
 
 @serve_app.callback()
@@ -49,12 +53,6 @@ def serve_callback(ctx: typer.Context):
         typer.echo(ctx.get_help())
         raise typer.Exit(0)
 
-# Import restful subcommand
-try:
-    from weeb_cli.commands.serve_restful import restful_app
-    serve_app.add_typer(restful_app, name="restful")
-except ImportError:
-    pass  # Flask not installed, restful mode unavailable
 
 
 # -- Helpers ------------------------------------------------------------------
@@ -183,9 +181,10 @@ def _build_torznab_rss(items: list) -> str:
 
 def _try_streams(streams, sonarr_title, season, episode_num, completed_dir) -> bool:
     from weeb_cli.services.headless_downloader import download_episode
+    from weeb_cli.services.host_scoreboard import host_scoreboard
     if not streams:
         return False
-    streams_sorted = sorted(streams, key=lambda s: _quality_score(s.quality), reverse=True)
+    streams_sorted = host_scoreboard.rank(streams, quality_key=lambda s: _quality_score(s.quality))
     for stream in streams_sorted:
         log.info(f"  Trying stream: {stream.quality} @ {stream.server}")
         result = download_episode(
@@ -194,6 +193,7 @@ def _try_streams(streams, sonarr_title, season, episode_num, completed_dir) -> b
             season=season,
             episode=episode_num,
             download_dir=completed_dir,
+            server=stream.server,
         )
         if result:
             return True
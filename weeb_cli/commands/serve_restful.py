@@ -374,6 +374,17 @@ def serve_restful(
             log.error(f"Download error: {e}")
             return jsonify({"status": "error", "message": str(e)}), 500
 
+    # GET /api/downloads - Live download progress
+    @flask_app.route("/api/downloads", methods=["GET"])
+    def api_downloads():
+        """Get live progress of downloads running in this process.
+        
+        Reads the in-memory progress sink, so no database access is needed.
+        """
+        from weeb_cli.services.download.progress_sink import progress_sink
+
+        return jsonify(progress_sink.snapshot())
+
     # Error handlers
     @flask_app.errorhandler(404)
     def not_found(e):
@@ -400,6 +411,7 @@ def serve_restful(
     log.info("    GET  /api/streams?anime_id=...&season=...&episode=...&provider=...")
     log.info("    GET  /api/details?anime_id=...&provider=...")
     log.info("    POST /api/download (JSON body)")
+    log.info("    GET  /api/downloads")
     log.info("=" * 60)
 
     flask_app.run(host=host, port=port, debug=debug)
@@ -24,7 +24,8 @@ def cache_settings_menu():
         
         console.print(f"[dim]{i18n.t('settings.cache_memory_entries')}: {stats['memory_entries']}[/dim]")
         console.print(f"[dim]{i18n.t('settings.cache_file_entries')}: {stats['file_entries']}[/dim]")
-        console.print(f"[dim]{i18n.t('settings.cache_total_size')}: {stats['total_size_mb']} MB[/dim]\n")
+        console.print(f"[dim]{i18n.t('settings.cache_total_size')}: {stats['total_size_mb']} MB[/dim]")
+        console.print(f"[dim]{i18n.t('settings.cache_hit_rate')}: {stats['hit_rate'] * 100:.1f}%[/dim]\n")
         
         choices = [
             i18n.t("settings.cache_clear_all"),
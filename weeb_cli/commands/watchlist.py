@@ -67,7 +67,7 @@ def show_completed_list():
     table.add_column(i18n.t("watchlist.episodes_watched"), width=15, justify="center")
     
     for i, anime in enumerate(completed, 1):
-        watched = len(anime.get("completed", []))
+        watched = anime["watched"]
         total = anime.get("total_episodes", watched)
         table.add_row(
             str(i),
@@ -104,7 +104,7 @@ def show_in_progress_list():
     
     choices = []
     for anime in in_progress:
-        watched = len(anime.get("completed", []))
+        watched = anime["watched"]
         total = anime.get("total_episodes", 0)
         total_str = str(total) if total > 0 else "?"
         title = anime.get("title", anime["slug"])
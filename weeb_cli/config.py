@@ -29,15 +29,19 @@ Attributes:
     config (Config): Global configuration instance.
 """
 
+import copy
 import os
+import threading
+import time
 from pathlib import Path
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Dict, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from weeb_cli.services.database import Database
 
 APP_NAME = "weeb-cli"
 CONFIG_DIR = Path.home() / f".{APP_NAME}"
+CONFIG_RECHECK_INTERVAL = 1.0
 
 
 def get_default_download_dir() -> str:
@@ -70,6 +74,12 @@ DEFAULT_CONFIG = {
     "discord_rpc_enabled": True,
     "shortcuts_enabled": False,
     "aniskip_enabled": False,
+    "download_progress_interval": 1.0,
+    "http_pool_hosts": 20,
+    "http_pool_size": 10,
+    "http_timeout": 15,
+    "hls_segment_workers": 8,
+    "http_download_connections": 8,
 }
 
 
@@ -80,6 +90,12 @@ class Config:
     automatic persistence to SQLite database. Supports headless mode for
     API usage without database access.
     
+    Reads are served from an in-memory snapshot of the config table. The
+    snapshot is reloaded after any write made through this process, and at
+    most once every ``CONFIG_RECHECK_INTERVAL`` seconds a single-row version
+    check picks up changes made by other processes (for example the TUI
+    changing settings while ``serve`` runs).
+    
     Attributes:
         _db (Optional[Database]): Lazy-loaded database instance.
         _headless (bool): Whether running in headless mode (no database).
@@ -90,6 +106,11 @@ class Config:
         self._db: Optional['Database'] = None
         self._headless: bool = False
         self._headless_store: dict = {}
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_version: Optional[int] = None
+        self._cache_writes: int = -1
+        self._checked_at: float = 0.0
+        self._cache_lock = threading.Lock()
 
     @property
     def db(self) -> 'Database':
@@ -103,12 +124,37 @@ class Config:
             self._db = db
         return self._db
 
+    def _snapshot(self) -> Dict[str, Any]:
+        """Get the cached config values, reloading them if they changed."""
+        db = self.db
+        now = time.monotonic()
+        cache = self._cache
+        if cache is not None and self._cache_writes == db.config_writes:
+            if now - self._checked_at < CONFIG_RECHECK_INTERVAL:
+                return cache
+            self._checked_at = now
+            if db.get_config_version() == self._cache_version:
+                return cache
+        
+        with self._cache_lock:
+            writes = db.config_writes
+            version, values = db.get_config_snapshot()
+            self._cache = values
+            self._cache_version = version
+            self._cache_writes = writes
+            self._checked_at = now
+        return values
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot so the next read goes to the database."""
+        self._cache = None
+
     def get(self, key: str, default: Optional[Any] = None) -> Any:
         """Get configuration value by key.
         
-        Attempts to retrieve value from database first, then falls back to
-        provided default or DEFAULT_CONFIG. Special handling for download_dir
-        to generate localized default path.
+        Attempts to retrieve value from the cached database snapshot first,
+        then falls back to provided default or DEFAULT_CONFIG. Special
+        handling for download_dir to generate localized default path.
         
         Args:
             key: Configuration key name.
@@ -128,7 +174,9 @@ class Config:
                 return self._headless_store[key]
         else:
             try:
-                val = self.db.get_config(key)
+                val = self._snapshot().get(key)
+                if isinstance(val, (list, dict)):
+                    return copy.deepcopy(val)
                 if val is not None:
                     return val
             except Exception:
@@ -25,6 +25,12 @@ class ConfigKey(str, Enum):
     DISCORD_RPC_ENABLED = "discord_rpc_enabled"
     SHORTCUTS_ENABLED = "shortcuts_enabled"
     ANISKIP_ENABLED = "aniskip_enabled"
+    DOWNLOAD_PROGRESS_INTERVAL = "download_progress_interval"
+    HTTP_POOL_HOSTS = "http_pool_hosts"
+    HTTP_POOL_SIZE = "http_pool_size"
+    HTTP_TIMEOUT = "http_timeout"
+    HLS_SEGMENT_WORKERS = "hls_segment_workers"
+    HTTP_DOWNLOAD_CONNECTIONS = "http_download_connections"
 
 
 class DownloadStatus(str, Enum):
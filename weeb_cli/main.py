@@ -1,41 +1,46 @@
 import typer
-import questionary
 import sys
 from rich.console import Console
-from weeb_cli.ui.menu import show_main_menu
 from weeb_cli.config import config
 from weeb_cli.i18n import i18n
-from weeb_cli.commands.setup import start_setup_wizard
-from weeb_cli.services.dependency_manager import dependency_manager
-from weeb_cli.services.updater import update_prompt
-from weeb_cli.ui.prompt import prompt
-from weeb_cli.commands.api import api_app
-from weeb_cli.commands.serve import serve_app
-
-app = typer.Typer(add_completion=False)
-app.add_typer(api_app, name="api")
-app.add_typer(serve_app, name="serve")
+from weeb_cli.commands._lazy import lazy_group
+
+# Subcommands are imported on use so `weeb-cli api ...` skips the TUI stack.
+# Interactive-only modules are imported inside the functions that need them.
+app = typer.Typer(
+    add_completion=False,
+    cls=lazy_group({
+        "api": "weeb_cli.commands.api:api_app",
+        "serve": "weeb_cli.commands.serve:serve_app",
+    }),
+)
 console = Console()
 
+NETWORK_CHECK_URLS = ["https://1.1.1.1", "https://google.com", "https://api.github.com"]
+
 def check_network():
-    import requests
-    urls = ["https://1.1.1.1", "https://google.com", "https://api.github.com"]
-    connected = False
-    
-    with console.status(f"[dim]{i18n.t('common.ctrl_c_hint')}[/dim]", spinner="dots"):
-        for url in urls:
-            try:
-                requests.get(url, timeout=3)
-                connected = True
-                break
-            except Exception:
-                continue
-                
-        if not connected:
-            console.print(f"[red]{i18n.t('errors.network', 'Network connection error. Please check your internet connection.')}[/red]")
-            sys.exit(1)
+    """Probe all check URLs at once; True as soon as any of them answers."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from weeb_cli.services.http_client import http_client
+
+    def _probe(url):
+        http_client.head(url, timeout=3)
+        return True
+
+    executor = ThreadPoolExecutor(max_workers=len(NETWORK_CHECK_URLS), thread_name_prefix="netcheck")
+    try:
+        futures = [executor.submit(_probe, url) for url in NETWORK_CHECK_URLS]
+        for future in as_completed(futures):
+            if future.exception() is None:
+                return True
+        return False
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 def run_setup():
+    from weeb_cli.commands.setup import start_setup_wizard
+    from weeb_cli.ui.prompt import prompt
+
     langs = {
         "Türkçe": "tr",
         "English": "en",
@@ -55,50 +60,99 @@ def run_setup():
     console.print(f"[dim]{i18n.t('common.ctrl_c_hint')}[/dim]")
     start_setup_wizard()
 
-def check_ffmpeg_silent():
-    if not dependency_manager.check_dependency("ffmpeg"):
+def check_ffmpeg_silent(ffmpeg_path=None):
+    from weeb_cli.services.dependency_manager import dependency_manager
+
+    if not (ffmpeg_path or dependency_manager.check_dependency("ffmpeg")):
          console.print(f"[cyan]{i18n.t('setup.downloading', tool='FFmpeg')}...[/cyan]")
          dependency_manager.install_dependency("ffmpeg")
 
+def _create_shortcuts_background():
+    try:
+        from weeb_cli.utils.shortcuts import create_shortcuts
+        create_shortcuts()
+    except Exception:
+        pass  # Silently fail, shortcuts are optional
+
+def _init_aniskip():
+    from weeb_cli.services.aniskip import aniskip_service
+    aniskip_service.set_enabled(config.get("aniskip_enabled", False))
+
+def _count_incomplete_downloads():
+    from weeb_cli.services.downloader import queue_manager
+    return queue_manager.get_incomplete_count()
+
+def _find_ffmpeg():
+    from weeb_cli.services.dependency_manager import dependency_manager
+    return dependency_manager.check_dependency("ffmpeg")
+
+def _result(results, name):
+    """Get a parallel task result, or None if it failed or timed out."""
+    from weeb_cli.services.startup import TIMED_OUT
+
+    value = results.get(name)
+    if value is TIMED_OUT or isinstance(value, Exception):
+        return None
+    return value
+
 @app.command()
-def start():
-    if not config.get("language"):
-        run_setup()
+def start(
+    startup_profile: bool = typer.Option(False, "--startup-profile", help="Print per-phase startup timings.")
+):
+    from weeb_cli.services.startup import StartupPipeline, TIMED_OUT
+    from weeb_cli.services.updater import refresh_update_info, update_prompt
+    from weeb_cli.ui.menu import show_main_menu
 
-    # Create desktop shortcuts in background (non-blocking)
-    import threading
-    def _create_shortcuts_background():
-        try:
-            from weeb_cli.utils.shortcuts import create_shortcuts
-            create_shortcuts()
-        except Exception:
-            pass  # Silently fail, shortcuts are optional
-    
-    threading.Thread(target=_create_shortcuts_background, daemon=True).start()
+    pipeline = StartupPipeline()
 
-    # Initialize AniSkip service with config
-    from weeb_cli.services.aniskip import aniskip_service
-    aniskip_enabled = config.get("aniskip_enabled", False)
-    aniskip_service.set_enabled(aniskip_enabled)
+    if not config.get("language"):
+        with pipeline.phase("setup"):
+            run_setup()
 
-    update_prompt()
-    check_incomplete_downloads()
+    # Not needed for the first menu render
+    pipeline.defer("shortcuts", _create_shortcuts_background)
+    pipeline.defer("update_check", refresh_update_info)
 
-    check_network()
-    check_ffmpeg_silent()
-    sync_tracker_pending()
+    with console.status(f"[dim]{i18n.t('common.ctrl_c_hint')}[/dim]", spinner="dots"):
+        results = pipeline.run_parallel({
+            "network": check_network,
+            "ffmpeg": _find_ffmpeg,
+            "incomplete_downloads": _count_incomplete_downloads,
+            "aniskip": _init_aniskip,
+        })
+
+    # A check that hangs past the deadline (e.g. stuck DNS) should not lock the user out
+    if results["network"] is not TIMED_OUT and results["network"] is not True:
+        console.print(f"[red]{i18n.t('errors.network', 'Network connection error. Please check your internet connection.')}[/red]")
+        sys.exit(1)
+
+    with pipeline.phase("update_prompt"):
+        update_prompt()
+    with pipeline.phase("incomplete_downloads_prompt"):
+        check_incomplete_downloads(_result(results, "incomplete_downloads"))
+    with pipeline.phase("ffmpeg_install"):
+        check_ffmpeg_silent(_result(results, "ffmpeg"))
+
+    pipeline.defer("tracker_sync", sync_tracker_pending)
+
+    if startup_profile:
+        pipeline.print_report(console)
 
     try:
         show_main_menu()
     finally:
         from weeb_cli.services.discord_rpc import discord_rpc
         discord_rpc.disconnect()
+        if startup_profile:
+            pipeline.print_report(console, kinds=["background"])
 
-def check_incomplete_downloads():
+def check_incomplete_downloads(count=None):
+    import questionary
     from weeb_cli.services.downloader import queue_manager
     
-    if queue_manager.has_incomplete_downloads():
+    if count is None:
         count = queue_manager.get_incomplete_count()
+    if count > 0:
         try:
             ans = questionary.confirm(
                 i18n.t("downloads.resume_prompt", count=count),
@@ -115,6 +169,7 @@ def check_incomplete_downloads():
 
 def sync_tracker_pending():
     from weeb_cli.services.tracker import anilist_tracker, mal_tracker, kitsu_tracker
+    from weeb_cli.services.logger import debug
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
     trackers = [
@@ -135,12 +190,15 @@ def sync_tracker_pending():
         for future in as_completed(futures):
             name, synced = future.result()
             if synced > 0:
-                console.print(f"[dim]{name}: {synced} synced[/dim]")
+                debug(f"[Tracker] {name}: {synced} synced")
     
 @app.callback(invoke_without_command=True)
-def main(ctx: typer.Context):
+def main(
+    ctx: typer.Context,
+    startup_profile: bool = typer.Option(False, "--startup-profile", help="Print per-phase startup timings.")
+):
     if ctx.invoked_subcommand is None:
-        start()
+        start(startup_profile=startup_profile)
 
 if __name__ == "__main__":
     app()
@@ -155,6 +155,7 @@ class BaseProvider(ABC):
     name: str = "base"
     lang: str = "tr"
     region: str = "TR"
+    impersonate: Optional[str] = None
     
     def __init__(self) -> None:
         """Initialize provider with default headers."""
@@ -163,6 +164,25 @@ class BaseProvider(ABC):
             'Accept': 'application/json, text/html, */*',
         }
     
+    @property
+    def session(self):
+        """Shared keep-alive HTTP session for this provider.
+        
+        Providers that set ``impersonate`` (a curl_cffi browser target)
+        get the matching impersonating session; all others share the
+        default pooled requests session. A provider may assign its own
+        session instead (e.g. one with a custom retry policy).
+        """
+        own = self.__dict__.get("_session")
+        if own is not None:
+            return own
+        from weeb_cli.services.http_client import http_client
+        return http_client.session(self.impersonate)
+    
+    @session.setter
+    def session(self, value) -> None:
+        self._session = value
+    
     @abstractmethod
     def search(self, query: str) -> List[AnimeResult]:
         """Search for anime by query string.
@@ -253,14 +273,15 @@ class BaseProvider(ABC):
         import requests
         import time
         import random
+        from weeb_cli.services.http_client import http_client
         
         for attempt in range(max_retries):
             try:
-                response = requests.get(
+                response = self.session.get(
                     url, 
                     headers=self.headers, 
                     params=params,
-                    timeout=15
+                    timeout=http_client.timeout
                 )
                 response.raise_for_status()
                 
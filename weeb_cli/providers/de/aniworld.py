@@ -1,4 +1,4 @@
-import json, re, requests
+import json, re
 from typing import List, Optional, Dict, Tuple
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
@@ -14,7 +14,6 @@ STREAM_BASE = "https://aniworld.to/anime/stream/"
 class AniWorldProvider(BaseProvider):
     def __init__(self):
         super().__init__()
-        self.session = requests.Session()
         self.headers = {
             "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Referer": "https://aniworld.to/"
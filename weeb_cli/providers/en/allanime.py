@@ -1,6 +1,5 @@
 import json
 import re
-import urllib.request
 from urllib.parse import quote, urlencode
 from typing import List, Optional
 
@@ -12,6 +11,7 @@ from weeb_cli.providers.base import (
     StreamLink
 )
 from weeb_cli.providers.registry import register_provider
+from weeb_cli.services.http_client import http_client
 
 API_URL = "https://api.allanime.day/api"
 REFERER = "https://allmanga.to"
@@ -51,9 +51,9 @@ def _decode_provider_id(encoded: str) -> str:
 
 
 def _http_get(url: str, headers: dict = None, timeout: int = 15) -> bytes:
-    req = urllib.request.Request(url, headers=headers or HEADERS)
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return resp.read()
+    resp = http_client.get(url, headers=headers or HEADERS, timeout=timeout)
+    resp.raise_for_status()
+    return resp.content
 
 
 def _get_json(url: str, headers: dict = None, timeout: int = 15):
@@ -1,6 +1,5 @@
 import json
 import re
-import urllib.request
 from urllib.parse import quote
 from typing import List, Optional
 from bs4 import BeautifulSoup
@@ -14,6 +13,7 @@ from weeb_cli.providers.base import (
 )
 from weeb_cli.providers.registry import register_provider
 from weeb_cli.providers.extractors.megacloud import extract_stream
+from weeb_cli.services.http_client import http_client
 
 BASE_URL = "https://hianime.to"
 AJAX_URL = f"{BASE_URL}/ajax/v2"
@@ -26,9 +26,9 @@ HEADERS = {
 
 
 def _http_get(url: str, headers: dict = None, timeout: int = 15) -> bytes:
-    req = urllib.request.Request(url, headers=headers or HEADERS)
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return resp.read()
+    resp = http_client.get(url, headers=headers or HEADERS, timeout=timeout)
+    resp.raise_for_status()
+    return resp.content
 
 
 def _get_json(url: str, headers: dict = None) -> Optional[dict]:
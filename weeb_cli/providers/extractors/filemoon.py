@@ -1,4 +1,5 @@
-import re, requests
+import re
+from weeb_cli.services.http_client import http_client
 from weeb_cli.services.logger import debug
 
 def decode_packer(p, r, c, d):
@@ -12,7 +13,7 @@ def decode_packer(p, r, c, d):
 def extract_filemoon(url):
     h = {"User-Agent": "Mozilla/5.0", "Referer": "https://aniworld.to/"}
     try:
-        s = requests.Session()
+        s = http_client.session()
         html = s.get(url, headers=h, timeout=10).text
         ifm = re.search(r'<iframe[^>]*src="([^"]+)"', html)
         if not ifm: return None
@@ -1,10 +1,11 @@
 import re
 import json
 import time
-import urllib.request
 from typing import Optional, Dict, Any, List
 from bs4 import BeautifulSoup
 
+from weeb_cli.services.http_client import http_client
+
 try:
     from Crypto.Cipher import AES
     from Crypto.Util.Padding import unpad
@@ -30,9 +31,9 @@ KEY_CACHE_DURATION = 3600
 
 
 def _http_get(url: str, headers: dict = None, timeout: int = 15) -> bytes:
-    req = urllib.request.Request(url, headers=headers or HEADERS)
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return resp.read()
+    resp = http_client.get(url, headers=headers or HEADERS, timeout=timeout)
+    resp.raise_for_status()
+    return resp.content
 
 
 def _get_json(url: str, headers: dict = None) -> Optional[dict]:
@@ -1,5 +1,6 @@
-import base64, json, re, requests
+import base64, json, re
 from typing import Optional
+from weeb_cli.services.http_client import http_client
 from weeb_cli.services.logger import debug
 
 def rot13(s):
@@ -22,7 +23,7 @@ def deobfuscate(encoded):
 def extract_voe(url):
     headers = {"User-Agent": "Mozilla/5.0", "Referer": "https://aniworld.to/"}
     try:
-        s = requests.Session()
+        s = http_client.session()
         html = s.get(url, headers=headers, timeout=10, allow_redirects=True).text
         m = re.search(r"window\.location\.href\s*=\s*'([^']+)'", html)
         if m: html = s.get(m.group(1), headers=headers, timeout=10).text
@@ -5,6 +5,9 @@ automatic discovery and registration of providers from the filesystem.
 
 The registry scans language directories (tr/, en/, de/, pl/) and imports
 all provider modules, registering them with metadata for easy lookup.
+The metadata is saved to a manifest, so later runs can list providers
+without importing them and only import the module of the provider that
+is actually requested.
 
 Functions:
     register_provider: Decorator for registering provider classes
@@ -51,9 +54,10 @@ from weeb_cli.config import CONFIG_DIR
 # Global registry storage
 _providers: Dict[str, Type[BaseProvider]] = {}
 _provider_meta: Dict[str, dict] = {}
+_provider_modules: Dict[str, str] = {}
 _initialized: bool = False
 
-# Cache file location (JSON instead of pickle for security)
+# Provider manifest location (JSON instead of pickle for security)
 PROVIDER_CACHE_FILE = CONFIG_DIR / "provider_cache.json"
 
 
@@ -100,55 +104,78 @@ def register_provider(name: str, lang: str = "tr", region: str = "TR", disabled:
     return decorator
 
 
+def _provider_files() -> List[Path]:
+    """List provider module files in the language directories."""
+    base_path = Path(__file__).parent
+    files = []
+    for lang_dir in sorted(base_path.iterdir()):
+        if lang_dir.is_dir() and not lang_dir.name.startswith(("_", "extractors")):
+            for _, name, is_pkg in pkgutil.iter_modules([str(lang_dir)]):
+                if not is_pkg:
+                    files.append(lang_dir / f"{name}.py")
+    return files
+
+
+def _fingerprint() -> Dict[str, int]:
+    """Map each provider file to its mtime, used to invalidate the manifest."""
+    base_path = Path(__file__).parent
+    result = {}
+    for path in _provider_files():
+        try:
+            result[path.relative_to(base_path).as_posix()] = path.stat().st_mtime_ns
+        except OSError:
+            continue
+    return result
+
+
 def _discover_providers() -> None:
-    """Discover and import all provider modules.
+    """Load provider metadata, importing provider modules only if needed.
     
-    Scans language directories (tr/, en/, de/, pl/) and imports all
-    Python modules, triggering their @register_provider decorators.
+    Reads the provider manifest first, which fills in the metadata of every
+    provider without importing any provider module. When the manifest is
+    missing or stale, scans language directories (tr/, en/, de/, pl/),
+    imports all Python modules to trigger their @register_provider
+    decorators, and writes a fresh manifest.
     
     This function is called automatically on first registry access.
     Uses a global flag to ensure it only runs once.
-    
-    Attempts to load from cache first for faster startup.
     """
-    global _initialized, _providers, _provider_meta
+    global _initialized
     if _initialized:
         return
     
-    # Try to load from cache first
-    if _load_from_cache():
+    fingerprint = _fingerprint()
+    
+    if _load_from_cache(fingerprint):
         _initialized = True
-        debug("[Registry] Loaded providers from cache")
+        debug("[Registry] Loaded provider manifest")
         return
     
-    base_path = Path(__file__).parent
+    for path in _provider_files():
+        module = f"weeb_cli.providers.{path.parent.name}.{path.stem}"
+        try:
+            importlib.import_module(module)
+            debug(f"[Registry] Discovered provider: {path.parent.name}/{path.stem}")
+        except Exception as e:
+            debug(f"[Registry] Error loading provider {path.parent.name}/{path.stem}: {e}")
     
-    # Scan language directories
-    for lang_dir in base_path.iterdir():
-        if lang_dir.is_dir() and not lang_dir.name.startswith(("_", "extractors")):
-            lang = lang_dir.name
-            
-            # Import all .py files in this language directory
-            for _, name, is_pkg in pkgutil.iter_modules([str(lang_dir)]):
-                if not is_pkg:
-                    try:
-                        importlib.import_module(f"weeb_cli.providers.{lang}.{name}")
-                        debug(f"[Registry] Discovered provider: {lang}/{name}")
-                    except Exception as e:
-                        debug(f"[Registry] Error loading provider {lang}/{name}: {e}")
-    
-    # Save to cache for next time
-    _save_to_cache()
+    _save_to_cache(fingerprint)
     _initialized = True
 
 
-def _load_from_cache() -> bool:
-    """Load provider registry from cache file (JSON-based).
+def _load_from_cache(fingerprint: Dict[str, int]) -> bool:
+    """Load provider metadata from the manifest without importing providers.
+    
+    The manifest is only used when it was written by the same package
+    version and no provider file was added, removed or modified since.
+    
+    Args:
+        fingerprint: Current provider file mtimes from :func:`_fingerprint`.
     
     Returns:
-        True if cache was loaded successfully, False otherwise.
+        True if the manifest was loaded, False if a full scan is needed.
     """
-    global _providers, _provider_meta
+    from weeb_cli import __version__
     
     if not PROVIDER_CACHE_FILE.exists():
         # Clean up old pickle cache if it exists
@@ -164,52 +191,75 @@ def _load_from_cache() -> bool:
         with open(PROVIDER_CACHE_FILE, 'r', encoding='utf-8') as f:
             cache_data = json.load(f)
         
-        # Validate cache structure
-        if not isinstance(cache_data, dict) or 'modules' not in cache_data:
+        # Old caches only held module paths and must be rebuilt
+        if not isinstance(cache_data, dict) or not isinstance(cache_data.get('providers'), list):
+            return False
+        if cache_data.get('version') != __version__ or cache_data.get('files') != fingerprint:
+            debug("[Registry] Provider manifest is stale")
             return False
         
-        # Import all provider modules to register classes
-        for module_path in cache_data.get('modules', []):
-            try:
-                importlib.import_module(module_path)
-            except Exception as e:
-                debug(f"[Registry] Failed to import cached module {module_path}: {e}")
-                return False
-        
+        for entry in cache_data['providers']:
+            name = entry['name']
+            _provider_modules[name] = entry['module']
+            _provider_meta.setdefault(name, {
+                "name": name,
+                "lang": entry['lang'],
+                "region": entry['region'],
+                "class": entry['class'],
+                "disabled": bool(entry.get('disabled', False))
+            })
         return True
-    except (json.JSONDecodeError, OSError) as e:
-        debug(f"[Registry] Failed to load provider cache: {e}")
+    except (json.JSONDecodeError, OSError, KeyError, TypeError) as e:
+        debug(f"[Registry] Failed to load provider manifest: {e}")
         return False
 
 
-def _save_to_cache() -> None:
-    """Save provider registry to cache file (JSON-based)."""
+def _save_to_cache(fingerprint: Dict[str, int]) -> None:
+    """Save provider metadata to the manifest file (JSON-based)."""
+    from weeb_cli import __version__
+    
     try:
         PROVIDER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
         
-        # Collect module paths for all registered providers
-        modules = set()
-        for name, cls in _providers.items():
-            modules.add(cls.__module__)
-        
         cache_data = {
-            'modules': sorted(modules),
+            'version': __version__,
+            'files': fingerprint,
+            'providers': [
+                dict(meta, module=_providers[name].__module__)
+                for name, meta in _provider_meta.items()
+                if name in _providers
+            ],
         }
         
         with open(PROVIDER_CACHE_FILE, 'w', encoding='utf-8') as f:
             json.dump(cache_data, f, indent=2)
         
-        debug(f"[Registry] Saved {len(_providers)} providers to cache")
+        debug(f"[Registry] Saved {len(_providers)} providers to manifest")
     except OSError as e:
-        debug(f"[Registry] Failed to save provider cache: {e}")
+        debug(f"[Registry] Failed to save provider manifest: {e}")
+
+
+def _load_provider_class(name: str) -> Optional[Type[BaseProvider]]:
+    """Import the module of a provider known only from the manifest."""
+    if name in _providers:
+        return _providers[name]
+    module = _provider_modules.get(name)
+    if module is None:
+        return None
+    try:
+        importlib.import_module(module)
+    except Exception as e:
+        debug(f"[Registry] Error loading provider {name} from {module}: {e}")
+        return None
+    return _providers.get(name)
 
 
 def get_provider(name: str) -> Optional[BaseProvider]:
     """Get provider instance by name.
     
     Triggers provider discovery if not already done, then returns
-    a new instance of the requested provider. Returns None if provider
-    is disabled or not found.
+    a new instance of the requested provider. Only that provider's module
+    is imported. Returns None if provider is disabled or not found.
     
     Args:
         name: Provider identifier (e.g., 'animecix', 'hianime').
@@ -223,13 +273,14 @@ def get_provider(name: str) -> Optional[BaseProvider]:
         ...     results = provider.search("anime")
     """
     _discover_providers()
-    if name in _providers:
-        # Check if provider is disabled
-        if _provider_meta.get(name, {}).get("disabled", False):
-            debug(f"[Registry] Provider '{name}' is disabled")
-            return None
-        return _providers[name]()
-    return None
+    if name not in _provider_meta:
+        return None
+    # Check if provider is disabled
+    if _provider_meta[name].get("disabled", False):
+        debug(f"[Registry] Provider '{name}' is disabled")
+        return None
+    cls = _load_provider_class(name)
+    return cls() if cls is not None else None
 
 
 def get_providers_for_lang(lang: str) -> List[str]:
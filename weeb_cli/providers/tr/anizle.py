@@ -11,23 +11,17 @@ from weeb_cli.providers.base import (
     Episode,
     StreamLink
 )
+from weeb_cli.config import CONFIG_DIR
 from weeb_cli.providers.registry import register_provider
-
-try:
-    from curl_cffi import requests as curl_requests
-    HAS_CURL_CFFI = True
-except ImportError:
-    import requests as std_requests
-    HAS_CURL_CFFI = False
+from weeb_cli.providers.tr.anizle_catalogue import AnizleCatalogue, CatalogueIndex
+from weeb_cli.services.http_client import http_client
 
 BASE_URL = "https://anizm.pro"
 API_BASE_URL = "https://anizle.org"
 ANIME_LIST_URL = f"{BASE_URL}/getAnimeListForSearch"
 PLAYER_BASE_URL = "https://anizmplayer.com"
-
-_anime_database: List[Dict[str, Any]] = []
-_database_loaded: bool = False
-_session = None
+IMPERSONATE = "chrome110"
+CATALOGUE_FILE = CONFIG_DIR / "anizle_catalogue.json"
 
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -37,13 +31,7 @@ DEFAULT_HEADERS = {
 
 
 def _get_session():
-    global _session
-    if _session is None:
-        if HAS_CURL_CFFI:
-            _session = curl_requests.Session(impersonate="chrome110")
-        else:
-            _session = std_requests.Session()
-    return _session
+    return http_client.session(impersonate=IMPERSONATE)
 
 
 def _http_get(url: str, headers: Dict = None, timeout: int = 60):
@@ -80,23 +68,24 @@ def _strip_html(text: str) -> str:
     return text.strip()
 
 
+_catalogue = AnizleCatalogue(
+    CATALOGUE_FILE,
+    lambda headers: _http_get(ANIME_LIST_URL, headers=headers, timeout=120)
+)
+_index: Optional[CatalogueIndex] = None
+
+
 def _load_database() -> List[Dict[str, Any]]:
-    global _anime_database, _database_loaded
-    
-    if _database_loaded:
-        return _anime_database
-    
-    try:
-        response = _http_get(ANIME_LIST_URL, timeout=120)
-        if response and response.status_code == 200:
-            data = response.json()
-            if isinstance(data, list):
-                _anime_database = data
-                _database_loaded = True
-    except Exception:
-        pass
+    return _catalogue.items()
+
+
+def _get_index() -> CatalogueIndex:
+    global _index
     
-    return _anime_database
+    database = _load_database()
+    if _index is None or _index.items is not database:
+        _index = CatalogueIndex(database)
+    return _index
 
 
 def _unpack_js(p: str, a: int, c: int, k: List[str]) -> str:
@@ -154,16 +143,14 @@ def _extract_fireplayer_id(player_html: str) -> Optional[str]:
 @register_provider("anizle", lang="tr", region="TR", disabled=True)
 class AnizleProvider(BaseProvider):
     
+    impersonate = IMPERSONATE
+    
     def __init__(self):
         super().__init__()
     
     def search(self, query: str) -> List[AnimeResult]:
-        database = _load_database()
-        if not database:
-            return []
-        
         results = []
-        for anime in database:
+        for anime in _get_index().candidates(query):
             scores = [
                 self._similarity(query, anime.get("info_title", "")),
                 self._similarity(query, anime.get("info_titleoriginal", "")),
@@ -186,13 +173,7 @@ class AnizleProvider(BaseProvider):
         return [r[1] for r in results[:20]]
     
     def get_details(self, anime_id: str) -> Optional[AnimeDetails]:
-        database = _load_database()
-        anime_data = None
-        
-        for anime in database:
-            if anime.get("info_slug") == anime_id:
-                anime_data = anime
-                break
+        anime_data = _get_index().by_slug.get(anime_id)
         
         episodes = self.get_episodes(anime_id)
         
@@ -0,0 +1,219 @@
+"""
+Persistent catalogue and title index for the Anizle provider.
+
+Anizle has no search endpoint; the provider searches the full anime list
+served by ``getAnimeListForSearch``. The list is stored on disk and
+revalidated in the background with ``If-None-Match``/``If-Modified-Since``,
+so only the very first run waits for the download. Searches go through an
+inverted index of title tokens and trigrams, so a query only scores the
+entries that share something with it instead of the whole catalogue.
+"""
+
+import json
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from weeb_cli.services.logger import debug
+
+TITLE_FIELDS = ("info_title", "info_titleoriginal", "info_titleenglish")
+REFRESH_INTERVAL = 6 * 60 * 60
+MIN_TRIGRAM_OVERLAP = 0.3
+MAX_TRIGRAM_CANDIDATES = 200
+
+_NON_WORD = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def normalize(text: str) -> str:
+    """Lowercase, strip accents and collapse punctuation to single spaces."""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKD", str(text).replace("ı", "i"))
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return _NON_WORD.sub(" ", text.lower()).replace("_", " ").strip()
+
+
+def trigrams(token: str) -> Set[str]:
+    """Character trigrams of a token, padded so short tokens still match."""
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CatalogueIndex:
+    """Slug lookup and inverted title index over catalogue entries.
+    
+    Attributes:
+        items: Catalogue entries the index was built from.
+        by_slug: Mapping of ``info_slug`` to entry.
+    """
+    
+    def __init__(self, items: List[Dict[str, Any]]) -> None:
+        self.items = items
+        self.by_slug: Dict[str, Dict[str, Any]] = {}
+        self._tokens: Dict[str, Set[int]] = {}
+        self._trigrams: Dict[str, Set[int]] = {}
+        
+        for i, item in enumerate(items):
+            slug = item.get("info_slug")
+            if slug:
+                self.by_slug.setdefault(slug, item)
+            for token in self._item_tokens(item):
+                self._tokens.setdefault(token, set()).add(i)
+                for gram in trigrams(token):
+                    self._trigrams.setdefault(gram, set()).add(i)
+    
+    @staticmethod
+    def _item_tokens(item: Dict[str, Any]) -> Set[str]:
+        tokens = set()
+        for field in TITLE_FIELDS:
+            tokens.update(normalize(item.get(field, "")).split())
+        return tokens
+    
+    def candidates(self, query: str) -> List[Dict[str, Any]]:
+        """Entries sharing a token, or enough trigrams, with the query.
+        
+        Exact token matches always qualify. Trigram matches cover typos and
+        partial words; they must share at least ``MIN_TRIGRAM_OVERLAP`` of
+        the query's trigrams and are capped at ``MAX_TRIGRAM_CANDIDATES``.
+        """
+        tokens = normalize(query).split()
+        if not tokens:
+            return []
+        
+        found: Set[int] = set()
+        for token in tokens:
+            found.update(self._tokens.get(token, ()))
+        
+        grams: Set[str] = set()
+        for token in tokens:
+            grams.update(trigrams(token))
+        counts: Counter = Counter()
+        for gram in grams:
+            counts.update(self._trigrams.get(gram, ()))
+        
+        needed = max(1, int(len(grams) * MIN_TRIGRAM_OVERLAP))
+        for i, count in counts.most_common(MAX_TRIGRAM_CANDIDATES):
+            if count < needed:
+                break
+            found.add(i)
+        
+        return [self.items[i] for i in sorted(found)]
+
+
+class AnizleCatalogue:
+    """On-disk copy of the Anizle anime list with conditional refresh.
+    
+    Args:
+        path: JSON file holding the list and its validators.
+        fetch: Callable taking extra request headers and returning a
+            response (or None on network failure).
+        refresh_interval: Seconds before a stored list is revalidated.
+    """
+    
+    def __init__(
+        self,
+        path: Path,
+        fetch: Callable[[Dict[str, str]], Any],
+        refresh_interval: float = REFRESH_INTERVAL
+    ) -> None:
+        self.path = path
+        self.fetch = fetch
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._state: Optional[Dict[str, Any]] = None
+        self._refreshing: Optional[threading.Thread] = None
+    
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if isinstance(state, dict) and isinstance(state.get("items"), list):
+                return state
+        except (OSError, ValueError) as e:
+            debug(f"[Anizle] No stored catalogue: {e}")
+        return {"items": []}
+    
+    def _write(self, state: Dict[str, Any]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False)
+            tmp.replace(self.path)
+        except OSError as e:
+            debug(f"[Anizle] Failed to store catalogue: {e}")
+    
+    def items(self) -> List[Dict[str, Any]]:
+        """Return the catalogue, fetching it only if nothing is stored.
+        
+        A stored list older than the refresh interval is returned as is
+        while a background thread revalidates it.
+        """
+        with self._lock:
+            if self._state is None:
+                self._state = self._read()
+            state = self._state
+        
+        if not state["items"]:
+            self.refresh()
+        elif time.time() - state.get("fetched_at", 0) > self.refresh_interval:
+            self.refresh_in_background()
+        return self._state["items"]
+    
+    def refresh(self) -> bool:
+        """Revalidate the stored list with the server.
+        
+        Returns:
+            True if the server answered 200 or 304.
+        """
+        with self._lock:
+            state = self._state if self._state is not None else self._read()
+        
+        headers = {}
+        if state["items"] and state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state["items"] and state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+        
+        response = self.fetch(headers)
+        status = getattr(response, "status_code", None)
+        
+        if status == 304:
+            debug("[Anizle] Catalogue not modified")
+            new_state = {**state, "fetched_at": time.time()}
+        elif status == 200:
+            try:
+                items = response.json()
+            except ValueError:
+                items = None
+            if not isinstance(items, list):
+                return False
+            debug(f"[Anizle] Catalogue refreshed: {len(items)} entries")
+            new_state = {
+                "items": items,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+            }
+        else:
+            return False
+        
+        with self._lock:
+            self._state = new_state
+        self._write(new_state)
+        return True
+    
+    def refresh_in_background(self) -> threading.Thread:
+        """Start a refresh thread unless one is already running."""
+        with self._lock:
+            if self._refreshing is not None and self._refreshing.is_alive():
+                return self._refreshing
+            self._refreshing = threading.Thread(
+                target=self.refresh, name="anizle-catalogue", daemon=True
+            )
+            self._refreshing.start()
+            return self._refreshing
@@ -29,15 +29,9 @@ from weeb_cli.providers.base import (
 )
 from weeb_cli.providers.registry import register_provider
 from weeb_cli.config import CONFIG_DIR
+from weeb_cli.services.http_client import http_client, HAS_CURL_CFFI
 from weeb_cli.services.logger import debug
 
-try:
-    from curl_cffi import requests as curl_requests
-    HAS_CURL_CFFI = True
-except ImportError:
-    HAS_CURL_CFFI = False
-    import requests as fallback_requests
-
 try:
     from Crypto.Cipher import AES
     HAS_CRYPTO = True
@@ -45,6 +39,7 @@ except ImportError:
     HAS_CRYPTO = False
 
 BASE_URL = "https://turkanime.tv"
+IMPERSONATE = "firefox"
 KEY_CACHE_FILE = CONFIG_DIR / "turkanime_key.cache"
 CSRF_CACHE_FILE = CONFIG_DIR / "turkanime_csrf.cache"
 
@@ -64,8 +59,9 @@ SUPPORTED_PLAYERS = [
 def _init_session():
     """Initialize HTTP session with Cloudflare bypass.
     
-    Uses curl-cffi with Firefox impersonation for TLS fingerprint spoofing.
-    Falls back to regular requests if curl-cffi is not available.
+    Uses the shared curl-cffi Firefox-impersonating session for TLS
+    fingerprint spoofing. Falls back to a pooled requests session if
+    curl-cffi is not available.
     
     Returns:
         Configured session object.
@@ -77,11 +73,10 @@ def _init_session():
     
     debug("[Turkanime] Initializing session")
     
+    _session = http_client.session(impersonate=IMPERSONATE)
     if HAS_CURL_CFFI:
-        _session = curl_requests.Session(impersonate="firefox", allow_redirects=True)
         debug("[Turkanime] Using curl-cffi with Firefox impersonation")
     else:
-        _session = fallback_requests.Session()
         debug("[Turkanime] Warning: curl-cffi not available, using fallback (may fail with Cloudflare)")
     
     _base_url = BASE_URL
@@ -490,6 +485,8 @@ class TurkAnimeProvider(BaseProvider):
     Uses curl-cffi with Firefox impersonation for Cloudflare bypass.
     """
     
+    impersonate = IMPERSONATE
+    
     def __init__(self):
         super().__init__()
         debug("[Turkanime] Provider initialized")
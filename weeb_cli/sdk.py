@@ -330,6 +330,7 @@ class WeebSDK:
             Downloaded to: ./downloads/Anime Name - S01E01.mp4
         """
         from weeb_cli.services.headless_downloader import download_episode
+        from weeb_cli.services.host_scoreboard import host_scoreboard
         
         provider_name = provider or self.default_provider
         provider_instance = get_provider(provider_name)
@@ -360,7 +361,7 @@ class WeebSDK:
                 code="NO_STREAMS"
             )
         
-        # Sort by quality (best first)
+        # Sort by quality (best first), then by mirror health and speed
         def quality_score(quality: str) -> int:
             q = (quality or "").lower()
             if "4k" in q or "2160" in q:
@@ -375,7 +376,7 @@ class WeebSDK:
                 return 1
             return 0
         
-        stream_links.sort(key=lambda s: quality_score(s.quality), reverse=True)
+        stream_links = host_scoreboard.rank(stream_links, quality_key=lambda s: quality_score(s.quality))
         
         # Get anime title if not provided
         if anime_title is None:
@@ -391,6 +392,7 @@ class WeebSDK:
                 season=season,
                 episode=episode,
                 download_dir=output_dir,
+                server=stream.server,
             )
             if result:
                 debug(f"[SDK] Download successful: {result}")
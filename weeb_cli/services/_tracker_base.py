@@ -1,72 +1,188 @@
 import json
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
 from weeb_cli.services._base import LazyService
 from weeb_cli.services import logger
 
+# How long push_progress waits for a sync that is already running
+PUSH_LOCK_TIMEOUT = 30.0
+
 
 class BaseTracker(LazyService):
+    """Common outbox handling for progress trackers.
+    
+    Updates that cannot be sent right away are queued in the ``tracker_outbox``
+    table, one row per title, so repeated updates coalesce to the latest
+    episode. ``sync_pending`` drains the outbox with up to ``sync_concurrency``
+    workers, starting requests oldest first and at least ``sync_min_interval``
+    seconds apart. A row is only removed once its update succeeded, so an
+    interrupted sync resumes where it stopped.
+    
+    Trackers whose API can apply several updates in one request set
+    ``sync_batch_size`` and override ``update_progress_batch``; each batch
+    then counts as one request for the rate limit.
+    """
+    
+    sync_concurrency = 2
+    sync_min_interval = 0.5
+    sync_batch_size = 1
     
     def __init__(self, service_name: str):
         super().__init__()
         self.service_name = service_name
         self._pending_key = f"{service_name}_pending"
+        self._legacy_migrated = False
+        self._sync_lock = threading.Lock()
+        self._next_slot = 0.0
     
     def is_authenticated(self) -> bool:
         raise NotImplementedError
     
-    def update_progress(self, anime_title: str, episode: int, 
+    def update_progress(self, anime_title: str, episode: int,
                        total_episodes: Optional[int] = None) -> bool:
         raise NotImplementedError
     
-    def _queue_update(self, anime_title: str, episode: int, 
+    @staticmethod
+    def _title_key(title: str) -> str:
+        return re.sub(r"[\W_]+", " ", title.casefold()).strip()
+    
+    def _cached_ids(self, title: str) -> Optional[Dict[str, Any]]:
+        """Media and entry IDs stored by an earlier successful update of ``title``."""
+        return self.db.get_tracker_id(self.service_name, self._title_key(title))
+    
+    def _remember_ids(self, title: str, media_id: Any, entry_id: Optional[Any] = None) -> None:
+        self.db.save_tracker_id(self.service_name, self._title_key(title), media_id, entry_id)
+    
+    def _queue_update(self, anime_title: str, episode: int,
                      total_episodes: Optional[int]) -> None:
-        pending = self._get_pending_list()
-        pending.append({
-            "title": anime_title,
-            "episode": episode,
-            "total": total_episodes,
-            "timestamp": time.time()
-        })
-        self._save_pending_list(pending)
+        self._migrate_legacy_pending()
+        self.db.queue_tracker_update(self.service_name, anime_title, episode, total_episodes)
         logger.info(f"{self.service_name}: Queued update for {anime_title} ep {episode}")
     
-    def _get_pending_list(self) -> List[Dict]:
-        pending = self.db.get_config(self._pending_key) or []
+    def _migrate_legacy_pending(self) -> None:
+        """Move the old JSON list stored under ``<service>_pending`` into the outbox."""
+        if self._legacy_migrated:
+            return
+        self._legacy_migrated = True
+        
+        pending = self.db.get_config(self._pending_key)
         if isinstance(pending, str):
-            pending = json.loads(pending) if pending else []
-        return pending
+            try:
+                pending = json.loads(pending) if pending else []
+            except ValueError:
+                pending = []
+        if not isinstance(pending, list) or not pending:
+            return
+        
+        for item in pending:
+            if isinstance(item, dict) and item.get("title") and item.get("episode") is not None:
+                self.db.queue_tracker_update(
+                    self.service_name, item["title"], item["episode"],
+                    item.get("total"), item.get("timestamp")
+                )
+        self.db.set_config(self._pending_key, [])
+    
+    def _get_pending_list(self) -> List[Dict[str, Any]]:
+        self._migrate_legacy_pending()
+        return self.db.get_tracker_outbox(self.service_name)
+    
+    def update_progress_batch(self, updates: List[Dict[str, Any]]) -> List[bool]:
+        """Apply several updates, returning one success flag per item.
+        
+        Args:
+            updates: Dicts with ``title``, ``episode`` and optional ``total``.
+        """
+        return [self.update_progress(u["title"], u["episode"], u.get("total")) for u in updates]
     
-    def _save_pending_list(self, pending: List[Dict]) -> None:
-        self.db.set_config(self._pending_key, pending)
+    def push_progress(self, anime_title: str, episode: int,
+                      total_episodes: Optional[int] = None) -> int:
+        """Queue an update and drain the outbox, so it is sent with any backlog.
+        
+        If another sync is running, waits up to ``PUSH_LOCK_TIMEOUT`` for it;
+        the running sync re-reads the outbox before it finishes, so the new
+        row is sent either way.
+        
+        Returns:
+            Number of outbox items synced by this call.
+        """
+        self._queue_update(anime_title, episode, total_episodes)
+        return self._drain_outbox(wait=PUSH_LOCK_TIMEOUT)
     
     def sync_pending(self) -> int:
+        return self._drain_outbox(wait=0)
+    
+    def _drain_outbox(self, wait: float) -> int:
+        """Send queued updates until only ones already tried in this call remain."""
         if not self.is_authenticated():
             return 0
         
-        pending = self._get_pending_list()
-        if not pending:
+        if wait > 0:
+            acquired = self._sync_lock.acquire(timeout=wait)
+        else:
+            acquired = self._sync_lock.acquire(blocking=False)
+        if not acquired:
             return 0
+        try:
+            synced = 0
+            attempted = set()
+            while True:
+                pending = [
+                    item for item in self._get_pending_list()
+                    if (item["title"], item["episode"]) not in attempted
+                ]
+                if not pending:
+                    return synced
+                attempted.update((item["title"], item["episode"]) for item in pending)
+                synced += self._sync_items(pending)
+        finally:
+            self._sync_lock.release()
+    
+    def _sync_items(self, pending: List[Dict[str, Any]]) -> int:
+        size = max(1, self.sync_batch_size)
+        batches = [pending[i:i + size] for i in range(0, len(pending), size)]
+        slots = self._reserve_slots(len(batches))
+        workers = max(1, min(self.sync_concurrency, len(batches)))
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix=f"{self.service_name}-sync") as executor:
+            return sum(executor.map(self._sync_batch, batches, slots))
+    
+    def _reserve_slots(self, count: int) -> List[float]:
+        """Start times for ``count`` requests, spaced by the rate limit.
         
-        synced = 0
-        failed = []
+        Carries over between drain rounds, so a re-read of the outbox does not
+        fire right after the previous round's last request.
+        """
+        start = max(time.monotonic(), self._next_slot)
+        slots = [start + i * self.sync_min_interval for i in range(count)]
+        self._next_slot = slots[-1] + self.sync_min_interval if slots else start
+        return slots
+    
+    def _sync_batch(self, items: List[Dict[str, Any]], start_at: float) -> int:
+        delay = start_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
         
-        for item in pending:
-            success = self.update_progress(
-                item["title"],
-                item["episode"],
-                item.get("total")
-            )
+        try:
+            results = self.update_progress_batch(items)
+        except Exception as e:
+            logger.error(f"{self.service_name}: Sync failed for {len(items)} item(s): {e}")
+            results = [False] * len(items)
+        
+        synced = 0
+        for item, success in zip(items, results):
             if success:
+                self.db.complete_tracker_update(self.service_name, item["title"], item["episode"])
                 synced += 1
             else:
-                failed.append(item)
-        
-        self._save_pending_list(failed)
+                self.db.fail_tracker_update(self.service_name, item["title"])
         return synced
     
     def get_pending_count(self) -> int:
-        return len(self._get_pending_list())
+        self._migrate_legacy_pending()
+        return self.db.count_tracker_outbox(self.service_name)
     
     def logout(self) -> None:
         raise NotImplementedError
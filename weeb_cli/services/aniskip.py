@@ -19,8 +19,8 @@ Example:
             print(f"ED: {skip_times['ed']}")
 """
 
-import requests
 from typing import Optional, Dict, Tuple
+from weeb_cli.services.http_client import http_client
 from weeb_cli.services.logger import debug as log_debug, error as log_error
 from weeb_cli.services.cache import get_cache
 
@@ -72,7 +72,7 @@ class AniSkipService:
             return cached
         
         try:
-            response = requests.get(
+            response = http_client.get(
                 self.MAL_SEARCH_URL,
                 params={"type": "anime", "keyword": anime_name},
                 headers=self._headers,
@@ -130,7 +130,7 @@ class AniSkipService:
         
         try:
             url = f"{self.ANISKIP_API_URL}/{mal_id}/{episode}"
-            response = requests.get(
+            response = http_client.get(
                 url,
                 params={"types": ["op", "ed"]},
                 headers=self._headers,
@@ -1,21 +1,27 @@
 """Caching system for Weeb CLI.
 
-This module provides a two-tier caching system with both memory and file-based
-storage. Supports TTL (time-to-live) for automatic cache expiration.
+This module provides a two-tier caching system with memory and persistent
+storage. Supports TTL (time-to-live) for automatic cache expiration. The
+memory tier is a bounded LRU limited by entry count and approximate size.
+The persistent tier is a pluggable backend; the default stores every entry
+as an indexed row in a single SQLite file.
 
 The cache system is used throughout the application to reduce redundant
 API calls and improve performance.
 
 Classes:
-    CacheManager: Main cache manager with memory and file storage
-    
+    CacheManager: Main cache manager with memory and persistent storage
+    CacheBackend: Interface for persistent storage backends
+    SQLiteCacheBackend: Default single-file backend
+    FileCacheBackend: Legacy one-file-per-entry backend
+
 Functions:
     cached: Decorator for automatic function result caching
     get_cache: Get global cache instance
 
 Example:
     Using cache manager::
-
+        
         from weeb_cli.services.cache import get_cache
         
         cache = get_cache()
@@ -30,7 +36,7 @@ Example:
         cache.clear_pattern("search:animecix:")
     
     Using decorator::
-
+        
         from weeb_cli.services.cache import cached
         
         @cached(max_age=1800)  # 30 minutes
@@ -41,32 +47,517 @@ Example:
 
 import json
 import time
+import sqlite3
 import hashlib
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional, Callable, Dict, Tuple
+from typing import Any, Optional, Callable, Dict, List, Set, Tuple
 from functools import wraps
 
+from weeb_cli.services.logger import debug
 
-class CacheManager:
-    """Two-tier cache manager with memory and file storage.
+DEFAULT_MAX_MEMORY_ENTRIES = 512
+DEFAULT_MAX_MEMORY_BYTES = 32 * 1024 * 1024
+CACHE_DB_NAME = "cache.db"
+
+
+def _hash_key(key: str) -> str:
+    """Generate SHA256 hash for a cache key."""
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _namespace_of(key: str) -> str:
+    """Get the namespace of a cache key (text before the first colon)."""
+    return key.split(":", 1)[0] if ":" in key else ""
+
+
+@dataclass
+class MemoryEntry:
+    """Value stored in the memory tier.
+    
+    Attributes:
+        value: Cached value.
+        stored_at: Unix timestamp when the value was stored.
+        ttl: Per-key time-to-live in seconds, or None to use the
+            caller's max_age at read time.
+        size: Approximate size of the value in bytes.
+    """
     
-    Provides fast memory cache with persistent file backup. Automatically
-    handles cache expiration based on TTL (time-to-live).
+    value: Any
+    stored_at: float
+    ttl: Optional[float] = None
+    size: int = 0
+    
+    def is_fresh(self, max_age: float, now: float, grace: float = 0) -> bool:
+        """Check whether the entry is still valid.
+        
+        Args:
+            max_age: Maximum age in seconds when the entry has no ttl.
+            now: Current Unix timestamp.
+            grace: Extra seconds past expiry still accepted (stale window).
+        """
+        limit = self.ttl if self.ttl is not None else max_age
+        return now - self.stored_at < limit + grace
+
+
+@dataclass
+class StoredEntry:
+    """Serialized entry in a persistent backend.
     
     Attributes:
-        cache_dir: Directory for cache file storage.
-        _memory_cache: In-memory cache dictionary.
+        payload: JSON-encoded value.
+        stored_at: Unix timestamp when the value was stored.
+        expires_at: Absolute expiry timestamp, or None to use the
+            caller's max_age at read time.
+        size: Size of the payload in bytes.
     """
     
+    payload: str
+    stored_at: float
+    expires_at: Optional[float] = None
+    size: int = 0
+    
+    def is_fresh(self, max_age: float, now: float, grace: float = 0) -> bool:
+        """Check whether the entry is still valid (see MemoryEntry.is_fresh)."""
+        if self.expires_at is not None:
+            return now < self.expires_at + grace
+        return now - self.stored_at < max_age + grace
+
+
+class CacheBackend(ABC):
+    """Persistent storage backend for CacheManager.
+    
+    Backends store serialized entries by their original key. Bulk delete
+    methods return the hashes of removed entries so the manager can report
+    accurate counts across both tiers.
+    """
+    
+    @abstractmethod
+    def get(self, key: str) -> Optional[StoredEntry]:
+        """Load an entry by key, or None if it is not stored."""
+        pass
+    
+    @abstractmethod
+    def set(self, key: str, entry: StoredEntry) -> None:
+        """Store or replace an entry."""
+        pass
+    
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """Delete an entry. Returns True if it existed."""
+        pass
+    
+    @abstractmethod
+    def clear(self) -> Set[str]:
+        """Delete all entries."""
+        pass
+    
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> Set[str]:
+        """Delete entries whose key starts with prefix."""
+        pass
+    
+    @abstractmethod
+    def delete_matching(self, pattern: str) -> Set[str]:
+        """Delete entries whose key contains pattern."""
+        pass
+    
+    @abstractmethod
+    def delete_expired(self, max_age: float, now: float) -> Set[str]:
+        """Delete entries that are past their TTL or older than max_age."""
+        pass
+    
+    @abstractmethod
+    def stats(self) -> Tuple[int, int]:
+        """Get (entry count, total payload bytes)."""
+        pass
+    
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+        pass
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Single-file SQLite backend.
+    
+    Every entry is a row with its original key, namespace, expiry and
+    value. Prefix and expiry deletes are indexed range deletes instead of
+    directory walks. Legacy ``*.cache`` files found next to the database
+    are removed, since their keys are unknown.
+    
+    Attributes:
+        db_path: Path of the SQLite database file.
+    """
+    
+    def __init__(self, db_path: Path, legacy_dir: Optional[Path] = None) -> None:
+        """Open (and create if needed) the cache database.
+        
+        Args:
+            db_path: Path of the SQLite database file.
+            legacy_dir: Directory with legacy ``*.cache`` files to remove.
+        """
+        self.db_path: Path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path,
+            timeout=30,
+            check_same_thread=False,
+            isolation_level="DEFERRED"
+        )
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA busy_timeout=30000')
+        self._init_schema()
+        if legacy_dir is not None:
+            self._discard_legacy_files(legacy_dir)
+    
+    def _init_schema(self) -> None:
+        with self._lock, self._conn:
+            self._conn.executescript('''
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    hash TEXT PRIMARY KEY,
+                    key TEXT,
+                    namespace TEXT,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL DEFAULT 0,
+                    stored_at REAL NOT NULL,
+                    expires_at REAL
+                );
+                
+                CREATE INDEX IF NOT EXISTS idx_cache_key ON cache_entries(key);
+                CREATE INDEX IF NOT EXISTS idx_cache_namespace ON cache_entries(namespace);
+                CREATE INDEX IF NOT EXISTS idx_cache_stored_at ON cache_entries(stored_at);
+                CREATE INDEX IF NOT EXISTS idx_cache_expires_at ON cache_entries(expires_at);
+                
+                -- Rows without a key cannot be invalidated by prefix
+                DELETE FROM cache_entries WHERE key IS NULL;
+            ''')
+    
+    def _discard_legacy_files(self, cache_dir: Path) -> int:
+        """Delete legacy ``<sha256>.cache`` files.
+        
+        Their original keys are unknown, so imported rows could never be
+        matched by prefix invalidation. They are only cache and are dropped.
+        """
+        removed = 0
+        for cache_file in cache_dir.glob("*.cache"):
+            try:
+                cache_file.unlink()
+                removed += 1
+            except OSError:
+                continue
+        if removed:
+            debug(f"[Cache] Removed {removed} legacy cache files")
+        return removed
+    
+    def _delete_where(self, where: str, params: tuple) -> Set[str]:
+        with self._lock, self._conn:
+            rows = self._conn.execute(f'SELECT hash FROM cache_entries WHERE {where}', params).fetchall()
+            if rows:
+                self._conn.execute(f'DELETE FROM cache_entries WHERE {where}', params)
+        return {row[0] for row in rows}
+    
+    def get(self, key: str) -> Optional[StoredEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value, stored_at, expires_at, size FROM cache_entries WHERE hash = ?',
+                (_hash_key(key),)
+            ).fetchone()
+        if row is None:
+            return None
+        return StoredEntry(row[0], row[1], row[2], row[3])
+    
+    def set(self, key: str, entry: StoredEntry) -> None:
+        with self._lock, self._conn:
+            self._conn.execute('''
+                INSERT OR REPLACE INTO cache_entries
+                (hash, key, namespace, value, size, stored_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                _hash_key(key), key, _namespace_of(key), entry.payload,
+                entry.size, entry.stored_at, entry.expires_at
+            ))
+    
+    def delete(self, key: str) -> bool:
+        return bool(self._delete_where('hash = ?', (_hash_key(key),)))
+    
+    def clear(self) -> Set[str]:
+        return self._delete_where('1 = 1', ())
+    
+    def delete_prefix(self, prefix: str) -> Set[str]:
+        if not prefix:
+            return self.clear()
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return self._delete_where('key >= ? AND key < ?', (prefix, upper))
+    
+    def delete_matching(self, pattern: str) -> Set[str]:
+        return self._delete_where('instr(key, ?) > 0', (pattern,))
+    
+    def delete_expired(self, max_age: float, now: float) -> Set[str]:
+        return self._delete_where(
+            '(expires_at IS NOT NULL AND expires_at <= ?) OR (expires_at IS NULL AND stored_at < ?)',
+            (now, now - max_age)
+        )
+    
+    def stats(self) -> Tuple[int, int]:
+        with self._lock:
+            row = self._conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries').fetchone()
+        return row[0], row[1]
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class FileCacheBackend(CacheBackend):
+    """Legacy backend storing one ``<sha256>.cache`` JSON file per entry.
+    
+    Original keys are kept in an append-only manifest (``manifest.jsonl``)
+    mapping each hash to its key and expiry, so prefix and pattern deletes
+    only touch matching files. Files without a manifest entry (written by
+    older versions) are left to ``delete_expired``.
+    
+    Attributes:
+        cache_dir: Directory holding the cache files.
+    """
+    
+    MANIFEST_NAME = "manifest.jsonl"
+    
     def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir: Path = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path: Path = cache_dir / self.MANIFEST_NAME
+        self._lock = threading.Lock()
+        self._manifest: Optional[Dict[str, Tuple[str, Optional[float]]]] = None
+    
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{_hash_key(key)}.cache"
+    
+    def _index(self) -> Dict[str, Tuple[str, Optional[float]]]:
+        """Load the manifest by replaying it. Caller must hold the lock."""
+        if self._manifest is None:
+            self._manifest = {}
+            try:
+                lines = self.manifest_path.read_text(encoding='utf-8').splitlines()
+            except OSError:
+                lines = []
+            for line in lines:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("deleted"):
+                    self._manifest.pop(record["hash"], None)
+                else:
+                    self._manifest[record["hash"]] = (record["key"], record.get("expires_at"))
+        return self._manifest
+    
+    def _append(self, record: Dict[str, Any]) -> None:
+        try:
+            with open(self.manifest_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError:
+            pass
+    
+    def _compact(self) -> None:
+        """Rewrite the manifest with only live entries. Caller must hold the lock."""
+        lines = [
+            json.dumps({"hash": h, "key": k, "expires_at": exp}, ensure_ascii=False)
+            for h, (k, exp) in self._index().items()
+        ]
+        tmp = self.manifest_path.with_suffix(".tmp")
+        try:
+            tmp.write_text("".join(line + "\n" for line in lines), encoding='utf-8')
+            tmp.replace(self.manifest_path)
+        except OSError:
+            pass
+    
+    def _delete_hashes(self, hashes: List[str]) -> Set[str]:
+        """Delete files and manifest entries. Caller must hold the lock."""
+        index = self._index()
+        removed = set()
+        for cache_hash in hashes:
+            cache_file = self.cache_dir / f"{cache_hash}.cache"
+            if cache_file.exists():
+                cache_file.unlink(missing_ok=True)
+                removed.add(cache_hash)
+            index.pop(cache_hash, None)
+        if hashes:
+            self._compact()
+        return removed
+    
+    def get(self, key: str) -> Optional[StoredEntry]:
+        cache_file = self._path(key)
+        try:
+            stat = cache_file.stat()
+            payload = cache_file.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+        except (OSError, UnicodeDecodeError):
+            cache_file.unlink(missing_ok=True)
+            return None
+        with self._lock:
+            meta = self._index().get(cache_file.stem)
+        expires_at = meta[1] if meta else None
+        return StoredEntry(payload, stat.st_mtime, expires_at, stat.st_size)
+    
+    def set(self, key: str, entry: StoredEntry) -> None:
+        cache_hash = _hash_key(key)
+        try:
+            (self.cache_dir / f"{cache_hash}.cache").write_text(entry.payload, encoding='utf-8')
+        except OSError:
+            return
+        with self._lock:
+            index = self._index()
+            if index.get(cache_hash) != (key, entry.expires_at):
+                index[cache_hash] = (key, entry.expires_at)
+                self._append({"hash": cache_hash, "key": key, "expires_at": entry.expires_at})
+    
+    def delete(self, key: str) -> bool:
+        cache_hash = _hash_key(key)
+        cache_file = self.cache_dir / f"{cache_hash}.cache"
+        existed = cache_file.exists()
+        cache_file.unlink(missing_ok=True)
+        with self._lock:
+            if self._index().pop(cache_hash, None) is not None:
+                self._append({"hash": cache_hash, "deleted": True})
+        return existed
+    
+    def clear(self) -> Set[str]:
+        with self._lock:
+            removed = set()
+            for cache_file in self.cache_dir.glob("*.cache"):
+                cache_file.unlink(missing_ok=True)
+                removed.add(cache_file.stem)
+            self._manifest = {}
+            self.manifest_path.unlink(missing_ok=True)
+        return removed
+    
+    def delete_prefix(self, prefix: str) -> Set[str]:
+        with self._lock:
+            hashes = [h for h, (k, _) in self._index().items() if k.startswith(prefix)]
+            return self._delete_hashes(hashes)
+    
+    def delete_matching(self, pattern: str) -> Set[str]:
+        with self._lock:
+            hashes = [h for h, (k, _) in self._index().items() if pattern in k]
+            return self._delete_hashes(hashes)
+    
+    def delete_expired(self, max_age: float, now: float) -> Set[str]:
+        cutoff = now - max_age
+        with self._lock:
+            index = self._index()
+            hashes = []
+            for cache_file in self.cache_dir.glob("*.cache"):
+                meta = index.get(cache_file.stem)
+                expires_at = meta[1] if meta else None
+                try:
+                    mtime = cache_file.stat().st_mtime
+                except OSError:
+                    continue
+                if (expires_at is not None and expires_at <= now) or (expires_at is None and mtime < cutoff):
+                    hashes.append(cache_file.stem)
+            return self._delete_hashes(hashes)
+    
+    def stats(self) -> Tuple[int, int]:
+        count = 0
+        total = 0
+        for cache_file in self.cache_dir.glob("*.cache"):
+            count += 1
+            total += cache_file.stat().st_size
+        return count, total
+
+
+class _Flight:
+    """Result slot shared by callers waiting on the same load."""
+    
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class CacheManager:
+    """Two-tier cache manager with memory and persistent storage.
+    
+    Provides fast memory cache with a persistent backend behind it.
+    Automatically handles cache expiration based on TTL (time-to-live).
+    The memory tier is an LRU bounded by entry count and approximate byte
+    size, so long-running processes do not grow without limit.
+    
+    Attributes:
+        cache_dir: Directory for persistent cache storage.
+        backend: Persistent storage backend.
+        max_memory_entries: Maximum number of entries kept in memory.
+        max_memory_bytes: Maximum approximate size of the memory tier.
+        _memory_cache: In-memory LRU of MemoryEntry objects.
+    """
+    
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_memory_entries: int = DEFAULT_MAX_MEMORY_ENTRIES,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+        backend: Optional[CacheBackend] = None
+    ) -> None:
         """Initialize cache manager.
         
         Args:
-            cache_dir: Directory path for storing cache files.
+            cache_dir: Directory path for persistent cache storage.
+            max_memory_entries: Maximum number of in-memory entries.
+            max_memory_bytes: Maximum approximate in-memory size in bytes.
+            backend: Persistent backend. Defaults to a SQLiteCacheBackend
+                in ``cache_dir``; legacy ``*.cache`` files there are removed
+                on first use, since they do not store their keys.
         """
         self.cache_dir: Path = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self._memory_cache: Dict[str, Tuple[Any, float]] = {}
+        self.backend: CacheBackend = backend or SQLiteCacheBackend(
+            cache_dir / CACHE_DB_NAME, legacy_dir=cache_dir
+        )
+        self.max_memory_entries: int = max_memory_entries
+        self.max_memory_bytes: int = max_memory_bytes
+        self._memory_cache: "OrderedDict[str, MemoryEntry]" = OrderedDict()
+        self._memory_bytes: int = 0
+        self._lock = threading.RLock()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._inflight: Dict[str, _Flight] = {}
+    
+    def _memory_put(self, key: str, entry: MemoryEntry) -> None:
+        """Insert an entry into the memory tier and enforce its limits."""
+        with self._lock:
+            self._memory_pop(key)
+            self._memory_cache[key] = entry
+            self._memory_bytes += entry.size
+            while self._memory_cache and (
+                len(self._memory_cache) > self.max_memory_entries
+                or self._memory_bytes > self.max_memory_bytes
+            ):
+                _, evicted = self._memory_cache.popitem(last=False)
+                self._memory_bytes -= evicted.size
+                self._evictions += 1
+    
+    def _memory_pop(self, key: str) -> Optional[MemoryEntry]:
+        """Remove an entry from the memory tier without counting an eviction."""
+        with self._lock:
+            entry = self._memory_cache.pop(key, None)
+            if entry is not None:
+                self._memory_bytes -= entry.size
+            return entry
+    
+    def _memory_remove(self, predicate: Callable[[str, MemoryEntry], bool]) -> Set[str]:
+        """Remove memory entries matching predicate and return their hashes."""
+        with self._lock:
+            keys = [k for k, entry in self._memory_cache.items() if predicate(k, entry)]
+            for key in keys:
+                self._memory_pop(key)
+        return {_hash_key(k) for k in keys}
     
     def _get_cache_key(self, key: str) -> str:
         """Generate SHA256 hash for cache key.
@@ -77,13 +568,13 @@ class CacheManager:
         Returns:
             Hexadecimal hash string.
         """
-        return hashlib.sha256(key.encode()).hexdigest()
+        return _hash_key(key)
     
     def get(self, key: str, max_age: int = 3600) -> Optional[Any]:
         """Retrieve cached value if not expired.
         
-        Checks memory cache first, then file cache. Automatically removes
-        expired entries.
+        Checks memory cache first, then the persistent backend. Entries
+        stored with a ttl use it instead of max_age.
         
         Args:
             key: Cache key.
@@ -96,80 +587,196 @@ class CacheManager:
             >>> cache.get("search:naruto", max_age=1800)
             [{'id': '1', 'title': 'Naruto'}]
         """
-        # Check memory cache
-        if key in self._memory_cache:
-            value, timestamp = self._memory_cache[key]
-            if time.time() - timestamp < max_age:
-                return value
-            else:
-                del self._memory_cache[key]
+        entry = self._lookup(key, max_age)
+        return entry.value if entry is not None else None
+    
+    def _lookup(self, key: str, max_age: float, grace: float = 0) -> Optional[MemoryEntry]:
+        """Find an entry in memory or the backend, promoting backend hits.
         
-        # Check file cache
-        cache_key = self._get_cache_key(key)
-        cache_file = self.cache_dir / f"{cache_key}.cache"
+        Args:
+            key: Cache key.
+            max_age: Maximum age in seconds for entries without a ttl.
+            grace: Extra seconds past expiry that are still returned.
         
-        if cache_file.exists():
-            age = time.time() - cache_file.stat().st_mtime
-            if age < max_age:
-                try:
-                    with open(cache_file, 'r', encoding='utf-8') as f:
-                        value = json.load(f)
-                        self._memory_cache[key] = (value, time.time())
-                        return value
-                except (json.JSONDecodeError, UnicodeDecodeError, OSError):
-                    cache_file.unlink(missing_ok=True)
+        Returns:
+            The memory entry, or None on a miss.
+        """
+        now = time.time()
         
+        # Check memory cache
+        with self._lock:
+            entry = self._memory_cache.get(key)
+            if entry is not None:
+                if entry.is_fresh(max_age, now, grace):
+                    self._memory_cache.move_to_end(key)
+                    self._hits += 1
+                    return entry
+                self._memory_pop(key)
+        
+        # Check persistent cache
+        stored = self.backend.get(key)
+        if stored is not None and stored.is_fresh(max_age, now, grace):
+            try:
+                value = json.loads(stored.payload)
+            except (json.JSONDecodeError, TypeError):
+                self.backend.delete(key)
+            else:
+                ttl = stored.expires_at - stored.stored_at if stored.expires_at is not None else None
+                entry = MemoryEntry(value, stored.stored_at, ttl, stored.size)
+                self._memory_put(key, entry)
+                with self._lock:
+                    self._hits += 1
+                return entry
+        
+        with self._lock:
+            self._misses += 1
         return None
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Store value in cache.
         
-        Stores in both memory and file cache for persistence.
+        Stores in both memory and the persistent backend.
         
         Args:
             key: Cache key.
             value: Value to cache (must be JSON-serializable).
-            ttl: Optional time-to-live in seconds. Used as max_age hint
-                 when retrieving. Stored alongside the value for reference.
+            ttl: Optional time-to-live in seconds. Stored with the value and
+                 takes precedence over the caller's max_age on reads.
         
         Example:
             >>> cache.set("search:naruto", results)
             >>> cache.set("mal_id:one_piece", 21, ttl=86400 * 7)
         """
-        self._memory_cache[key] = (value, time.time())
+        now = time.time()
+        try:
+            payload = json.dumps(value, ensure_ascii=False, default=str)
+        except (TypeError, ValueError):
+            payload = None
         
-        cache_key = self._get_cache_key(key)
-        cache_file = self.cache_dir / f"{cache_key}.cache"
+        size = len(payload.encode('utf-8')) if payload is not None else 0
+        self._memory_put(key, MemoryEntry(value, now, ttl, size))
         
+        if payload is None:
+            return
+        
+        expires_at = now + ttl if ttl is not None else None
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(value, f, ensure_ascii=False, default=str)
-        except (OSError, TypeError):
-            pass
+            self.backend.set(key, StoredEntry(payload, now, expires_at, size))
+        except sqlite3.Error as e:
+            debug(f"[Cache] Failed to persist {key[:80]}: {e}")
+    
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        max_age: int = 3600,
+        stale_ttl: Optional[int] = None,
+        ttl: Optional[int] = None,
+        cache_if: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """Return a cached value, loading it at most once per key.
+        
+        Entries younger than max_age are returned directly. With stale_ttl,
+        entries up to stale_ttl seconds past max_age are returned
+        immediately while a single background refresh reloads them. On a
+        miss, concurrent callers for the same key wait for one loader call
+        instead of each hitting the upstream. None results are not cached.
+        
+        Args:
+            key: Cache key.
+            loader: Zero-argument callable producing the value.
+            max_age: Soft TTL in seconds; fresh entries skip the loader.
+            stale_ttl: Extra seconds stale data may be served (hard TTL is
+                max_age + stale_ttl). None disables stale serving.
+            ttl: Optional per-key ttl passed to set() for loaded values.
+            cache_if: Optional predicate; loaded values it rejects are
+                returned but not stored (e.g. ``bool`` to skip empty lists).
+        
+        Returns:
+            Cached or freshly loaded value.
+        
+        Raises:
+            Exception: Whatever loader raised, for the caller that ran it
+                and every caller waiting on the same key.
+        
+        Example:
+            >>> cache.get_or_load(
+            ...     "details:animecix:123",
+            ...     lambda: fetch_details("123"),
+            ...     max_age=3600,
+            ...     stale_ttl=86400
+            ... )
+        """
+        entry = self._lookup(key, max_age, stale_ttl or 0)
+        if entry is not None:
+            if stale_ttl and not entry.is_fresh(max_age, time.time()):
+                self._refresh_in_background(key, loader, ttl, cache_if)
+            return entry.value
+        return self._load(key, loader, ttl, cache_if)
+    
+    def _load(self, key: str, loader: Callable[[], Any], ttl: Optional[int],
+              cache_if: Optional[Callable[[Any], bool]] = None) -> Any:
+        """Run loader for key, or wait for the call already in flight."""
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+        
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        
+        try:
+            flight.value = loader()
+            if flight.value is not None and (cache_if is None or cache_if(flight.value)):
+                self.set(key, flight.value, ttl=ttl)
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+        return flight.value
+    
+    def _refresh_in_background(self, key: str, loader: Callable[[], Any], ttl: Optional[int],
+                               cache_if: Optional[Callable[[Any], bool]] = None) -> None:
+        """Start one background reload for a stale key."""
+        with self._lock:
+            if key in self._inflight:
+                return
+        
+        def refresh():
+            try:
+                self._load(key, loader, ttl, cache_if)
+            except Exception as e:
+                debug(f"[Cache] Background refresh failed for {key[:80]}: {e}")
+        
+        threading.Thread(target=refresh, daemon=True).start()
     
     def delete(self, key: str) -> None:
         """Delete cached value.
         
-        Removes from both memory and file cache.
+        Removes from both memory and the persistent backend.
         
         Args:
             key: Cache key to delete.
         """
-        self._memory_cache.pop(key, None)
-        
-        cache_key = self._get_cache_key(key)
-        cache_file = self.cache_dir / f"{cache_key}.cache"
-        cache_file.unlink(missing_ok=True)
+        self._memory_pop(key)
+        self.backend.delete(key)
     
     def clear(self) -> None:
         """Clear all cached values.
         
-        Removes all entries from memory and deletes all cache files.
+        Removes all entries from memory and the persistent backend.
         """
-        self._memory_cache.clear()
-        
-        for cache_file in self.cache_dir.glob("*.cache"):
-            cache_file.unlink(missing_ok=True)
+        with self._lock:
+            self._memory_cache.clear()
+            self._memory_bytes = 0
+        self.backend.clear()
     
     def clear_pattern(self, pattern: str) -> int:
         """Clear cached values matching a pattern.
@@ -184,21 +791,36 @@ class CacheManager:
             >>> count = cache.clear_pattern("search:animecix:")
             >>> print(f"Removed {count} entries")
         """
-        removed = 0
-        keys_to_remove = [k for k in self._memory_cache.keys() if pattern in k]
-        for key in keys_to_remove:
-            del self._memory_cache[key]
-            cache_key = self._get_cache_key(key)
-            cache_file = self.cache_dir / f"{cache_key}.cache"
-            cache_file.unlink(missing_ok=True)
-            removed += 1
+        removed = self._memory_remove(lambda k, _: pattern in k)
+        removed |= self.backend.delete_matching(pattern)
+        return len(removed)
+    
+    def invalidate_prefix(self, *prefixes: str) -> int:
+        """Invalidate all cache entries whose key starts with a prefix.
         
-        return removed
+        Only matching entries are removed, from both memory and the
+        persistent backend.
+        
+        Args:
+            *prefixes: Key prefixes such as ``"skip_times:naruto:"``.
+        
+        Returns:
+            Number of distinct entries removed.
+        
+        Example:
+            >>> cache.invalidate_prefix("skip_times:naruto:")
+        """
+        removed: Set[str] = set()
+        for prefix in prefixes:
+            removed |= self._memory_remove(lambda k, _: k.startswith(prefix))
+            removed |= self.backend.delete_prefix(prefix)
+        return len(removed)
     
     def invalidate_provider(self, provider_name: str) -> int:
         """Invalidate all cache entries for a provider.
         
-        Clears search and details cache for the specified provider.
+        Clears search and details cache for the specified provider. Other
+        providers and other namespaces (AniSkip, MAL IDs) are kept.
         
         Args:
             provider_name: Provider identifier.
@@ -209,25 +831,13 @@ class CacheManager:
         Example:
             >>> cache.invalidate_provider("animecix")
         """
-        removed = 0
-        patterns = [f"search:{provider_name}:", f"details:{provider_name}:"]
-        
-        for pattern in patterns:
-            keys_to_remove = [k for k in list(self._memory_cache.keys()) if k.startswith(pattern)]
-            for key in keys_to_remove:
-                del self._memory_cache[key]
-                removed += 1
-        
-        # Clear all file cache (conservative approach)
-        for cache_file in self.cache_dir.glob("*.cache"):
-            cache_file.unlink(missing_ok=True)
-        
-        return removed
+        return self.invalidate_prefix(f"search:{provider_name}:", f"details:{provider_name}:")
     
     def cleanup(self, max_age: int = 86400) -> int:
         """Remove expired cache entries.
         
-        Removes entries older than max_age from both memory and file cache.
+        Removes entries past their TTL, or older than max_age when they have
+        none, from both memory and the persistent backend.
         
         Args:
             max_age: Maximum age in seconds (default: 24 hours).
@@ -239,26 +849,10 @@ class CacheManager:
             >>> # Remove entries older than 1 hour
             >>> count = cache.cleanup(max_age=3600)
         """
-        removed = 0
-        cutoff = time.time() - max_age
-        
-        # Clean memory cache
-        keys_to_remove = []
-        for key, (value, timestamp) in list(self._memory_cache.items()):
-            if timestamp < cutoff:
-                keys_to_remove.append(key)
-        
-        for key in keys_to_remove:
-            del self._memory_cache[key]
-            removed += 1
-        
-        # Clean file cache
-        for cache_file in self.cache_dir.glob("*.cache"):
-            if cache_file.stat().st_mtime < cutoff:
-                cache_file.unlink(missing_ok=True)
-                removed += 1
-        
-        return removed
+        now = time.time()
+        removed = self._memory_remove(lambda _, entry: not entry.is_fresh(max_age, now))
+        removed |= self.backend.delete_expired(max_age, now)
+        return len(removed)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
@@ -266,38 +860,55 @@ class CacheManager:
         Returns:
             Dictionary with cache statistics:
                 - memory_entries: Number of in-memory entries
-                - file_entries: Number of file cache entries
-                - total_size_bytes: Total file cache size in bytes
-                - total_size_mb: Total file cache size in MB
+                - file_entries: Number of persistent cache entries
+                - total_size_bytes: Total persistent cache size in bytes
+                - total_size_mb: Total persistent cache size in MB
+                - memory_size_bytes: Approximate size of the memory tier
+                - hits: Number of lookups served from memory or disk
+                - misses: Number of lookups that found nothing
+                - evictions: Number of LRU evictions from memory
+                - hit_rate: Fraction of lookups that were hits
         
         Example:
             >>> stats = cache.get_stats()
             >>> print(f"Cache size: {stats['total_size_mb']} MB")
         """
-        memory_count = len(self._memory_cache)
-        file_count = len(list(self.cache_dir.glob("*.cache")))
+        with self._lock:
+            memory_count = len(self._memory_cache)
+            memory_bytes = self._memory_bytes
+            hits, misses, evictions = self._hits, self._misses, self._evictions
         
-        total_size = 0
-        for cache_file in self.cache_dir.glob("*.cache"):
-            total_size += cache_file.stat().st_size
+        file_count, total_size = self.backend.stats()
         
         return {
             "memory_entries": memory_count,
             "file_entries": file_count,
             "total_size_bytes": total_size,
-            "total_size_mb": round(total_size / (1024 * 1024), 2)
+            "total_size_mb": round(total_size / (1024 * 1024), 2),
+            "memory_size_bytes": memory_bytes,
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0
         }
 
 
-def cached(max_age: int = 3600, cache_manager: Optional[CacheManager] = None):
+def cached(
+    max_age: int = 3600,
+    cache_manager: Optional[CacheManager] = None,
+    stale_ttl: Optional[int] = None
+):
     """Decorator for automatic function result caching.
     
     Caches function results based on arguments. Cache key is generated
-    from function name and arguments.
+    from function name and arguments. Concurrent calls with the same
+    arguments share a single execution.
     
     Args:
         max_age: Cache TTL in seconds (default: 1 hour).
         cache_manager: Optional custom cache manager instance.
+        stale_ttl: Optional seconds past max_age during which the stale
+            result is returned while it is refreshed in the background.
     
     Returns:
         Decorator function.
@@ -324,16 +935,12 @@ def cached(max_age: int = 3600, cache_manager: Optional[CacheManager] = None):
             cache_key = ":".join(key_parts)
             
             cm = cache_manager or _get_global_cache()
-            
-            # Try to get from cache
-            result = cm.get(cache_key, max_age)
-            if result is not None:
-                return result
-            
-            # Execute function and cache result
-            result = func(*args, **kwargs)
-            cm.set(cache_key, result)
-            return result
+            return cm.get_or_load(
+                cache_key,
+                lambda: func(*args, **kwargs),
+                max_age=max_age,
+                stale_ttl=stale_ttl
+            )
         
         return wrapper
     return decorator
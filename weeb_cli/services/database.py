@@ -2,14 +2,24 @@ import sqlite3
 import json
 import os
 import threading
+import time
 from pathlib import Path
 from datetime import datetime
 from contextlib import contextmanager
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from queue import Queue, Empty
 
 DB_PATH = Path.home() / ".weeb-cli" / "weeb.db"
 
+# Full-text indexes over library titles. The trigram tokenizer matches any
+# substring of three or more characters, which keeps the old LIKE '%q%'
+# semantics while letting SQLite rank the results (needs SQLite 3.34+).
+FTS_TABLES = {
+    "anime_index_fts": ("anime_index", "title"),
+    "virtual_library_fts": ("virtual_library", "anime_title"),
+}
+FTS_MIN_QUERY = 3
+
 
 class ConnectionPool:
     """Simple connection pool for SQLite database.
@@ -102,6 +112,8 @@ class Database:
         self._initialized: bool = False
         self._pool: Optional[ConnectionPool] = None
         self._lock: threading.RLock = threading.RLock()
+        self._config_writes: int = 0
+        self._fts_available: bool = False
 
     def _ensure_initialized(self) -> None:
         if self._initialized:
@@ -145,6 +157,25 @@ class Database:
                     value TEXT
                 );
                 
+                CREATE TABLE IF NOT EXISTS config_meta (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    version INTEGER NOT NULL DEFAULT 0
+                );
+                INSERT OR IGNORE INTO config_meta (id, version) VALUES (0, 0);
+                
+                CREATE TRIGGER IF NOT EXISTS config_version_insert AFTER INSERT ON config
+                BEGIN UPDATE config_meta SET version = version + 1 WHERE id = 0; END;
+                CREATE TRIGGER IF NOT EXISTS config_version_update AFTER UPDATE ON config
+                BEGIN UPDATE config_meta SET version = version + 1 WHERE id = 0; END;
+                CREATE TRIGGER IF NOT EXISTS config_version_delete AFTER DELETE ON config
+                BEGIN UPDATE config_meta SET version = version + 1 WHERE id = 0; END;
+                
+                CREATE TABLE IF NOT EXISTS library_meta (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    version INTEGER NOT NULL DEFAULT 0
+                );
+                INSERT OR IGNORE INTO library_meta (id, version) VALUES (0, 0);
+                
                 CREATE TABLE IF NOT EXISTS progress (
                     slug TEXT PRIMARY KEY,
                     title TEXT,
@@ -156,6 +187,33 @@ class Database:
                     duration REAL DEFAULT 0
                 );
                 
+                CREATE TABLE IF NOT EXISTS watched_episodes (
+                    slug TEXT NOT NULL,
+                    season INTEGER NOT NULL DEFAULT 1,
+                    episode INTEGER NOT NULL,
+                    watched_at TEXT,
+                    PRIMARY KEY (slug, season, episode)
+                );
+                
+                CREATE TABLE IF NOT EXISTS tracker_outbox (
+                    tracker TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    episode INTEGER NOT NULL,
+                    total INTEGER,
+                    queued_at REAL,
+                    attempts INTEGER DEFAULT 0,
+                    PRIMARY KEY (tracker, title)
+                );
+                
+                CREATE TABLE IF NOT EXISTS tracker_ids (
+                    tracker TEXT NOT NULL,
+                    title_key TEXT NOT NULL,
+                    media_id TEXT NOT NULL,
+                    entry_id TEXT,
+                    resolved_at REAL,
+                    PRIMARY KEY (tracker, title_key)
+                );
+                
                 CREATE TABLE IF NOT EXISTS search_history (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     query TEXT UNIQUE,
@@ -175,7 +233,10 @@ class Database:
                     error TEXT,
                     added_at REAL,
                     retry_count INTEGER DEFAULT 0,
-                    speed TEXT
+                    speed TEXT,
+                    downloaded_bytes INTEGER DEFAULT 0,
+                    segments_done INTEGER DEFAULT 0,
+                    segments_total INTEGER DEFAULT 0
                 );
                 
                 CREATE TABLE IF NOT EXISTS external_drives (
@@ -192,7 +253,27 @@ class Database:
                     source_name TEXT,
                     folder_path TEXT,
                     episode_count INTEGER DEFAULT 0,
-                    indexed_at TEXT
+                    indexed_at TEXT,
+                    slug TEXT
+                );
+                
+                CREATE TABLE IF NOT EXISTS library_folders (
+                    folder_path TEXT PRIMARY KEY,
+                    source_path TEXT,
+                    mtime_ns INTEGER,
+                    entry_count INTEGER,
+                    total_size INTEGER,
+                    scanned_ns INTEGER
+                );
+                
+                CREATE TABLE IF NOT EXISTS library_episodes (
+                    path TEXT PRIMARY KEY,
+                    folder_path TEXT,
+                    filename TEXT,
+                    season INTEGER DEFAULT 1,
+                    number INTEGER DEFAULT 0,
+                    size INTEGER DEFAULT 0,
+                    mtime_ns INTEGER
                 );
                 
                 CREATE TABLE IF NOT EXISTS virtual_library (
@@ -208,14 +289,40 @@ class Database:
                 
                 CREATE INDEX IF NOT EXISTS idx_queue_status ON download_queue(status);
                 CREATE INDEX IF NOT EXISTS idx_progress_slug ON progress(slug);
+                CREATE INDEX IF NOT EXISTS idx_progress_watched_at ON progress(last_watched_at);
+                CREATE INDEX IF NOT EXISTS idx_watched_episodes_at ON watched_episodes(watched_at);
+                CREATE INDEX IF NOT EXISTS idx_tracker_outbox_queued ON tracker_outbox(tracker, queued_at);
                 CREATE INDEX IF NOT EXISTS idx_anime_title ON anime_index(title);
                 CREATE INDEX IF NOT EXISTS idx_anime_source ON anime_index(source_path);
+                CREATE INDEX IF NOT EXISTS idx_anime_folder ON anime_index(folder_path);
+                CREATE INDEX IF NOT EXISTS idx_library_folders_source ON library_folders(source_path);
+                CREATE INDEX IF NOT EXISTS idx_library_episodes_folder ON library_episodes(folder_path);
                 CREATE INDEX IF NOT EXISTS idx_virtual_library_title ON virtual_library(anime_title);
                 CREATE INDEX IF NOT EXISTS idx_virtual_library_provider ON virtual_library(provider_name);
+                CREATE INDEX IF NOT EXISTS idx_virtual_library_item ON virtual_library(anime_id, provider_name);
+                
+                CREATE TRIGGER IF NOT EXISTS library_version_index_insert AFTER INSERT ON anime_index
+                BEGIN UPDATE library_meta SET version = version + 1 WHERE id = 0; END;
+                CREATE TRIGGER IF NOT EXISTS library_version_index_update AFTER UPDATE ON anime_index
+                BEGIN UPDATE library_meta SET version = version + 1 WHERE id = 0; END;
+                CREATE TRIGGER IF NOT EXISTS library_version_index_delete AFTER DELETE ON anime_index
+                BEGIN UPDATE library_meta SET version = version + 1 WHERE id = 0; END;
+                CREATE TRIGGER IF NOT EXISTS library_version_progress_insert AFTER INSERT ON progress
+                BEGIN UPDATE library_meta SET version = version + 1 WHERE id = 0; END;
+                CREATE TRIGGER IF NOT EXISTS library_version_progress_update AFTER UPDATE ON progress
+                BEGIN UPDATE library_meta SET version = version + 1 WHERE id = 0; END;
+                CREATE TRIGGER IF NOT EXISTS library_version_progress_delete AFTER DELETE ON progress
+                BEGIN UPDATE library_meta SET version = version + 1 WHERE id = 0; END;
+                CREATE TRIGGER IF NOT EXISTS library_version_watched_insert AFTER INSERT ON watched_episodes
+                BEGIN UPDATE library_meta SET version = version + 1 WHERE id = 0; END;
+                CREATE TRIGGER IF NOT EXISTS library_version_watched_delete AFTER DELETE ON watched_episodes
+                BEGIN UPDATE library_meta SET version = version + 1 WHERE id = 0; END;
             ''')
             conn.commit()
             
         self._migrate_columns()
+        self._migrate_watched_episodes()
+        self._migrate_fts()
     
     def _migrate_columns(self):
         pool = self._get_pool()
@@ -230,11 +337,108 @@ class Database:
             except sqlite3.OperationalError:
                 conn.execute('ALTER TABLE download_queue ADD COLUMN speed TEXT')
 
+            try:
+                conn.execute('SELECT downloaded_bytes FROM download_queue LIMIT 1')
+            except sqlite3.OperationalError:
+                conn.execute('ALTER TABLE download_queue ADD COLUMN downloaded_bytes INTEGER DEFAULT 0')
+                conn.execute('ALTER TABLE download_queue ADD COLUMN segments_done INTEGER DEFAULT 0')
+                conn.execute('ALTER TABLE download_queue ADD COLUMN segments_total INTEGER DEFAULT 0')
+
             try:
                 conn.execute('SELECT current_time FROM progress LIMIT 1')
             except sqlite3.OperationalError:
                 conn.execute('ALTER TABLE progress ADD COLUMN current_time REAL DEFAULT 0')
                 conn.execute('ALTER TABLE progress ADD COLUMN duration REAL DEFAULT 0')
+
+            try:
+                conn.execute('SELECT slug FROM anime_index LIMIT 1')
+            except sqlite3.OperationalError:
+                conn.execute('ALTER TABLE anime_index ADD COLUMN slug TEXT')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_anime_slug ON anime_index(slug)')
+    
+    def _migrate_watched_episodes(self):
+        """Move the JSON ``progress.completed`` arrays into watched_episodes.
+        
+        Arrays are cleared once copied, so this runs once per row and the
+        column stays only for databases written by older versions.
+        """
+        pool = self._get_pool()
+        with pool.get_connection() as conn:
+            rows = conn.execute(
+                "SELECT slug, completed, last_watched_at FROM progress "
+                "WHERE completed IS NOT NULL AND completed NOT IN ('', '[]')"
+            ).fetchall()
+            for row in rows:
+                try:
+                    episodes = {int(ep) for ep in json.loads(row['completed'])}
+                except (TypeError, ValueError):
+                    episodes = set()
+                conn.executemany(
+                    'INSERT OR IGNORE INTO watched_episodes (slug, season, episode, watched_at) VALUES (?, 1, ?, ?)',
+                    [(row['slug'], ep, row['last_watched_at']) for ep in sorted(episodes)]
+                )
+                conn.execute("UPDATE progress SET completed = '[]' WHERE slug = ?", (row['slug'],))
+    
+    def _migrate_fts(self):
+        """Create the FTS5 shadow tables and the triggers that keep them in sync.
+        
+        Tables are external-content FTS5 indexes, so titles are not stored
+        twice. A table that is created here is rebuilt from its content table
+        once. Without FTS5 or the trigram tokenizer, searches fall back to LIKE.
+        """
+        pool = self._get_pool()
+        with pool.get_connection() as conn:
+            for fts, (table, column) in FTS_TABLES.items():
+                exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts,)
+                ).fetchone()
+                try:
+                    conn.executescript(f'''
+                        CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                            {column}, content='{table}', content_rowid='id', tokenize='trigram'
+                        );
+                        
+                        CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table} BEGIN
+                            INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column});
+                        END;
+                        CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table} BEGIN
+                            INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column});
+                        END;
+                        CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE OF {column} ON {table} BEGIN
+                            INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column});
+                            INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column});
+                        END;
+                    ''')
+                    if not exists:
+                        conn.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+                except sqlite3.OperationalError as e:
+                    from weeb_cli.services.logger import debug
+                    debug(f"[DB] Full-text search unavailable, using LIKE: {e}")
+                    self._fts_available = False
+                    return
+        self._fts_available = True
+    
+    def _search_titles(self, table: str, column: str, query: str, order: str) -> List[Dict[str, Any]]:
+        """Search a title column, ranked by FTS5 when the query allows it.
+        
+        Queries shorter than the trigram length cannot use the index and
+        are answered with LIKE instead.
+        """
+        query = (query or "").strip()
+        fts = f"{table}_fts"
+        with self._conn() as conn:
+            if self._fts_available and len(query) >= FTS_MIN_QUERY:
+                phrase = '"' + query.replace('"', '""') + '"'
+                rows = conn.execute(f'''
+                    SELECT t.* FROM {fts} JOIN {table} t ON t.id = {fts}.rowid
+                    WHERE {fts} MATCH ? ORDER BY {fts}.rank, t.{order}
+                ''', (phrase,)).fetchall()
+            else:
+                rows = conn.execute(
+                    f'SELECT * FROM {table} WHERE {column} LIKE ? ORDER BY {order}',
+                    (f'%{query}%',)
+                ).fetchall()
+            return [dict(row) for row in rows]
     
     def _migrate_from_json(self):
         config_dir = Path.home() / ".weeb-cli"
@@ -311,25 +515,128 @@ class Database:
                 'INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)',
                 (key, json.dumps(value))
             )
+        self._config_writes += 1
+    
+    @property
+    def config_writes(self) -> int:
+        """Number of config writes made through this instance.
+        
+        Lets in-process config caches notice their own writes without a query.
+        """
+        return self._config_writes
+    
+    def get_config_version(self) -> int:
+        """Get the config version counter, bumped by triggers on every change.
+        
+        Unlike :attr:`config_writes` this also sees writes from other processes.
+        """
+        with self._conn() as conn:
+            row = conn.execute('SELECT version FROM config_meta WHERE id = 0').fetchone()
+            return row['version'] if row else 0
+    
+    def get_config_snapshot(self) -> Tuple[int, Dict[str, Any]]:
+        """Get the config version and all values from one consistent read."""
+        with self._conn() as conn:
+            conn.execute('BEGIN')
+            row = conn.execute('SELECT version FROM config_meta WHERE id = 0').fetchone()
+            rows = conn.execute('SELECT key, value FROM config').fetchall()
+        return (row['version'] if row else 0), self._decode_config(rows)
     
     def get_all_config(self):
         with self._conn() as conn:
             rows = conn.execute('SELECT key, value FROM config').fetchall()
-            result = {}
-            for row in rows:
-                try:
-                    result[row['key']] = json.loads(row['value'])
-                except Exception:
-                    result[row['key']] = row['value']
-            return result
+            return self._decode_config(rows)
+    
+    @staticmethod
+    def _decode_config(rows) -> Dict[str, Any]:
+        result = {}
+        for row in rows:
+            try:
+                result[row['key']] = json.loads(row['value'])
+            except Exception:
+                result[row['key']] = row['value']
+        return result
+    
+    def save_progress(self, slug, title, last_watched, total_episodes, completed=None, last_watched_at=None, current_time=0, duration=0):
+        """Write the progress row of an anime.
+        
+        Args:
+            completed: Episode numbers to store as watched, replacing the
+                stored set. None leaves watched episodes untouched.
+        """
+        with self._conn() as conn:
+            conn.execute('''
+                INSERT INTO progress
+                (slug, title, last_watched, total_episodes, last_watched_at, current_time, duration)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(slug) DO UPDATE SET
+                    title = excluded.title,
+                    last_watched = excluded.last_watched,
+                    total_episodes = excluded.total_episodes,
+                    last_watched_at = excluded.last_watched_at,
+                    current_time = excluded.current_time,
+                    duration = excluded.duration
+            ''', (slug, title, last_watched, total_episodes, last_watched_at, current_time, duration))
+            
+            if completed is not None:
+                episodes = sorted({int(ep) for ep in completed})
+                conn.execute(
+                    'DELETE FROM watched_episodes WHERE slug = ? AND season = 1 AND episode NOT IN (SELECT value FROM json_each(?))',
+                    (slug, json.dumps(episodes))
+                )
+                conn.executemany(
+                    'INSERT OR IGNORE INTO watched_episodes (slug, season, episode, watched_at) VALUES (?, 1, ?, ?)',
+                    [(slug, ep, last_watched_at) for ep in episodes]
+                )
     
-    def save_progress(self, slug, title, last_watched, total_episodes, completed, last_watched_at=None, current_time=0, duration=0):
+    def mark_episode_watched(self, slug, episode, title=None, total_episodes=None, season=1, watched_at=None):
+        """Record one watched episode and advance the anime's progress row.
+        
+        Args:
+            slug: Anime slug.
+            episode: Episode number.
+            title: Anime title; kept from the stored row when None.
+            total_episodes: Episode count; kept from the stored row when None or 0.
+            season: Season number.
+            watched_at: ISO timestamp, defaults to now.
+        """
+        watched_at = watched_at or datetime.now().isoformat()
         with self._conn() as conn:
+            conn.execute(
+                'INSERT OR IGNORE INTO watched_episodes (slug, season, episode, watched_at) VALUES (?, ?, ?, ?)',
+                (slug, season, episode, watched_at)
+            )
             conn.execute('''
-                INSERT OR REPLACE INTO progress 
-                (slug, title, last_watched, total_episodes, completed, last_watched_at, current_time, duration)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (slug, title, last_watched, total_episodes, json.dumps(completed), last_watched_at, current_time, duration))
+                INSERT INTO progress (slug, title, last_watched, total_episodes, last_watched_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(slug) DO UPDATE SET
+                    title = COALESCE(?, progress.title),
+                    last_watched = MAX(progress.last_watched, excluded.last_watched),
+                    total_episodes = CASE WHEN excluded.total_episodes > 0
+                        THEN excluded.total_episodes ELSE progress.total_episodes END,
+                    last_watched_at = excluded.last_watched_at
+            ''', (slug, title or slug, episode, total_episodes or 0, watched_at, title))
+    
+    def save_playback_position(self, slug, title, episode, total_episodes, current_time, duration):
+        """Store the resume position without touching watched episodes."""
+        self.save_progress(
+            slug, title, episode, total_episodes,
+            last_watched_at=datetime.now().isoformat(), current_time=current_time, duration=duration
+        )
+    
+    def _watched_lists(self, conn, slug=None) -> Dict[str, List[int]]:
+        if slug is None:
+            rows = conn.execute('SELECT slug, episode FROM watched_episodes ORDER BY slug, episode').fetchall()
+        else:
+            rows = conn.execute(
+                'SELECT slug, episode FROM watched_episodes WHERE slug = ? ORDER BY episode', (slug,)
+            ).fetchall()
+        result: Dict[str, List[int]] = {}
+        for row in rows:
+            episodes = result.setdefault(row['slug'], [])
+            if not episodes or episodes[-1] != row['episode']:
+                episodes.append(row['episode'])
+        return result
     
     def get_progress(self, slug):
         with self._conn() as conn:
@@ -340,7 +647,7 @@ class Database:
                     "title": row['title'],
                     "last_watched": row['last_watched'],
                     "total_episodes": row['total_episodes'],
-                    "completed": json.loads(row['completed'] or '[]'),
+                    "completed": self._watched_lists(conn, slug).get(slug, []),
                     "last_watched_at": row['last_watched_at'],
                     "current_time": row['current_time'] if 'current_time' in row.keys() else 0,
                     "duration": row['duration'] if 'duration' in row.keys() else 0
@@ -350,17 +657,134 @@ class Database:
     def get_all_progress(self):
         with self._conn() as conn:
             rows = conn.execute('SELECT * FROM progress').fetchall()
+            watched = self._watched_lists(conn)
             result = {}
             for row in rows:
                 result[row['slug']] = {
                     "title": row['title'],
                     "last_watched": row['last_watched'],
                     "total_episodes": row['total_episodes'],
-                    "completed": json.loads(row['completed'] or '[]'),
+                    "completed": watched.get(row['slug'], []),
                     "last_watched_at": row['last_watched_at']
                 }
             return result
     
+    def get_watch_stats(self) -> Dict[str, Any]:
+        """Anime and watched-episode counts plus the most recently watched anime."""
+        with self._conn() as conn:
+            total_anime = conn.execute('SELECT COUNT(*) FROM progress').fetchone()[0]
+            total_episodes = conn.execute('SELECT COUNT(*) FROM watched_episodes').fetchone()[0]
+            last = conn.execute(
+                'SELECT slug, title, last_watched, total_episodes, last_watched_at FROM progress '
+                'WHERE last_watched_at IS NOT NULL ORDER BY last_watched_at DESC LIMIT 1'
+            ).fetchone()
+        return {
+            "total_anime": total_anime,
+            "total_episodes": total_episodes,
+            "last_watched": dict(last) if last else None,
+        }
+    
+    def get_progress_summaries(self, status: str) -> List[Dict[str, Any]]:
+        """Progress rows with their watched-episode count, filtered in SQL.
+        
+        Args:
+            status: ``"completed"`` (every episode watched) or
+                ``"in_progress"`` (some watched, or the total is unknown).
+        
+        Returns:
+            Rows with slug, title, last_watched, total_episodes,
+            last_watched_at and watched, most recently watched first.
+        """
+        having = {
+            "completed": "p.total_episodes > 0 AND watched >= p.total_episodes",
+            "in_progress": "watched > 0 AND (p.total_episodes = 0 OR watched < p.total_episodes)",
+        }[status]
+        with self._conn() as conn:
+            rows = conn.execute(f'''
+                SELECT p.slug, p.title, p.last_watched, p.total_episodes, p.last_watched_at,
+                       COUNT(w.episode) AS watched
+                FROM progress p LEFT JOIN watched_episodes w ON w.slug = p.slug
+                GROUP BY p.slug
+                HAVING {having}
+                ORDER BY p.last_watched_at DESC
+            ''').fetchall()
+            return [dict(row) for row in rows]
+    
+    def queue_tracker_update(self, tracker: str, title: str, episode: int,
+                             total: Optional[int] = None, queued_at: Optional[float] = None) -> None:
+        """Queue a tracker update, coalescing with any pending one for the title.
+        
+        Only the highest episode is kept; a known total replaces the stored one.
+        """
+        with self._conn() as conn:
+            conn.execute('''
+                INSERT INTO tracker_outbox (tracker, title, episode, total, queued_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(tracker, title) DO UPDATE SET
+                    episode = MAX(tracker_outbox.episode, excluded.episode),
+                    total = COALESCE(excluded.total, tracker_outbox.total),
+                    queued_at = excluded.queued_at
+            ''', (tracker, title, episode, total, queued_at if queued_at is not None else time.time()))
+    
+    def get_tracker_outbox(self, tracker: str) -> List[Dict[str, Any]]:
+        """Pending updates of a tracker, oldest first."""
+        with self._conn() as conn:
+            rows = conn.execute(
+                'SELECT * FROM tracker_outbox WHERE tracker = ? ORDER BY queued_at, title', (tracker,)
+            ).fetchall()
+            return [dict(row) for row in rows]
+    
+    def count_tracker_outbox(self, tracker: str) -> int:
+        with self._conn() as conn:
+            return conn.execute('SELECT COUNT(*) FROM tracker_outbox WHERE tracker = ?', (tracker,)).fetchone()[0]
+    
+    def complete_tracker_update(self, tracker: str, title: str, episode: int) -> bool:
+        """Remove a synced update unless a newer episode was queued meanwhile.
+        
+        Returns:
+            True if the row was removed.
+        """
+        with self._conn() as conn:
+            cur = conn.execute(
+                'DELETE FROM tracker_outbox WHERE tracker = ? AND title = ? AND episode <= ?',
+                (tracker, title, episode)
+            )
+            return cur.rowcount > 0
+    
+    def fail_tracker_update(self, tracker: str, title: str) -> None:
+        with self._conn() as conn:
+            conn.execute(
+                'UPDATE tracker_outbox SET attempts = attempts + 1 WHERE tracker = ? AND title = ?',
+                (tracker, title)
+            )
+    
+    def get_tracker_id(self, tracker: str, title_key: str) -> Optional[Dict[str, Any]]:
+        """Cached remote IDs of a title on a tracker, or None if unresolved."""
+        with self._conn() as conn:
+            row = conn.execute(
+                'SELECT media_id, entry_id FROM tracker_ids WHERE tracker = ? AND title_key = ?',
+                (tracker, title_key)
+            ).fetchone()
+            return dict(row) if row else None
+    
+    def save_tracker_id(self, tracker: str, title_key: str, media_id: Any,
+                        entry_id: Optional[Any] = None) -> None:
+        """Remember the media ID (and, for Kitsu, the library entry ID) of a title."""
+        with self._conn() as conn:
+            conn.execute('''
+                INSERT INTO tracker_ids (tracker, title_key, media_id, entry_id, resolved_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(tracker, title_key) DO UPDATE SET
+                    media_id = excluded.media_id,
+                    entry_id = excluded.entry_id,
+                    resolved_at = excluded.resolved_at
+            ''', (tracker, title_key, str(media_id), str(entry_id) if entry_id is not None else None, time.time()))
+    
+    def clear_tracker_entries(self, tracker: str) -> None:
+        """Forget per-account library entry IDs, keeping the media IDs."""
+        with self._conn() as conn:
+            conn.execute('UPDATE tracker_ids SET entry_id = NULL WHERE tracker = ?', (tracker,))
+    
     def add_search_history(self, query: str) -> None:
         with self._conn() as conn:
             conn.execute('DELETE FROM search_history WHERE query = ?', (query,))
@@ -392,13 +816,14 @@ class Database:
             
             conn.execute('''
                 INSERT INTO download_queue 
-                (anime_title, episode_number, episode_id, slug, status, progress, eta, added_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                (anime_title, episode_number, episode_id, slug, season, status, progress, eta, added_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
                 item.get('anime_title'),
                 item.get('episode_number'),
                 item.get('episode_id'),
                 item.get('slug'),
+                item.get('season', 1),
                 item.get('status', 'pending'),
                 item.get('progress', 0),
                 item.get('eta', '?'),
@@ -417,6 +842,22 @@ class Database:
             values = list(kwargs.values()) + [episode_id]
             conn.execute(f'UPDATE download_queue SET {sets} WHERE episode_id = ?', values)
     
+    def update_queue_items(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        """Apply updates to several queue items in a single transaction.
+        
+        Args:
+            updates: Mapping of episode_id to the columns to update.
+        """
+        if not updates:
+            return
+        with self._conn() as conn:
+            for episode_id, fields in updates.items():
+                if not fields:
+                    continue
+                sets = ', '.join(f'{k} = ?' for k in fields.keys())
+                values = list(fields.values()) + [episode_id]
+                conn.execute(f'UPDATE download_queue SET {sets} WHERE episode_id = ?', values)
+    
     def clear_completed_queue(self) -> None:
         with self._conn() as conn:
             conn.execute('DELETE FROM download_queue WHERE status NOT IN (?, ?)', ('pending', 'processing'))
@@ -441,34 +882,143 @@ class Database:
         with self._conn() as conn:
             conn.execute('UPDATE external_drives SET name = ? WHERE path = ?', (name, path))
     
-    def index_anime(self, title, source_path, source_name, folder_path, episode_count):
+    def index_anime(self, title, source_path, source_name, folder_path, episode_count, slug=None):
         with self._conn() as conn:
             conn.execute('DELETE FROM anime_index WHERE folder_path = ?', (folder_path,))
             conn.execute('''
-                INSERT INTO anime_index (title, source_path, source_name, folder_path, episode_count, indexed_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (title, source_path, source_name, folder_path, episode_count, datetime.now().isoformat()))
+                INSERT INTO anime_index (title, source_path, source_name, folder_path, episode_count, indexed_at, slug)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (title, source_path, source_name, folder_path, episode_count, datetime.now().isoformat(), slug))
     
     def clear_source_index(self, source_path: str) -> None:
         with self._conn() as conn:
             conn.execute('DELETE FROM anime_index WHERE source_path = ?', (source_path,))
+            conn.execute(
+                'DELETE FROM library_episodes WHERE folder_path IN '
+                '(SELECT folder_path FROM library_folders WHERE source_path = ?)',
+                (source_path,)
+            )
+            conn.execute('DELETE FROM library_folders WHERE source_path = ?', (source_path,))
     
     def get_all_indexed_anime(self) -> List[Dict[str, Any]]:
         with self._conn() as conn:
             rows = conn.execute('SELECT * FROM anime_index ORDER BY title').fetchall()
             return [dict(row) for row in rows]
     
+    def get_library_version(self) -> int:
+        """Version counter bumped by triggers on every anime_index or progress change."""
+        with self._conn() as conn:
+            row = conn.execute('SELECT version FROM library_meta WHERE id = 0').fetchone()
+            return row['version'] if row else 0
+    
+    def fill_anime_slugs(self, slugify) -> int:
+        """Set the slug of indexed anime stored before slugs were recorded.
+        
+        Args:
+            slugify: Callable mapping a title to its progress slug.
+        
+        Returns:
+            Number of rows updated.
+        """
+        with self._conn() as conn:
+            rows = conn.execute('SELECT id, title FROM anime_index WHERE slug IS NULL').fetchall()
+            conn.executemany(
+                'UPDATE anime_index SET slug = ? WHERE id = ?',
+                [(slugify(row['title'] or ''), row['id']) for row in rows]
+            )
+            return len(rows)
+    
+    def get_library_view(self) -> Tuple[int, List[Dict[str, Any]]]:
+        """Indexed anime joined with their watch progress in one query.
+        
+        Returns:
+            Tuple of (library version, rows). Each row is an anime_index row
+            plus ``watched`` (watched episode count) and ``last_watched``.
+        """
+        with self._conn() as conn:
+            version = conn.execute('SELECT version FROM library_meta WHERE id = 0').fetchone()['version']
+            rows = conn.execute('''
+                SELECT a.*, COALESCE(w.watched, 0) AS watched, COALESCE(p.last_watched, 0) AS last_watched
+                FROM anime_index a
+                LEFT JOIN progress p ON p.slug = a.slug
+                LEFT JOIN (
+                    SELECT slug, COUNT(*) AS watched FROM watched_episodes GROUP BY slug
+                ) w ON w.slug = a.slug
+                ORDER BY a.title
+            ''').fetchall()
+        return version, [dict(row) for row in rows]
+    
     def search_indexed_anime(self, query):
+        return self._search_titles('anime_index', 'title', query, 'title')
+    
+    def remove_indexed_anime(self, folder_path: str) -> None:
+        with self._conn() as conn:
+            conn.execute('DELETE FROM anime_index WHERE folder_path = ?', (folder_path,))
+            conn.execute('DELETE FROM library_folders WHERE folder_path = ?', (folder_path,))
+            conn.execute('DELETE FROM library_episodes WHERE folder_path = ?', (folder_path,))
+    
+    def get_folder_episodes(self, folder_path: str) -> List[Dict[str, Any]]:
+        """Get the stored episode files of a library folder, in episode order."""
         with self._conn() as conn:
             rows = conn.execute(
-                'SELECT * FROM anime_index WHERE title LIKE ? ORDER BY title',
-                (f'%{query}%',)
+                'SELECT * FROM library_episodes WHERE folder_path = ? ORDER BY season, number, filename',
+                (folder_path,)
             ).fetchall()
             return [dict(row) for row in rows]
     
-    def remove_indexed_anime(self, folder_path: str) -> None:
+    def replace_folder_episodes(self, folder_path: str, episodes: List[Dict[str, Any]]) -> None:
+        """Replace the stored episode files of a library folder.
+        
+        Args:
+            folder_path: Library folder the files are in.
+            episodes: Dicts with path, filename, season, number, size and
+                mtime_ns.
+        """
         with self._conn() as conn:
-            conn.execute('DELETE FROM anime_index WHERE folder_path = ?', (folder_path,))
+            conn.execute('DELETE FROM library_episodes WHERE folder_path = ?', (folder_path,))
+            conn.executemany('''
+                INSERT OR REPLACE INTO library_episodes
+                (path, folder_path, filename, season, number, size, mtime_ns)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (e["path"], folder_path, e["filename"], e["season"], e["number"], e["size"], e["mtime_ns"])
+                for e in episodes
+            ])
+    
+    def get_folder_signatures(self, source_path: str) -> Dict[str, Dict[str, Any]]:
+        """Get the stored scan signatures of a source's folders, keyed by folder path."""
+        with self._conn() as conn:
+            rows = conn.execute(
+                'SELECT * FROM library_folders WHERE source_path = ?', (source_path,)
+            ).fetchall()
+            return {row["folder_path"]: dict(row) for row in rows}
+    
+    def get_folder_signature(self, folder_path: str) -> Optional[Dict[str, Any]]:
+        with self._conn() as conn:
+            row = conn.execute(
+                'SELECT * FROM library_folders WHERE folder_path = ?', (folder_path,)
+            ).fetchone()
+            return dict(row) if row else None
+    
+    def save_folder_signatures(self, source_path: str, signatures: List[Dict[str, Any]]) -> None:
+        """Store scan signatures for folders of a source in one transaction.
+        
+        Args:
+            source_path: Source the folders belong to.
+            signatures: Dicts with folder_path, mtime_ns, entry_count,
+                total_size and scanned_ns.
+        """
+        if not signatures:
+            return
+        with self._conn() as conn:
+            conn.executemany('''
+                INSERT OR REPLACE INTO library_folders
+                (folder_path, source_path, mtime_ns, entry_count, total_size, scanned_ns)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', [
+                (s["folder_path"], source_path, s["mtime_ns"], s["entry_count"], s["total_size"], s["scanned_ns"])
+                for s in signatures
+            ])
     
     def backup_database(self, backup_path: str) -> bool:
         import shutil
@@ -537,12 +1087,7 @@ class Database:
             return [dict(row) for row in rows]
     
     def search_virtual_library(self, query: str) -> List[Dict[str, Any]]:
-        with self._conn() as conn:
-            rows = conn.execute(
-                'SELECT * FROM virtual_library WHERE anime_title LIKE ? ORDER BY anime_title',
-                (f'%{query}%',)
-            ).fetchall()
-            return [dict(row) for row in rows]
+        return self._search_titles('virtual_library', 'anime_title', query, 'anime_title')
     
     def is_in_virtual_library(self, anime_id: str, provider_name: str) -> bool:
         with self._conn() as conn:
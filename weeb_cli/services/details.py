@@ -1,18 +1,23 @@
 from typing import Optional, Dict
-from weeb_cli.services.scraper import scraper
+from weeb_cli.services.scraper import scraper, provider_bound_loader
 from weeb_cli.services.cache import get_cache
 from weeb_cli.config import config
 
+DETAILS_MAX_AGE = 3600
+DETAILS_STALE_TTL = 86400
+
 
 def get_details(anime_id: str) -> Optional[Dict]:
-    cache = get_cache()
     provider = config.get("scraping_source", "None")
-    cache_key = f"details:{provider}:{anime_id}"
-    
-    cached = cache.get(cache_key, max_age=3600)
-    if cached:
-        return cached
-    
+    return get_cache().get_or_load(
+        f"details:{provider}:{anime_id}",
+        provider_bound_loader(provider, lambda: _fetch_details(anime_id)),
+        max_age=DETAILS_MAX_AGE,
+        stale_ttl=DETAILS_STALE_TTL
+    )
+
+
+def _fetch_details(anime_id: str) -> Optional[Dict]:
     details = scraper.get_details(anime_id)
     if not details:
         return None
@@ -43,5 +48,4 @@ def get_details(anime_id: str) -> Optional[Dict]:
         ]
     }
     
-    cache.set(cache_key, result)
     return result
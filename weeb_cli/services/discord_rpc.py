@@ -1,8 +1,8 @@
 import time
-import requests
 from typing import Optional
 from pypresence import Presence
 from weeb_cli.config import config
+from weeb_cli.services.http_client import http_client
 
 class DiscordRPC:
     def __init__(self):
@@ -45,7 +45,7 @@ class DiscordRPC:
     def _get_anime_image(self, anime_title: str) -> Optional[str]:
         try:
             search_url = f"https://api.jikan.moe/v4/anime?q={anime_title}&limit=1"
-            response = requests.get(search_url, timeout=5)
+            response = http_client.get(search_url, timeout=5)
             
             if response.status_code == 200:
                 data = response.json()
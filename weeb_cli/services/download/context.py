@@ -13,9 +13,15 @@ class DownloadContext:
         output_path: Full path where file should be saved.
         headers: HTTP headers to use for the request.
         item: Queue item metadata (anime title, episode number, etc.).
+        saved_path: File actually written, set by strategies that store the
+            download under a different name than ``output_path``.
+        fetched_bytes: Bytes fetched by this attempt, excluding data resumed
+            from an earlier one; None if the strategy does not track it.
     """
     
     url: str
     output_path: str
     headers: Optional[Dict[str, str]] = None
     item: Optional[dict] = None
+    saved_path: Optional[str] = None
+    fetched_bytes: Optional[int] = None
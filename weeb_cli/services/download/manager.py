@@ -9,7 +9,8 @@ from weeb_cli.services.download.strategies import (
     Aria2Strategy,
     YtdlpStrategy,
     FFmpegStrategy,
-    GenericStrategy
+    GenericStrategy,
+    HLSStrategy
 )
 from weeb_cli.services.logger import debug
 from weeb_cli.exceptions import DownloadError
@@ -24,13 +25,14 @@ class DownloadManager:
     def __init__(self):
         self.strategies: List[DownloadStrategy] = [
             Aria2Strategy(),
+            HLSStrategy(),
             YtdlpStrategy(),
             FFmpegStrategy(),
             GenericStrategy()
         ]
         self.strategies.sort(key=lambda s: s.get_priority())
     
-    def download(self, url: str, output_path: str, item: dict = None) -> None:
+    def download(self, url: str, output_path: str, item: dict = None) -> DownloadContext:
         """Download a file using the best available strategy.
         
         Args:
@@ -38,6 +40,11 @@ class DownloadManager:
             output_path: Path where file should be saved.
             item: Optional queue item metadata for progress tracking.
         
+        Returns:
+            The finished context. ``saved_path`` is set when a strategy
+            changed the file name (e.g. ``.ts`` without ffmpeg), and
+            ``fetched_bytes`` when it tracks the bytes fetched by this attempt.
+        
         Raises:
             DownloadError: If all strategies fail.
         """
@@ -59,7 +66,7 @@ class DownloadManager:
             try:
                 strategy.download(context)
                 debug(f"[DownloadManager] Success with {strategy_name}")
-                return
+                return context
             except Exception as e:
                 last_error = e
                 debug(f"[DownloadManager] {strategy_name} failed: {e}")
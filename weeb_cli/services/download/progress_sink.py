@@ -0,0 +1,170 @@
+"""In-memory progress sink for download strategies.
+
+Strategies report progress many times per second (every received chunk or
+every line of subprocess output). Writing each report straight to SQLite
+turns a single download into hundreds of thousands of write transactions,
+so reports are coalesced here per ``episode_id`` and flushed to
+``download_queue`` in one batched transaction at a fixed interval.
+
+Readers such as ``show_queue_live`` and the REST server can read the live
+state directly from the sink without going through SQLite.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from weeb_cli.config import config
+from weeb_cli.constants import ConfigKey
+from weeb_cli.services.logger import debug
+
+
+class ProgressSink:
+    """Coalescing, rate-limited progress store for queue items.
+    
+    Every report updates the in-memory live state immediately and marks
+    the fields as dirty. A background thread writes all dirty fields to
+    the database every ``interval`` seconds using a single transaction.
+    Final updates (completion, failure) go through :meth:`finish`, which
+    forces a synchronous flush so nothing is lost or overwritten later.
+    
+    Attributes:
+        interval: Seconds between background flushes. Read from config
+            when not given explicitly.
+    """
+    
+    def __init__(self, interval: Optional[float] = None):
+        self._db = None
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._live: Dict[str, Dict[str, Any]] = {}
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+        self._flusher: Optional[threading.Thread] = None
+    
+    @property
+    def db(self):
+        if self._db is None:
+            from weeb_cli.services.database import db
+            self._db = db
+        return self._db
+    
+    @property
+    def interval(self) -> float:
+        if self._interval is None:
+            try:
+                self._interval = float(config.get(ConfigKey.DOWNLOAD_PROGRESS_INTERVAL.value, 1.0))
+            except (TypeError, ValueError):
+                self._interval = 1.0
+        return max(self._interval, 0.05)
+    
+    def report(self, episode_id: str, **fields: Any) -> None:
+        """Record a progress update for a queue item.
+        
+        The update is visible to readers immediately and persisted on the
+        next background flush.
+        
+        Args:
+            episode_id: Queue item identifier.
+            **fields: ``download_queue`` columns to update (progress, eta, speed, ...).
+        """
+        if not episode_id or not fields:
+            return
+        with self._lock:
+            self._live.setdefault(episode_id, {}).update(fields)
+            self._dirty.setdefault(episode_id, {}).update(fields)
+        self._ensure_flusher()
+    
+    def finish(self, episode_id: str, **fields: Any) -> None:
+        """Record a final update for a queue item and flush it synchronously.
+        
+        Pending progress for the item is written in the same transaction as
+        the final fields, and the item is dropped from the live state so a
+        late background flush cannot overwrite the final status.
+        
+        Args:
+            episode_id: Queue item identifier.
+            **fields: Final ``download_queue`` columns (status, error, ...).
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending = self._dirty.pop(episode_id, {})
+                pending.update(fields)
+                self._live.pop(episode_id, None)
+            if pending:
+                self._write({episode_id: pending})
+    
+    def flush(self) -> int:
+        """Write all pending updates to the database in one transaction.
+        
+        Returns:
+            Number of queue items written.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    return 0
+                batch = self._dirty
+                self._dirty = {}
+            self._write(batch)
+        return len(batch)
+    
+    def get(self, episode_id: str) -> Dict[str, Any]:
+        """Get the live progress fields for a queue item."""
+        with self._lock:
+            return dict(self._live.get(episode_id, {}))
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get a copy of the live progress state of all active items."""
+        with self._lock:
+            return {ep_id: dict(fields) for ep_id, fields in self._live.items()}
+    
+    def overlay(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge live progress into queue rows read from the database.
+        
+        Args:
+            items: Queue rows as returned by ``db.get_queue()``.
+        
+        Returns:
+            New list of rows with live fields applied on top.
+        """
+        live = self.snapshot()
+        if not live:
+            return items
+        return [
+            {**item, **live[item.get("episode_id")]} if item.get("episode_id") in live else item
+            for item in items
+        ]
+    
+    def clear(self, episode_id: Optional[str] = None) -> None:
+        """Drop live and pending state without writing it."""
+        with self._lock:
+            if episode_id is None:
+                self._live.clear()
+                self._dirty.clear()
+            else:
+                self._live.pop(episode_id, None)
+                self._dirty.pop(episode_id, None)
+    
+    def _write(self, batch: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            self.db.update_queue_items(batch)
+        except Exception as e:
+            debug(f"[ProgressSink] Flush failed: {e}")
+    
+    def _ensure_flusher(self) -> None:
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        with self._lock:
+            if self._flusher is not None and self._flusher.is_alive():
+                return
+            self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flusher.start()
+    
+    def _flush_loop(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            self.flush()
+
+
+progress_sink = ProgressSink()
@@ -3,25 +3,43 @@
 import time
 import threading
 import shutil
+from collections import deque
+from contextlib import closing
 from pathlib import Path
+from typing import Dict, List, Optional, Set
 
 from weeb_cli.config import config
 from weeb_cli.constants import ConfigKey, DownloadStatus
 from weeb_cli.services.download.manager import DownloadManager
+from weeb_cli.services.download.progress_sink import progress_sink
+from weeb_cli.services.host_scoreboard import host_scoreboard
 from weeb_cli.utils.sanitizer import sanitize_filename
 from weeb_cli.exceptions import DownloadError
 from weeb_cli.services.logger import debug, error as log_error
 from weeb_cli.i18n import i18n
 
+INCOMPLETE_STATUSES = (DownloadStatus.PENDING.value, DownloadStatus.PROCESSING.value)
+
 
 class QueueManager:
-    """Manages download queue with concurrent workers."""
+    """Manages download queue with concurrent workers.
+    
+    Queue state is kept in an in-memory index (episode_id -> item) that is
+    loaded once from ``download_queue`` and written through on every change.
+    A bounded pool of worker threads waits on a condition variable and is
+    woken by ``add_to_queue``, ``retry_failed``, ``start_queue`` and task
+    completion, so every free slot is filled as soon as work is available.
+    """
     
     def __init__(self):
         self._db = None
-        self.lock = threading.Lock()
+        self.lock = threading.RLock()
+        self._cond = threading.Condition(self.lock)
         self.running = False
-        self.worker_thread = None
+        self._workers: List[threading.Thread] = []
+        self._items: Optional[Dict[str, dict]] = None
+        self._pending: deque = deque()
+        self._in_flight: Set[str] = set()
         self.download_manager = DownloadManager()
     
     @property
@@ -33,94 +51,219 @@ class QueueManager:
     
     @property
     def queue(self):
-        return self.db.get_queue()
+        with self.lock:
+            items = [dict(item) for item in self._index().values()]
+        return progress_sink.overlay(items)
+    
+    def _index(self) -> Dict[str, dict]:
+        """Get the in-memory queue index, loading it on first use.
+        
+        Must be called with ``self.lock`` held.
+        """
+        if self._items is None:
+            self._items = {}
+            for row in self.db.get_queue():
+                self._items[row["episode_id"]] = row
+            self._pending = deque(
+                ep_id for ep_id, item in self._items.items()
+                if item["status"] == DownloadStatus.PENDING.value
+            )
+        return self._items
+    
+    def reload(self):
+        """Reload the in-memory index from the database.
+        
+        Useful when another process modified ``download_queue``.
+        """
+        with self._cond:
+            self._items = None
+            self._index()
+            self._cond.notify_all()
+    
+    def _update_item(self, episode_id, **fields):
+        """Write item fields to the database and the index.
+        
+        Must be called with ``self.lock`` held.
+        """
+        self.db.update_queue_item(episode_id, **fields)
+        item = self._index().get(episode_id)
+        if item is not None:
+            item.update(fields)
+    
+    def _finish_item(self, episode_id, **fields):
+        """Record a final status through the progress sink and the index."""
+        live = progress_sink.get(episode_id)
+        progress_sink.finish(episode_id, **fields)
+        with self.lock:
+            item = self._index().get(episode_id)
+            if item is not None:
+                item.update(live)
+                item.update(fields)
+    
+    def _count(self, *statuses):
+        with self.lock:
+            return sum(1 for item in self._index().values() if item["status"] in statuses)
+    
+    def _max_workers(self) -> int:
+        try:
+            return max(1, int(config.get(ConfigKey.MAX_CONCURRENT_DOWNLOADS.value, 3)))
+        except (TypeError, ValueError):
+            return 3
     
     def start_queue(self):
         """Start processing the download queue."""
-        if self.running:
-            return
-        self.running = True
-        if self.worker_thread is None or not self.worker_thread.is_alive():
-            self.worker_thread = threading.Thread(target=self._manage_queue, daemon=True)
-            self.worker_thread.start()
+        with self._cond:
+            self.running = True
+            self._spawn_workers()
+            self._cond.notify_all()
     
     def stop_queue(self):
-        """Stop processing the download queue."""
-        self.running = False
+        """Stop processing the download queue.
+        
+        Downloads already in progress run to completion; no new ones start.
+        """
+        with self._cond:
+            self.running = False
+            self._cond.notify_all()
     
     def is_running(self):
         """Check if queue is currently running."""
-        return self.running and self.worker_thread is not None and self.worker_thread.is_alive()
+        with self.lock:
+            return self.running and any(w.is_alive() for w in self._workers)
+    
+    def _spawn_workers(self):
+        """Top up the worker pool to the configured size.
+        
+        Must be called with ``self.lock`` held.
+        """
+        self._workers = [w for w in self._workers if w.is_alive()]
+        while len(self._workers) < self._max_workers():
+            worker = threading.Thread(target=self._worker_loop, daemon=True)
+            self._workers.append(worker)
+            worker.start()
+    
+    def _claim_next(self):
+        """Claim the next pending item for a worker.
+        
+        Must be called with ``self.lock`` held.
+        
+        Returns:
+            A copy of the claimed item, or None if nothing can start now.
+        """
+        if not self.running or len(self._in_flight) >= self._max_workers():
+            return None
+        
+        index = self._index()
+        while self._pending:
+            ep_id = self._pending.popleft()
+            item = index.get(ep_id)
+            if item is None or item["status"] != DownloadStatus.PENDING.value or ep_id in self._in_flight:
+                continue
+            self._update_item(ep_id, status=DownloadStatus.PROCESSING.value)
+            self._in_flight.add(ep_id)
+            return dict(item)
+        return None
+    
+    def _worker_loop(self):
+        """Run queued downloads until the queue is stopped or drained."""
+        while True:
+            with self._cond:
+                item = self._claim_next()
+                while item is None:
+                    if not self.running:
+                        return
+                    if not self._pending and not self._in_flight:
+                        self.running = False
+                        self._cond.notify_all()
+                        return
+                    self._cond.wait()
+                    item = self._claim_next()
+            
+            try:
+                self._run_task(item)
+            except Exception as e:
+                log_error(f"Download worker error: {e}")
+            finally:
+                with self._cond:
+                    self._in_flight.discard(item["episode_id"])
+                    self._cond.notify_all()
     
     def has_incomplete_downloads(self):
         """Check if there are incomplete downloads."""
-        return any(
-            item["status"] in [DownloadStatus.PENDING.value, DownloadStatus.PROCESSING.value]
-            for item in self.queue
-        )
+        return self._count(*INCOMPLETE_STATUSES) > 0
     
     def get_incomplete_count(self):
         """Get count of incomplete downloads."""
-        return len([
-            item for item in self.queue
-            if item["status"] in [DownloadStatus.PENDING.value, DownloadStatus.PROCESSING.value]
-        ])
+        return self._count(*INCOMPLETE_STATUSES)
     
     def get_pending_count(self):
         """Get count of pending downloads."""
-        return len([item for item in self.queue if item["status"] == DownloadStatus.PENDING.value])
+        return self._count(DownloadStatus.PENDING.value)
     
     def resume_incomplete(self):
         """Resume incomplete downloads."""
-        for item in self.queue:
-            if item["status"] == DownloadStatus.PROCESSING.value:
-                self.db.update_queue_item(item["episode_id"], status=DownloadStatus.PENDING.value)
+        with self.lock:
+            for ep_id, item in self._index().items():
+                if item["status"] == DownloadStatus.PROCESSING.value and ep_id not in self._in_flight:
+                    self._update_item(ep_id, status=DownloadStatus.PENDING.value)
+                    self._pending.append(ep_id)
         self.start_queue()
     
     def cancel_incomplete(self):
         """Cancel all incomplete downloads."""
-        self.db.clear_completed_queue()
-        for item in self.queue:
-            if item["status"] in [DownloadStatus.PENDING.value, DownloadStatus.PROCESSING.value]:
-                self.db.update_queue_item(item["episode_id"], status=DownloadStatus.CANCELLED.value)
+        with self.lock:
+            self.db.clear_completed_queue()
+            index = self._index()
+            for ep_id in [k for k, v in index.items() if v["status"] not in INCOMPLETE_STATUSES]:
+                del index[ep_id]
+            for ep_id, item in index.items():
+                self._update_item(ep_id, status=DownloadStatus.CANCELLED.value)
+            self._pending.clear()
     
     def retry_failed(self):
         """Retry all failed downloads."""
         count = 0
-        for item in self.queue:
-            if item["status"] == DownloadStatus.FAILED.value:
-                self.db.update_queue_item(
-                    item["episode_id"],
-                    status=DownloadStatus.PENDING.value,
-                    progress=0,
-                    error="",
-                    eta="?"
-                )
-                count += 1
+        with self.lock:
+            for ep_id, item in self._index().items():
+                if item["status"] == DownloadStatus.FAILED.value:
+                    self._update_item(
+                        ep_id,
+                        status=DownloadStatus.PENDING.value,
+                        progress=0,
+                        error="",
+                        eta="?"
+                    )
+                    self._pending.append(ep_id)
+                    count += 1
         if count > 0:
             self.start_queue()
         return count
     
     def get_failed_count(self):
         """Get count of failed downloads."""
-        return len([item for item in self.queue if item["status"] == DownloadStatus.FAILED.value])
+        return self._count(DownloadStatus.FAILED.value)
     
     def get_active_count(self):
         """Get count of active downloads."""
-        return len([item for item in self.queue if item["status"] == DownloadStatus.PROCESSING.value])
+        return self._count(DownloadStatus.PROCESSING.value)
     
     def is_downloading(self, slug, episode_id=None):
         """Check if anime/episode is currently downloading."""
-        for item in self.queue:
-            if item["slug"] == slug and item["status"] in [DownloadStatus.PENDING.value, DownloadStatus.PROCESSING.value]:
-                if episode_id is None or item["episode_id"] == episode_id:
-                    return True
+        with self.lock:
+            for item in self._index().values():
+                if item["slug"] == slug and item["status"] in INCOMPLETE_STATUSES:
+                    if episode_id is None or item["episode_id"] == episode_id:
+                        return True
         return False
     
     def add_to_queue(self, anime_title, episodes, slug):
-        """Add episodes to download queue."""
+        """Add episodes to download queue.
+        
+        Wakes idle workers immediately if the queue is running.
+        """
         added = 0
-        with self.lock:
+        with self._cond:
+            index = self._index()
             for ep in episodes:
                 ep_id = ep.get("id")
                 if self.is_downloading(slug, ep_id):
@@ -135,44 +278,28 @@ class QueueManager:
                     "status": DownloadStatus.PENDING.value,
                     "added_at": time.time(),
                     "progress": 0,
-                    "eta": "?"
+                    "eta": "?",
+                    "error": None,
+                    "retry_count": 0,
+                    "speed": None
                 }
                 if self.db.add_to_queue(item):
+                    index.pop(ep_id, None)
+                    index[ep_id] = item
+                    self._pending.append(ep_id)
                     added += 1
+            if added and self.running:
+                self._spawn_workers()
+                self._cond.notify_all()
         return added
     
     def clear_completed(self):
         """Clear completed downloads from queue."""
-        self.db.clear_completed_queue()
-    
-    def _manage_queue(self):
-        """Manage download queue with safety limits."""
-        max_iterations = 86400
-        iteration = 0
-        
-        while self.running and iteration < max_iterations:
-            iteration += 1
-            max_workers = config.get(ConfigKey.MAX_CONCURRENT_DOWNLOADS.value, 3)
-            
-            queue = self.queue
-            active_count = len([x for x in queue if x["status"] == DownloadStatus.PROCESSING.value])
-            pending = [x for x in queue if x["status"] == DownloadStatus.PENDING.value]
-            
-            if active_count < max_workers and pending:
-                to_start = pending[0]
-                self.db.update_queue_item(to_start["episode_id"], status=DownloadStatus.PROCESSING.value)
-                
-                t = threading.Thread(target=self._run_task, args=(to_start,), daemon=True)
-                t.start()
-            
-            if not pending and active_count == 0:
-                self.running = False
-                break
-            
-            time.sleep(1)
-        
-        if iteration >= max_iterations:
-            log_error("Download queue manager reached max iterations, stopping for safety")
+        with self.lock:
+            self.db.clear_completed_queue()
+            index = self._index()
+            for ep_id in [k for k, v in index.items() if v["status"] not in INCOMPLETE_STATUSES]:
+                del index[ep_id]
     
     def _run_task(self, item):
         """Execute a download task with retry logic."""
@@ -186,7 +313,7 @@ class QueueManager:
         
         if not self._check_disk_space():
             error_msg = i18n.t("downloads.disk_full", free="<1GB")
-            self.db.update_queue_item(item["episode_id"], status=DownloadStatus.FAILED.value, error=error_msg, eta="")
+            self._finish_item(item["episode_id"], status=DownloadStatus.FAILED.value, error=error_msg, eta="")
             send_notification(i18n.t("common.error"), f"{item['anime_title']}: {error_msg}")
             return
         
@@ -196,11 +323,11 @@ class QueueManager:
                     delay = self._calculate_backoff(attempt, base_delay)
                     debug(f"Retry attempt {attempt + 1}/{max_retries} after {delay}s")
                     retry_msg = i18n.t("downloads.retrying_status", attempt=attempt + 1, max=max_retries)
-                    self.db.update_queue_item(item["episode_id"], eta=retry_msg)
+                    progress_sink.report(item["episode_id"], eta=retry_msg)
                     time.sleep(delay)
                 
                 self._download_item(item)
-                self.db.update_queue_item(
+                self._finish_item(
                     item["episode_id"],
                     status=DownloadStatus.COMPLETED.value,
                     progress=100,
@@ -214,25 +341,25 @@ class QueueManager:
                 msg = i18n.t("downloads.notification_complete", anime=item['anime_title'], episode=item['episode_number'])
                 send_notification(title, msg)
                 return
-                
+            
             except Exception as e:
                 error_type = self._classify_error(e)
                 handle_download_error(e, item['anime_title'], item['episode_number'])
                 
                 if attempt < max_retries - 1:
-                    if error_type == "permanent":
-                        debug("Permanent error detected, skipping retries")
-                        break
-                    continue
+                    if error_type != "permanent":
+                        continue
+                    debug("Permanent error detected, skipping retries")
                 
-                self.db.update_queue_item(
+                self._finish_item(
                     item["episode_id"],
                     status=DownloadStatus.FAILED.value,
                     error=str(e),
                     eta="",
                     retry_count=attempt + 1
                 )
-                debug(f"Download failed after {max_retries} attempts: {item['anime_title']}")
+                debug(f"Download failed after {attempt + 1} attempts: {item['anime_title']}")
+                return
     
     def _check_disk_space(self):
         """Check if there's enough disk space."""
@@ -304,55 +431,62 @@ class QueueManager:
             
             debug(f"Found {len(links)} stream sources, validating...")
             
-            valid_links = []
-            for link in links:
-                stream_url = link.get("url")
-                if stream_url:
-                    is_valid, error = stream_validator.validate_url(stream_url, timeout=3)
-                    if is_valid:
-                        valid_links.append(link)
-                        debug(f"Valid: {link.get('server', 'unknown')}")
-                    else:
-                        debug(f"Invalid: {link.get('server', 'unknown')} - {error}")
-            
-            if not valid_links:
-                raise DownloadError(i18n.t("downloads.no_valid_streams_found"), code="NO_VALID_STREAMS")
-            
-            debug(f"Found {len(valid_links)}/{len(links)} valid streams, trying each one...")
-            
-            valid_links.sort(key=self._link_quality_score, reverse=True)
+            ranked = host_scoreboard.rank(links, quality_key=self._link_quality_score)
             
+            tried = 0
             last_error = None
-            for idx, link in enumerate(valid_links):
-                stream_url = link.get("url")
-                server_name = link.get("server", "unknown")
-                
-                if not stream_url:
-                    continue
-                
-                debug(f"Trying source {idx + 1}/{len(valid_links)}: {server_name}")
-                
-                try:
-                    self.download_manager.download(stream_url, str(output_path), item)
-                    debug(f"Download successful with source: {server_name}")
-                    return
-                except Exception as e:
-                    last_error = str(e)
-                    log_error(f"Source {server_name} failed: {e}")
-                    if idx < len(valid_links) - 1:
+            with closing(stream_validator.iter_valid(ranked, timeout=3)) as candidates:
+                for link in candidates:
+                    stream_url = link.get("url")
+                    server_name = link.get("server", "unknown")
+                    tried += 1
+                    
+                    debug(f"Trying source {tried}: {server_name}")
+                    
+                    try:
+                        self._download_from(stream_url, server_name, output_path, item)
+                    except Exception as e:
+                        last_error = str(e)
+                        log_error(f"Source {server_name} failed: {e}")
                         debug("Trying next source...")
                         continue
+                    
+                    debug(f"Download successful with source: {server_name}")
+                    return
+            
+            if not tried:
+                raise DownloadError(i18n.t("downloads.no_valid_streams_found"), code="NO_VALID_STREAMS")
             
             raise DownloadError(f"All sources failed. Last error: {last_error}", code="ALL_SOURCES_FAILED")
         
-        stream_url = self._extract_url(stream_data)
+        urls = self._extract_all_urls(stream_data)
         
-        if not stream_url:
+        if not urls:
             log_error(f"Download failed - {i18n.t('downloads.no_stream_url')}")
             raise DownloadError(i18n.t("downloads.no_stream_url"), code="NO_STREAM_URL")
         
+        stream_url, server_name = urls[0]
         debug(f"Stream URL found: {stream_url[:80]}...")
-        self.download_manager.download(stream_url, str(output_path), item)
+        self._download_from(stream_url, server_name, output_path, item)
+    
+    def _download_from(self, stream_url, server_name, output_path, item):
+        """Download one source and record the attempt on the host scoreboard.
+        
+        Throughput only counts bytes fetched by this attempt, so resuming a
+        mostly finished file does not make its host look fast.
+        """
+        started = time.monotonic()
+        try:
+            context = self.download_manager.download(stream_url, str(output_path), item)
+        except Exception:
+            host_scoreboard.record_download(stream_url, server_name, False)
+            raise
+        
+        host_scoreboard.record_download(
+            stream_url, server_name, True,
+            size_bytes=context.fetched_bytes,
+            seconds=time.monotonic() - started
+        )
     
     def _link_quality_score(self, link):
         """Calculate quality score for link sorting."""
@@ -369,13 +503,8 @@ class QueueManager:
             return 1
         return 0
     
-    def _extract_url(self, data):
-        """Extract URL from stream data."""
-        urls = self._extract_all_urls(data)
-        return urls[0][0] if urls else None
-    
     def _extract_all_urls(self, data):
-        """Extract all URLs from stream data with priority."""
+        """Extract all URLs from stream data, best-scoring mirrors first."""
         PRIORITY = ["ALUCARD", "AMATERASU", "SIBNET", "MP4UPLOAD", "UQLOAD"]
         
         results = []
@@ -397,7 +526,9 @@ class QueueManager:
                             return i
                     return 999
                 
-                sorted_sources = sorted(sources, key=get_priority)
+                sorted_sources = host_scoreboard.rank(
+                    sources, tiebreak_key=lambda s: get_priority(s)
+                )
                 
                 for src in sorted_sources:
                     url = src.get("url")
@@ -4,6 +4,7 @@ from weeb_cli.services.download.strategies.base import DownloadStrategy
 from weeb_cli.services.download.strategies.aria2 import Aria2Strategy
 from weeb_cli.services.download.strategies.ytdlp import YtdlpStrategy
 from weeb_cli.services.download.strategies.ffmpeg import FFmpegStrategy
+from weeb_cli.services.download.strategies.hls import HLSStrategy
 from weeb_cli.services.download.strategies.generic import GenericStrategy
 
 __all__ = [
@@ -11,5 +12,6 @@ __all__ = [
     'Aria2Strategy',
     'YtdlpStrategy',
     'FFmpegStrategy',
+    'HLSStrategy',
     'GenericStrategy'
 ]
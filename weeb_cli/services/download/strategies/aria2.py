@@ -1,6 +1,7 @@
 """Aria2 download strategy."""
 
 import re
+import struct
 import subprocess
 import threading
 from pathlib import Path
@@ -9,6 +10,7 @@ from weeb_cli.config import config
 from weeb_cli.constants import ConfigKey
 from weeb_cli.services.download.strategies.base import DownloadStrategy
 from weeb_cli.services.download.context import DownloadContext
+from weeb_cli.services.download.progress_sink import progress_sink
 from weeb_cli.services.dependency_manager import dependency_manager
 from weeb_cli.exceptions import DownloadError
 
@@ -50,6 +52,7 @@ class Aria2Strategy(DownloadStrategy):
             "--console-log-level=warn"
         ]
         
+        resumed = self._resumed_bytes(path)
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
@@ -73,6 +76,40 @@ class Aria2Strategy(DownloadStrategy):
         
         if process.returncode != 0:
             raise DownloadError("Aria2 download failed", code="ARIA2_FAILED")
+        
+        context.fetched_bytes = max(0, self._file_size(path) - resumed)
+    
+    def _resumed_bytes(self, path: Path) -> int:
+        """Bytes aria2 will keep from an earlier run of ``-c``.
+        
+        aria2 preallocates the output, so its size says nothing while a
+        ``.aria2`` control file exists; the completed pieces are counted from
+        the control file's bitfield instead. Without one, aria2 continues
+        from the end of the existing file.
+        """
+        control = path.with_name(path.name + ".aria2")
+        try:
+            data = control.read_bytes()
+        except OSError:
+            return self._file_size(path)
+        
+        try:
+            # Version 0 is written in host byte order, version 1 big-endian
+            order = ">" if data[:2] == b"\x00\x01" else "="
+            offset = 6
+            (hash_len,) = struct.unpack_from(order + "I", data, offset)
+            offset += 4 + hash_len
+            piece_len, total, _, bitfield_len = struct.unpack_from(order + "IQQI", data, offset)
+            offset += 24
+            bitfield = data[offset:offset + bitfield_len]
+        except struct.error:
+            return 0
+        
+        done = 0
+        for i in range(len(bitfield) * 8):
+            if bitfield[i // 8] & (0x80 >> (i % 8)):
+                done += max(0, min(piece_len, total - i * piece_len))
+        return done
     
     def _monitor_progress(self, process, item):
         """Monitor Aria2 progress output."""
@@ -80,8 +117,6 @@ class Aria2Strategy(DownloadStrategy):
             process.wait()
             return
         
-        from weeb_cli.services.database import db
-        
         while True:
             line = process.stdout.readline()
             if not line and process.poll() is not None:
@@ -109,7 +144,7 @@ class Aria2Strategy(DownloadStrategy):
                         updates["speed"] = speed
                     
                     if updates:
-                        db.update_queue_item(item["episode_id"], **updates)
+                        progress_sink.report(item["episode_id"], **updates)
                 except Exception:
                     pass
     
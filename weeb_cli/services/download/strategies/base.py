@@ -1,5 +1,6 @@
 """Base download strategy interface."""
 
+import os
 from abc import ABC, abstractmethod
 from weeb_cli.services.download.context import DownloadContext
 
@@ -43,3 +44,11 @@ class DownloadStrategy(ABC):
             Priority value (0-100, where 0 is highest priority).
         """
         pass
+    
+    @staticmethod
+    def _file_size(path) -> int:
+        """Size of ``path`` in bytes, or 0 if it does not exist."""
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
@@ -7,6 +7,7 @@ from pathlib import Path
 from weeb_cli.i18n import i18n
 from weeb_cli.services.download.strategies.base import DownloadStrategy
 from weeb_cli.services.download.context import DownloadContext
+from weeb_cli.services.download.progress_sink import progress_sink
 from weeb_cli.services.dependency_manager import dependency_manager
 from weeb_cli.exceptions import DownloadError
 
@@ -32,8 +33,7 @@ class FFmpegStrategy(DownloadStrategy):
         
         item = context.item
         if item:
-            from weeb_cli.services.database import db
-            db.update_queue_item(item["episode_id"], eta="...")
+            progress_sink.report(item["episode_id"], eta="...")
         
         cmd = [
             ffmpeg,
@@ -67,6 +67,9 @@ class FFmpegStrategy(DownloadStrategy):
         
         if process.returncode != 0:
             raise DownloadError("FFmpeg download failed", code="FFMPEG_FAILED")
+        
+        # -y rewrites the output from scratch, so all of it was fetched now
+        context.fetched_bytes = self._file_size(context.output_path)
     
     def _monitor_progress(self, process, item):
         """Monitor FFmpeg progress output."""
@@ -74,8 +77,6 @@ class FFmpegStrategy(DownloadStrategy):
             process.wait()
             return
         
-        from weeb_cli.services.database import db
-        
         while True:
             line = process.stdout.readline()
             if not line and process.poll() is not None:
@@ -84,7 +85,7 @@ class FFmpegStrategy(DownloadStrategy):
             if line and "out_time=" in line:
                 time_str = line.split("out_time=")[1].strip()
                 eta_msg = i18n.t("downloads.ffmpeg_progress", time=time_str[:8])
-                db.update_queue_item(item["episode_id"], eta=eta_msg)
+                progress_sink.report(item["episode_id"], eta=eta_msg)
     
     def get_priority(self) -> int:
         """FFmpeg has lower priority than yt-dlp for HLS."""
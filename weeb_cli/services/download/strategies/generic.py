@@ -1,80 +1,287 @@
-"""Generic HTTP download strategy."""
+"""Generic HTTP download strategy.
 
+Used for every non-HLS URL when Aria2 is not available. When the server
+honours byte ranges, the file is split into ranges that are fetched in
+parallel over the shared pooled HTTP client and written into a
+preallocated ``.part`` file. A small JSON range map next to it records
+how far each range got, so a retry only fetches what is still missing.
+Servers without range support get a single streamed request.
+"""
+
+import json
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
 import requests
 
+from weeb_cli.config import config
+from weeb_cli.constants import ConfigKey
 from weeb_cli.services.download.strategies.base import DownloadStrategy
 from weeb_cli.services.download.context import DownloadContext
+from weeb_cli.services.download.progress_sink import progress_sink
+from weeb_cli.services.http_client import http_client
+from weeb_cli.services.logger import debug
 from weeb_cli.exceptions import DownloadError
 
+CHUNK_SIZE = 64 * 1024
+MIN_SPLIT_SIZE = 4 * 1024 * 1024
+RANGE_RETRIES = 3
+MAP_SAVE_INTERVAL = 1.0
+
+
+def _format_speed(speed_bytes: float) -> str:
+    if speed_bytes >= 1024 * 1024:
+        return f"{speed_bytes / (1024*1024):.1f}MB/s"
+    if speed_bytes >= 1024:
+        return f"{speed_bytes / 1024:.1f}KB/s"
+    return f"{speed_bytes:.0f}B/s"
+
+
+class _RangeMap:
+    """Thread-safe range completion map persisted next to the ``.part`` file.
+    
+    Each range is ``[start, end, done]`` with an inclusive ``end`` and
+    ``done`` bytes already written from ``start``.
+    """
+    
+    def __init__(self, path: Path, size: int, ranges: List[List[int]]):
+        self.path = path
+        self.size = size
+        self.ranges = ranges
+        self._lock = threading.Lock()
+        self._saved_at = 0.0
+    
+    @classmethod
+    def load(cls, path: Path, size: int, part_path: Path) -> Optional["_RangeMap"]:
+        """Load a map that matches ``size`` and an intact ``.part`` file."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("size") != size or part_path.stat().st_size != size:
+                return None
+            return cls(path, size, [list(map(int, r)) for r in data["ranges"]])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    @classmethod
+    def create(cls, path: Path, size: int, connections: int) -> "_RangeMap":
+        step = -(-size // connections)
+        ranges = [[start, min(start + step, size) - 1, 0] for start in range(0, size, step)]
+        return cls(path, size, ranges)
+    
+    @property
+    def downloaded(self) -> int:
+        with self._lock:
+            return sum(r[2] for r in self.ranges)
+    
+    def advance(self, index: int, count: int) -> int:
+        """Mark ``count`` more bytes of a range as written; returns the total."""
+        with self._lock:
+            self.ranges[index][2] += count
+            total = sum(r[2] for r in self.ranges)
+            due = time.monotonic() - self._saved_at >= MAP_SAVE_INTERVAL
+        if due:
+            self.save()
+        return total
+    
+    def save(self) -> None:
+        with self._lock:
+            data = json.dumps({"size": self.size, "ranges": self.ranges})
+            self._saved_at = time.monotonic()
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(data, encoding="utf-8")
+            os.replace(tmp, self.path)
+
 
 class GenericStrategy(DownloadStrategy):
     """Generic HTTP download strategy (fallback for all URLs)."""
     
+    def __init__(self, connections: Optional[int] = None):
+        self._connections = connections
+    
+    @property
+    def connections(self) -> int:
+        if self._connections is not None:
+            return max(1, self._connections)
+        try:
+            return max(1, int(config.get(ConfigKey.HTTP_DOWNLOAD_CONNECTIONS.value, 8)))
+        except (TypeError, ValueError):
+            return 8
+    
     def can_handle(self, url: str) -> bool:
         """Generic strategy handles any HTTP(S) URL."""
         return url.startswith(("http://", "https://"))
     
     def download(self, context: DownloadContext) -> None:
-        """Download using requests library."""
+        """Download with parallel range requests, or one stream as fallback."""
         item = context.item
         if item:
-            from weeb_cli.services.database import db
-            db.update_queue_item(item["episode_id"], eta="...")
+            progress_sink.report(item["episode_id"], eta="...")
         
         headers = context.headers or {}
+        output_path = Path(context.output_path)
+        part_path = output_path.with_name(output_path.name + ".part")
         
         try:
-            with requests.get(context.url, stream=True, headers=headers) as r:
-                r.raise_for_status()
-                total = int(r.headers.get('content-length', 0))
-                
-                if total > 0:
-                    self._download_with_progress(r, context.output_path, total, item)
-                else:
-                    self._download_without_progress(r, context.output_path)
+            total, ranged = self._probe(context.url, headers)
+            if ranged and total >= MIN_SPLIT_SIZE and self.connections > 1:
+                try:
+                    context.fetched_bytes = self._download_ranges(context.url, headers, part_path, total, item)
+                except DownloadError as e:
+                    if e.code != "HTTP_RANGE_IGNORED":
+                        raise
+                    # Some signed-URL hosts answer the probe but not later ranges
+                    debug("[Generic] Server stopped honouring ranges, downloading in one stream")
+                    self._discard_partial(part_path)
+                    context.fetched_bytes = self._download_single(context.url, headers, part_path, item)
+            else:
+                context.fetched_bytes = self._download_single(context.url, headers, part_path, item)
         except requests.RequestException as e:
             raise DownloadError(f"HTTP download failed: {e}", code="HTTP_FAILED")
+        
+        os.replace(part_path, output_path)
+        part_path.with_name(part_path.name + ".json").unlink(missing_ok=True)
+    
+    @staticmethod
+    def _discard_partial(part_path: Path) -> None:
+        part_path.unlink(missing_ok=True)
+        part_path.with_name(part_path.name + ".json").unlink(missing_ok=True)
     
-    def _download_with_progress(self, response, output_path, total, item):
-        """Download with progress tracking."""
-        downloaded = 0
-        start_time = time.time()
+    def _probe(self, url: str, headers: Dict[str, str]) -> Tuple[int, bool]:
+        """Get the file size and whether the server honours byte ranges.
+        
+        A one-byte range request is used instead of HEAD because many CDNs
+        reject HEAD; a ``206`` with a ``Content-Range`` total proves range
+        support.
+        """
+        with http_client.get(url, headers={**headers, "Range": "bytes=0-0"}, stream=True) as r:
+            r.raise_for_status()
+            if r.status_code == 206:
+                total = r.headers.get("Content-Range", "").rpartition("/")[2]
+                if total.isdigit():
+                    return int(total), True
+            return int(r.headers.get("content-length", 0) or 0), False
+    
+    def _download_ranges(self, url, headers, part_path: Path, total: int, item) -> int:
+        """Fetch missing ranges concurrently into the preallocated ``.part`` file.
+        
+        Returns:
+            Bytes fetched by this call, not counting resumed ranges.
+        """
+        map_path = part_path.with_name(part_path.name + ".json")
+        range_map = _RangeMap.load(map_path, total, part_path)
+        if range_map is None:
+            range_map = _RangeMap.create(map_path, total, self.connections)
+            with open(part_path, "wb") as f:
+                f.truncate(total)
+            range_map.save()
+        else:
+            debug(f"[Generic] Resuming {range_map.downloaded}/{total} bytes")
+        
+        pending = [i for i, (start, end, done) in enumerate(range_map.ranges) if start + done <= end]
+        resumed = range_map.downloaded
+        start_time = time.monotonic()
         
-        with open(output_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                downloaded += len(chunk)
-                
-                if item:
-                    progress = int((downloaded / total) * 100)
-                    elapsed = time.time() - start_time
+        def on_progress(downloaded: int) -> None:
+            if not item:
+                return
+            elapsed = time.monotonic() - start_time
+            speed = (downloaded - resumed) / elapsed if elapsed > 0 else 0
+            eta_s = (total - downloaded) / speed if speed > 0 else 0
+            progress_sink.report(
+                item["episode_id"],
+                progress=int(downloaded / total * 100),
+                eta=f"{int(eta_s)}s",
+                speed=_format_speed(speed),
+                downloaded_bytes=downloaded
+            )
+        
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.connections, len(pending) or 1),
+                                    thread_name_prefix="http-range") as executor:
+                futures = [
+                    executor.submit(self._fetch_range, url, headers, part_path, range_map, i, on_progress)
+                    for i in pending
+                ]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except Exception:
+                    for f in futures:
+                        f.cancel()
+                    raise
+        finally:
+            range_map.save()
+        return range_map.downloaded - resumed
+    
+    def _fetch_range(self, url, headers, part_path: Path, range_map: _RangeMap, index: int, on_progress) -> None:
+        """Fetch the rest of one range, retrying from where it stopped."""
+        for attempt in range(RANGE_RETRIES):
+            start, end, done = range_map.ranges[index]
+            if start + done > end:
+                return
+            try:
+                self._stream_range(url, headers, part_path, range_map, index, on_progress)
+                return
+            except DownloadError:
+                raise
+            except Exception as e:
+                if attempt == RANGE_RETRIES - 1:
+                    raise
+                debug(f"[Generic] Range {index} failed ({e}), retrying")
+                time.sleep(min(2 ** attempt, 5) * 0.5)
+    
+    def _stream_range(self, url, headers, part_path: Path, range_map: _RangeMap, index: int, on_progress) -> None:
+        start, end, done = range_map.ranges[index]
+        offset = start + done
+        range_headers = {**headers, "Range": f"bytes={offset}-{end}"}
+        
+        with http_client.get(url, headers=range_headers, stream=True) as r:
+            r.raise_for_status()
+            if r.status_code != 206:
+                raise DownloadError("Server ignored range request", code="HTTP_RANGE_IGNORED")
+            with open(part_path, "r+b") as f:
+                f.seek(offset)
+                for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
+                    chunk = chunk[:end + 1 - offset]
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    offset += len(chunk)
+                    on_progress(range_map.advance(index, len(chunk)))
+        
+        if offset <= end:
+            raise requests.ConnectionError(f"Range ended early at {offset}/{end + 1}")
+    
+    def _download_single(self, url, headers, part_path: Path, item) -> int:
+        """Stream the whole file over one connection, returning its size."""
+        with http_client.get(url, headers=headers, stream=True) as r:
+            r.raise_for_status()
+            total = int(r.headers.get('content-length', 0) or 0)
+            downloaded = 0
+            start_time = time.time()
+            
+            with open(part_path, 'wb') as f:
+                for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
+                    f.write(chunk)
+                    downloaded += len(chunk)
                     
-                    if elapsed > 0:
-                        speed_bytes = downloaded / elapsed
-                        remaining = total - downloaded
-                        eta_s = remaining / speed_bytes if speed_bytes > 0 else 0
-                        
-                        if speed_bytes >= 1024 * 1024:
-                            speed_str = f"{speed_bytes / (1024*1024):.1f}MB/s"
-                        elif speed_bytes >= 1024:
-                            speed_str = f"{speed_bytes / 1024:.1f}KB/s"
-                        else:
-                            speed_str = f"{speed_bytes:.0f}B/s"
-                        
-                        from weeb_cli.services.database import db
-                        db.update_queue_item(
-                            item["episode_id"],
-                            progress=progress,
-                            eta=f"{int(eta_s)}s",
-                            speed=speed_str
-                        )
-    
-    def _download_without_progress(self, response, output_path):
-        """Download without progress tracking."""
-        with open(output_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+                    if item and total > 0:
+                        elapsed = time.time() - start_time
+                        if elapsed > 0:
+                            speed_bytes = downloaded / elapsed
+                            eta_s = (total - downloaded) / speed_bytes if speed_bytes > 0 else 0
+                            progress_sink.report(
+                                item["episode_id"],
+                                progress=int((downloaded / total) * 100),
+                                eta=f"{int(eta_s)}s",
+                                speed=_format_speed(speed_bytes),
+                                downloaded_bytes=downloaded
+                            )
+        return downloaded
     
     def get_priority(self) -> int:
         """Generic strategy has lowest priority (last resort)."""
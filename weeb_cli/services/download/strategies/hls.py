@@ -0,0 +1,419 @@
+"""Native segmented HLS download strategy.
+
+Downloads ``.m3u8`` streams without yt-dlp: parses the master and media
+playlists, picks the highest-bandwidth variant, fetches segments
+concurrently over the shared pooled HTTP client, decrypts AES-128
+segments and joins them with a single ffmpeg concat pass.
+
+Segments are written to a work directory next to the output file together
+with a small JSON manifest and an append-only journal of finished segment
+indices, so a retry resumes from the segments that are already on disk
+instead of starting over.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+
+from weeb_cli.config import config
+from weeb_cli.constants import ConfigKey
+from weeb_cli.services.download.strategies.base import DownloadStrategy
+from weeb_cli.services.download.context import DownloadContext
+from weeb_cli.services.download.progress_sink import progress_sink
+from weeb_cli.services.dependency_manager import dependency_manager
+from weeb_cli.services.http_client import http_client
+from weeb_cli.services.logger import debug
+from weeb_cli.exceptions import DownloadError
+
+try:
+    from Crypto.Cipher import AES
+    HAS_CRYPTO = True
+except ImportError:
+    HAS_CRYPTO = False
+
+SEGMENT_RETRIES = 3
+MANIFEST_NAME = "manifest.json"
+JOURNAL_NAME = "done.log"
+
+
+@dataclass
+class HLSKey:
+    """Encryption key declared by ``#EXT-X-KEY``."""
+    
+    method: str
+    uri: Optional[str] = None
+    iv: Optional[bytes] = None
+
+
+@dataclass
+class HLSSegment:
+    """One media segment of a media playlist."""
+    
+    uri: str
+    sequence: int
+    duration: float = 0.0
+    key: Optional[HLSKey] = None
+
+
+@dataclass
+class HLSVariant:
+    """One variant stream of a master playlist."""
+    
+    uri: str
+    bandwidth: int = 0
+    resolution: Optional[str] = None
+
+
+@dataclass
+class MediaPlaylist:
+    """Parsed media playlist."""
+    
+    segments: List[HLSSegment] = field(default_factory=list)
+    init_uri: Optional[str] = None
+
+
+def _parse_attributes(line: str) -> Dict[str, str]:
+    """Parse ``KEY=VALUE,KEY="quoted,value"`` tag attributes."""
+    attrs = {}
+    _, _, rest = line.partition(":")
+    key, value, in_quotes = "", "", False
+    reading_key = True
+    for ch in rest + ",":
+        if reading_key:
+            if ch == "=":
+                reading_key = False
+            else:
+                key += ch
+        elif ch == '"':
+            in_quotes = not in_quotes
+        elif ch == "," and not in_quotes:
+            attrs[key.strip().upper()] = value
+            key, value, reading_key = "", "", True
+        else:
+            value += ch
+    return attrs
+
+
+def is_master_playlist(text: str) -> bool:
+    """Check whether a playlist lists variants instead of segments."""
+    return "#EXT-X-STREAM-INF" in text
+
+
+def parse_master_playlist(text: str, base_url: str) -> List[HLSVariant]:
+    """Parse the variant streams of a master playlist.
+    
+    Args:
+        text: Playlist content.
+        base_url: URL the playlist was loaded from.
+    
+    Returns:
+        Variants with absolute URIs, in playlist order.
+    """
+    variants = []
+    pending = None
+    for raw in text.splitlines():
+        line = raw.strip()
+        if line.startswith("#EXT-X-STREAM-INF"):
+            pending = _parse_attributes(line)
+        elif line and not line.startswith("#") and pending is not None:
+            try:
+                bandwidth = int(pending.get("BANDWIDTH", 0))
+            except ValueError:
+                bandwidth = 0
+            variants.append(HLSVariant(urljoin(base_url, line), bandwidth, pending.get("RESOLUTION")))
+            pending = None
+    return variants
+
+
+def parse_media_playlist(text: str, base_url: str) -> MediaPlaylist:
+    """Parse the segments of a media playlist.
+    
+    Args:
+        text: Playlist content.
+        base_url: URL the playlist was loaded from.
+    
+    Returns:
+        Media playlist with absolute segment URIs and their keys.
+    
+    Raises:
+        DownloadError: If the playlist uses an unsupported encryption method.
+    """
+    playlist = MediaPlaylist()
+    sequence = 0
+    duration = 0.0
+    key: Optional[HLSKey] = None
+    
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        if line.startswith("#EXT-X-MEDIA-SEQUENCE:"):
+            sequence = int(line.split(":", 1)[1])
+        elif line.startswith("#EXTINF:"):
+            try:
+                duration = float(line.split(":", 1)[1].split(",", 1)[0])
+            except ValueError:
+                duration = 0.0
+        elif line.startswith("#EXT-X-KEY"):
+            attrs = _parse_attributes(line)
+            method = attrs.get("METHOD", "NONE").upper()
+            if method == "NONE":
+                key = None
+            elif method == "AES-128":
+                iv = attrs.get("IV")
+                key = HLSKey(
+                    method,
+                    urljoin(base_url, attrs["URI"]) if attrs.get("URI") else None,
+                    bytes.fromhex(iv[2:] if iv.lower().startswith("0x") else iv) if iv else None
+                )
+            else:
+                raise DownloadError(f"Unsupported HLS encryption: {method}", code="HLS_UNSUPPORTED")
+        elif line.startswith("#EXT-X-MAP"):
+            uri = _parse_attributes(line).get("URI")
+            if uri:
+                playlist.init_uri = urljoin(base_url, uri)
+        elif not line.startswith("#"):
+            playlist.segments.append(HLSSegment(urljoin(base_url, line), sequence, duration, key))
+            sequence += 1
+            duration = 0.0
+    
+    return playlist
+
+
+def _format_speed(speed_bytes: float) -> str:
+    if speed_bytes >= 1024 * 1024:
+        return f"{speed_bytes / (1024*1024):.1f}MB/s"
+    if speed_bytes >= 1024:
+        return f"{speed_bytes / 1024:.1f}KB/s"
+    return f"{speed_bytes:.0f}B/s"
+
+
+class HLSStrategy(DownloadStrategy):
+    """Native HLS downloader with parallel segment fetch and resume."""
+    
+    def __init__(self, workers: Optional[int] = None):
+        self._workers = workers
+        self._keys: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def workers(self) -> int:
+        if self._workers is not None:
+            return self._workers
+        try:
+            return max(1, int(config.get(ConfigKey.HLS_SEGMENT_WORKERS.value, 8)))
+        except (TypeError, ValueError):
+            return 8
+    
+    def can_handle(self, url: str) -> bool:
+        """Handles HLS playlists."""
+        return ".m3u8" in url
+    
+    def get_priority(self) -> int:
+        """Native HLS runs before the yt-dlp and FFmpeg subprocess strategies."""
+        return 5
+    
+    def download(self, context: DownloadContext) -> None:
+        """Download an HLS stream into ``context.output_path``."""
+        headers = context.headers or {}
+        item = context.item
+        episode_id = item["episode_id"] if item else None
+        if episode_id:
+            progress_sink.report(episode_id, eta="...")
+        
+        media_url, playlist = self._load_playlist(context.url, headers)
+        if not playlist.segments:
+            raise DownloadError("HLS playlist has no segments", code="HLS_EMPTY")
+        if any(s.key for s in playlist.segments) and not HAS_CRYPTO:
+            raise DownloadError("pycryptodome is required for encrypted HLS", code="HLS_NO_CRYPTO")
+        
+        output_path = Path(context.output_path)
+        work_dir = output_path.with_name(output_path.name + ".hls")
+        done = self._load_manifest(work_dir, media_url, playlist)
+        
+        context.fetched_bytes = self._fetch_segments(work_dir, playlist, done, headers, episode_id)
+        context.saved_path = str(self._join(work_dir, playlist, output_path))
+        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    def _get_text(self, url: str, headers: Dict[str, str]) -> str:
+        resp = http_client.get(url, headers=headers)
+        resp.raise_for_status()
+        return resp.text
+    
+    def _load_playlist(self, url: str, headers: Dict[str, str]):
+        """Resolve a master playlist to its best variant and parse it."""
+        text = self._get_text(url, headers)
+        if is_master_playlist(text):
+            variants = parse_master_playlist(text, url)
+            if not variants:
+                raise DownloadError("HLS master playlist has no variants", code="HLS_EMPTY")
+            best = max(variants, key=lambda v: v.bandwidth)
+            debug(f"[HLS] Selected variant {best.resolution or '?'} @ {best.bandwidth}bps")
+            url = best.uri
+            text = self._get_text(url, headers)
+        return url, parse_media_playlist(text, url)
+    
+    def _load_manifest(self, work_dir: Path, media_url: str, playlist: MediaPlaylist) -> set:
+        """Load finished segment indices, discarding a manifest for another playlist."""
+        manifest_path = work_dir / MANIFEST_NAME
+        uris = [s.uri for s in playlist.segments]
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            manifest = None
+        
+        if manifest and manifest.get("segments") == uris:
+            recorded = set(manifest.get("done", [])) | self._read_journal(work_dir)
+            done = {i for i in recorded if (work_dir / f"{i:05d}.ts").exists()}
+            debug(f"[HLS] Resuming with {len(done)}/{len(uris)} segments on disk")
+            return done
+        
+        shutil.rmtree(work_dir, ignore_errors=True)
+        work_dir.mkdir(parents=True, exist_ok=True)
+        self._write_manifest(work_dir, {"url": media_url, "segments": uris})
+        return set()
+    
+    def _read_journal(self, work_dir: Path) -> set:
+        """Segment indices recorded as finished; a torn last line is ignored."""
+        try:
+            lines = (work_dir / JOURNAL_NAME).read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return set()
+        return {int(line) for line in lines if line.strip().isdigit()}
+    
+    def _write_manifest(self, work_dir: Path, manifest: dict) -> None:
+        tmp = work_dir / (MANIFEST_NAME + ".tmp")
+        tmp.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(tmp, work_dir / MANIFEST_NAME)
+    
+    def _get_key(self, key: HLSKey, headers: Dict[str, str]) -> bytes:
+        """Fetch a decryption key once and share it across segment workers."""
+        with self._lock:
+            cached = self._keys.get(key.uri)
+            if cached is None:
+                cached = self._fetch(key.uri, headers)
+                self._keys[key.uri] = cached
+        return cached
+    
+    def _fetch(self, url: str, headers: Dict[str, str]) -> bytes:
+        last_error = None
+        for attempt in range(SEGMENT_RETRIES):
+            try:
+                resp = http_client.get(url, headers=headers)
+                resp.raise_for_status()
+                return resp.content
+            except Exception as e:
+                last_error = e
+                time.sleep(min(2 ** attempt, 5) * 0.5)
+        raise DownloadError(f"HLS segment failed: {last_error}", code="HLS_SEGMENT_FAILED")
+    
+    def _fetch_segment(self, work_dir: Path, index: int, segment: HLSSegment, headers: Dict[str, str]) -> int:
+        data = self._fetch(segment.uri, headers)
+        if segment.key:
+            iv = segment.key.iv or segment.sequence.to_bytes(16, "big")
+            cipher = AES.new(self._get_key(segment.key, headers), AES.MODE_CBC, iv)
+            data = cipher.decrypt(data)
+            pad = data[-1] if data else 0
+            if 0 < pad <= 16 and data.endswith(bytes([pad]) * pad):
+                data = data[:-pad]
+        
+        target = work_dir / f"{index:05d}.ts"
+        tmp = target.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+        return len(data)
+    
+    def _fetch_segments(self, work_dir, playlist, done, headers, episode_id) -> int:
+        """Fetch the segments not in ``done``, returning the bytes fetched."""
+        total = len(playlist.segments)
+        pending = [i for i in range(total) if i not in done]
+        
+        if playlist.init_uri and not (work_dir / "init.mp4").exists():
+            (work_dir / "init.mp4").write_bytes(self._fetch(playlist.init_uri, headers))
+        
+        downloaded = sum((work_dir / f"{i:05d}.ts").stat().st_size for i in done)
+        fetched_now = 0
+        start = time.monotonic()
+        
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="hls") as executor, \
+                open(work_dir / JOURNAL_NAME, "a", encoding="utf-8", buffering=1) as journal:
+            futures = {
+                executor.submit(self._fetch_segment, work_dir, i, playlist.segments[i], headers): i
+                for i in pending
+            }
+            try:
+                for future in as_completed(futures):
+                    size = future.result()
+                    done.add(futures[future])
+                    downloaded += size
+                    fetched_now += size
+                    journal.write(f"{futures[future]}\n")
+                    
+                    if episode_id:
+                        elapsed = time.monotonic() - start
+                        speed = fetched_now / elapsed if elapsed > 0 else 0
+                        finished_now = len(done) - (total - len(pending))
+                        remaining = total - len(done)
+                        eta_s = elapsed / finished_now * remaining if finished_now else 0
+                        progress_sink.report(
+                            episode_id,
+                            progress=int(len(done) / total * 100),
+                            eta=f"{int(eta_s)}s",
+                            speed=_format_speed(speed),
+                            downloaded_bytes=downloaded,
+                            segments_done=len(done),
+                            segments_total=total
+                        )
+            except Exception:
+                for f in futures:
+                    f.cancel()
+                raise
+        return fetched_now
+    
+    def _join(self, work_dir: Path, playlist: MediaPlaylist, output_path: Path) -> Path:
+        """Join segments into the output file.
+        
+        fMP4 streams (with an init segment) are already valid when joined
+        byte by byte. MPEG-TS segments are remuxed into MP4 with one ffmpeg
+        concat pass. Without ffmpeg they are joined into a ``.ts`` file next
+        to ``output_path``, since a TS stream named ``.mp4`` confuses players.
+        
+        Returns:
+            Path of the file that was written.
+        """
+        parts = [work_dir / f"{i:05d}.ts" for i in range(len(playlist.segments))]
+        init = work_dir / "init.mp4"
+        ffmpeg = None if playlist.init_uri else dependency_manager.check_dependency("ffmpeg")
+        
+        if not ffmpeg:
+            if not playlist.init_uri:
+                output_path = output_path.with_suffix(".ts")
+            with open(output_path, "wb") as out:
+                for part in ([init] if playlist.init_uri else []) + parts:
+                    with open(part, "rb") as src:
+                        shutil.copyfileobj(src, out)
+            return output_path
+        
+        list_file = work_dir / "concat.txt"
+        list_file.write_text(
+            "".join(f"file '{p.as_posix()}'\n" for p in parts), encoding="utf-8"
+        )
+        result = subprocess.run(
+            [
+                ffmpeg, "-f", "concat", "-safe", "0", "-i", str(list_file),
+                "-c", "copy", "-bsf:a", "aac_adtstoasc", "-y", str(output_path)
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        if result.returncode != 0:
+            raise DownloadError("FFmpeg remux failed", code="FFMPEG_FAILED")
+        return output_path
@@ -9,6 +9,7 @@ from weeb_cli.config import config
 from weeb_cli.constants import ConfigKey
 from weeb_cli.services.download.strategies.base import DownloadStrategy
 from weeb_cli.services.download.context import DownloadContext
+from weeb_cli.services.download.progress_sink import progress_sink
 from weeb_cli.services.dependency_manager import dependency_manager
 from weeb_cli.exceptions import DownloadError
 
@@ -45,6 +46,7 @@ class YtdlpStrategy(DownloadStrategy):
             context.url
         ]
         
+        resumed = self._file_size(context.output_path)
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
@@ -68,6 +70,8 @@ class YtdlpStrategy(DownloadStrategy):
         
         if process.returncode != 0:
             raise DownloadError("yt-dlp download failed", code="YTDLP_FAILED")
+        
+        context.fetched_bytes = max(0, self._file_size(context.output_path) - resumed)
     
     def _monitor_progress(self, process, item):
         """Monitor yt-dlp progress output."""
@@ -75,8 +79,6 @@ class YtdlpStrategy(DownloadStrategy):
             process.wait()
             return
         
-        from weeb_cli.services.database import db
-        
         while True:
             line = process.stdout.readline()
             if not line and process.poll() is not None:
@@ -99,7 +101,7 @@ class YtdlpStrategy(DownloadStrategy):
                     if speed:
                         updates["speed"] = speed
                     
-                    db.update_queue_item(item["episode_id"], **updates)
+                    progress_sink.report(item["episode_id"], **updates)
                 except Exception:
                     pass
     
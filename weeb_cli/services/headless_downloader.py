@@ -6,6 +6,7 @@ import logging
 import re
 import shutil
 import subprocess
+import time
 from pathlib import Path
 
 log = logging.getLogger("weeb-cli")
@@ -28,7 +29,10 @@ def download_episode(
     season: int,
     episode: int,
     download_dir: str,
+    server: str | None = None,
 ) -> str | None:
+    from weeb_cli.services.host_scoreboard import host_scoreboard
+
     safe_title = _sanitize_filename(series_title)
     anime_dir = Path(download_dir)
     anime_dir.mkdir(parents=True, exist_ok=True)
@@ -43,6 +47,7 @@ def download_episode(
     temp_path = output_path.with_suffix(".part")
 
     is_hls = ".m3u8" in stream_url
+    started = time.monotonic()
 
     try:
         if is_hls:
@@ -55,17 +60,23 @@ def download_episode(
                 _download_ffmpeg(stream_url, temp_path)
 
         if temp_path.exists() and temp_path.stat().st_size > 0:
+            size = temp_path.stat().st_size
             shutil.move(str(temp_path), str(output_path))
+            host_scoreboard.record_download(
+                stream_url, server, True, size_bytes=size, seconds=time.monotonic() - started
+            )
             log.info(f"Downloaded: {output_path}")
             return str(output_path)
         else:
             log.error(f"Download produced empty file: {temp_path}")
             temp_path.unlink(missing_ok=True)
+            host_scoreboard.record_download(stream_url, server, False)
             return None
 
     except Exception as e:
         log.error(f"Download failed for {filename}: {e}")
         temp_path.unlink(missing_ok=True)
+        host_scoreboard.record_download(stream_url, server, False)
         return None
 
 
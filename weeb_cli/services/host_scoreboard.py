@@ -0,0 +1,285 @@
+"""Persistent health and speed scoreboard for stream mirrors.
+
+Every stream validation and every download reports its outcome here, keyed
+both by the stream host (``cdn.example.com``) and by the provider's server
+name (``ALUCARD``, ``megacloud``). For each key the scoreboard keeps a
+decayed success rate, time-to-first-byte and sustained throughput, so that
+mirrors which were slow or broken recently are tried last.
+
+Observations decay exponentially with a half-life of a few days, so a
+mirror that recovers climbs back up without manual resets.
+
+The scoreboard lives in its own SQLite file so the headless downloader and
+the Torznab server can share it without the main database.
+
+Example:
+    Ranking candidates::
+        
+        from weeb_cli.services.host_scoreboard import host_scoreboard
+        
+        ranked = host_scoreboard.rank(streams, quality_key=lambda s: quality_score(s.quality))
+    
+    Recording an outcome::
+        
+        host_scoreboard.record_download(url, "ALUCARD", True, size_bytes=total, seconds=elapsed)
+"""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from weeb_cli.config import CONFIG_DIR
+from weeb_cli.services.logger import debug
+
+HALF_LIFE = 3 * 86400
+EWMA_ALPHA = 0.3
+UNHEALTHY_RATE = 0.3
+UNHEALTHY_MIN_SAMPLES = 3.0
+DEFAULT_TTFB = 1.0
+REFERENCE_THROUGHPUT = 1024 * 1024
+
+
+@dataclass
+class HostStats:
+    """Decayed observations for one host or server name.
+    
+    Attributes:
+        samples: Decayed number of observations.
+        successes: Decayed number of successful observations.
+        ttfb: Smoothed time-to-first-byte in seconds, if measured.
+        throughput: Smoothed download throughput in bytes/second, if measured.
+        updated_at: Unix timestamp of the last observation.
+    """
+    
+    samples: float = 0.0
+    successes: float = 0.0
+    ttfb: Optional[float] = None
+    throughput: Optional[float] = None
+    updated_at: float = 0.0
+    
+    def decayed(self, now: float) -> "HostStats":
+        """Return a copy with counts decayed to ``now``."""
+        if not self.updated_at:
+            return HostStats(updated_at=now)
+        factor = 0.5 ** (max(now - self.updated_at, 0) / HALF_LIFE)
+        return HostStats(
+            self.samples * factor, self.successes * factor,
+            self.ttfb, self.throughput, now
+        )
+    
+    @property
+    def success_rate(self) -> float:
+        """Success rate with a uniform prior (unknown mirrors score 0.5)."""
+        return (self.successes + 1) / (self.samples + 2)
+    
+    @property
+    def unhealthy(self) -> bool:
+        return self.samples >= UNHEALTHY_MIN_SAMPLES and self.success_rate < UNHEALTHY_RATE
+    
+    def score(self) -> float:
+        """Combined score in [0, 1]; higher is better."""
+        ttfb = self.ttfb if self.ttfb is not None else DEFAULT_TTFB
+        ttfb_factor = 1 / (1 + ttfb)
+        if self.throughput is None:
+            speed_factor = 0.5
+        else:
+            speed_factor = self.throughput / (self.throughput + REFERENCE_THROUGHPUT)
+        return self.success_rate * (ttfb_factor + speed_factor) / 2
+
+
+def _ewma(previous: Optional[float], value: Optional[float]) -> Optional[float]:
+    if value is None:
+        return previous
+    if previous is None:
+        return value
+    return previous + EWMA_ALPHA * (value - previous)
+
+
+def _attr(stream: Any, name: str) -> Optional[str]:
+    if isinstance(stream, dict):
+        return stream.get(name)
+    return getattr(stream, name, None)
+
+
+class HostScoreboard:
+    """Persistent per-host and per-server mirror scoreboard.
+    
+    Attributes:
+        db_path: SQLite file holding the scoreboard.
+    """
+    
+    def __init__(self, db_path: Optional[Path] = None) -> None:
+        self.db_path: Path = db_path or CONFIG_DIR / "host_scores.db"
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._stats: Optional[Dict[Tuple[str, str], HostStats]] = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and load all rows. Caller must hold the lock."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA busy_timeout=30000')
+            with self._conn:
+                self._conn.execute('''
+                    CREATE TABLE IF NOT EXISTS host_scores (
+                        kind TEXT NOT NULL,
+                        name TEXT NOT NULL,
+                        samples REAL NOT NULL DEFAULT 0,
+                        successes REAL NOT NULL DEFAULT 0,
+                        ttfb REAL,
+                        throughput REAL,
+                        updated_at REAL NOT NULL,
+                        PRIMARY KEY (kind, name)
+                    )
+                ''')
+            rows = self._conn.execute(
+                'SELECT kind, name, samples, successes, ttfb, throughput, updated_at FROM host_scores'
+            ).fetchall()
+            self._stats = {(r[0], r[1]): HostStats(*r[2:]) for r in rows}
+        return self._conn
+    
+    @staticmethod
+    def _keys(url: Optional[str], server: Optional[str]) -> List[Tuple[str, str]]:
+        keys = []
+        host = urlparse(url).hostname if url else None
+        if host:
+            keys.append(("host", host.lower()))
+        if server:
+            keys.append(("server", server.upper()))
+        return keys
+    
+    def _record(
+        self,
+        url: Optional[str],
+        server: Optional[str],
+        ok: bool,
+        ttfb: Optional[float] = None,
+        throughput: Optional[float] = None
+    ) -> None:
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                rows = []
+                for key in self._keys(url, server):
+                    stats = self._stats.get(key, HostStats()).decayed(now)
+                    stats.samples += 1
+                    stats.successes += 1 if ok else 0
+                    if ok:
+                        stats.ttfb = _ewma(stats.ttfb, ttfb)
+                        stats.throughput = _ewma(stats.throughput, throughput)
+                    self._stats[key] = stats
+                    rows.append((*key, stats.samples, stats.successes, stats.ttfb, stats.throughput, now))
+                with conn:
+                    conn.executemany('''
+                        INSERT OR REPLACE INTO host_scores
+                        (kind, name, samples, successes, ttfb, throughput, updated_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ''', rows)
+        except sqlite3.Error as e:
+            debug(f"[Scoreboard] Failed to record {url}: {e}")
+    
+    def record_probe(self, url: str, server: Optional[str], ok: bool, latency: Optional[float] = None) -> None:
+        """Record a validation probe.
+        
+        Args:
+            url: Probed stream URL.
+            server: Provider server name, if known.
+            ok: Whether the stream was valid.
+            latency: Probe round-trip in seconds, used as time-to-first-byte.
+        """
+        self._record(url, server, ok, ttfb=latency)
+    
+    def record_download(
+        self,
+        url: str,
+        server: Optional[str],
+        ok: bool,
+        size_bytes: Optional[int] = None,
+        seconds: Optional[float] = None,
+        ttfb: Optional[float] = None
+    ) -> None:
+        """Record a finished download attempt.
+        
+        Args:
+            url: Stream URL that was downloaded.
+            server: Provider server name, if known.
+            ok: Whether the download succeeded.
+            size_bytes: Bytes written, for throughput.
+            seconds: Wall time of the download, for throughput.
+            ttfb: Time to first byte in seconds, if measured.
+        """
+        throughput = None
+        if ok and size_bytes and seconds and seconds > 0:
+            throughput = size_bytes / seconds
+        self._record(url, server, ok, ttfb=ttfb, throughput=throughput)
+    
+    def get_stats(self, url: Optional[str] = None, server: Optional[str] = None) -> Dict[str, HostStats]:
+        """Get decayed stats for a URL's host and/or a server name."""
+        now = time.time()
+        result = {}
+        try:
+            with self._lock:
+                if self._conn is None and not self.db_path.exists():
+                    return result
+                self._connect()
+                for kind, name in self._keys(url, server):
+                    stats = self._stats.get((kind, name))
+                    if stats is not None:
+                        result[kind] = stats.decayed(now)
+        except sqlite3.Error as e:
+            debug(f"[Scoreboard] Failed to read stats: {e}")
+        return result
+    
+    def sort_key(self, url: Optional[str], server: Optional[str]) -> Tuple[bool, float]:
+        """Get ``(healthy, score)`` for a candidate; larger sorts first."""
+        stats = self.get_stats(url, server)
+        if not stats:
+            return True, HostStats().score()
+        healthy = not any(s.unhealthy for s in stats.values())
+        return healthy, sum(s.score() for s in stats.values()) / len(stats)
+    
+    def rank(
+        self,
+        streams: List[Any],
+        quality_key: Optional[Callable[[Any], Any]] = None,
+        tiebreak_key: Optional[Callable[[Any], Any]] = None
+    ) -> List[Any]:
+        """Sort stream candidates best first.
+        
+        Unhealthy mirrors (mostly failing recently) always go last. Among
+        the rest, ``quality_key`` (higher is better) comes first when
+        given, then the scoreboard score, then ``tiebreak_key`` (lower is
+        better) for mirrors the scoreboard cannot tell apart.
+        
+        Args:
+            streams: Stream dicts or StreamLink objects.
+            quality_key: Optional quality ranking, higher is better.
+            tiebreak_key: Optional static priority, lower is better.
+        
+        Returns:
+            New sorted list.
+        """
+        def key(stream):
+            healthy, score = self.sort_key(_attr(stream, "url"), _attr(stream, "server"))
+            quality = quality_key(stream) if quality_key else 0
+            tiebreak = tiebreak_key(stream) if tiebreak_key else 0
+            return (not healthy, -quality if quality_key else 0, -score, tiebreak)
+        
+        return sorted(streams, key=key)
+    
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._stats = None
+
+
+host_scoreboard = HostScoreboard()
@@ -0,0 +1,178 @@
+"""Shared pooled HTTP client for providers and services.
+
+Every upstream call in Weeb CLI should go through this module so that
+connections are reused instead of paying a fresh TCP and TLS handshake per
+request. Sessions keep per-host connection pools alive, advertise every
+content encoding urllib3 can decode (gzip, deflate and brotli/zstd when the
+optional decoders are installed) and apply a default timeout.
+
+Sessions are keyed by backend. The default backend is a ``requests``
+session; providers that need a browser TLS fingerprint ask for a
+``curl_cffi`` impersonating session instead, which is created once and
+shared the same way. When curl_cffi is not installed the impersonating
+backends fall back to a separate pooled ``requests`` session.
+
+Example:
+    Plain requests::
+
+        from weeb_cli.services.http_client import http_client
+
+        resp = http_client.get("https://api.example.com/anime", params={"q": "naruto"})
+
+    Impersonating session (Cloudflare-protected sites)::
+
+        session = http_client.session(impersonate="firefox")
+        html = session.get("https://example.com/").text
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+from weeb_cli.config import config
+from weeb_cli.constants import ConfigKey
+from weeb_cli.services.logger import debug
+
+try:
+    from curl_cffi import requests as curl_requests
+    HAS_CURL_CFFI = True
+except ImportError:
+    HAS_CURL_CFFI = False
+
+DEFAULT_POOL_HOSTS = 20
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 15
+
+
+class HttpClient:
+    """Registry of shared keep-alive sessions.
+
+    Attributes:
+        pool_hosts: Number of per-host connection pools kept per session.
+        pool_size: Maximum connections kept alive per host.
+        timeout: Default request timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        pool_hosts: Optional[int] = None,
+        pool_size: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> None:
+        self._pool_hosts = pool_hosts
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, Any] = {}
+
+    @staticmethod
+    def _config_number(key: ConfigKey, default, cast=int):
+        try:
+            value = cast(config.get(key.value, default))
+        except (TypeError, ValueError):
+            return default
+        return value if value > 0 else default
+
+    @property
+    def pool_hosts(self) -> int:
+        if self._pool_hosts is None:
+            self._pool_hosts = self._config_number(ConfigKey.HTTP_POOL_HOSTS, DEFAULT_POOL_HOSTS)
+        return self._pool_hosts
+
+    @property
+    def pool_size(self) -> int:
+        if self._pool_size is None:
+            self._pool_size = self._config_number(ConfigKey.HTTP_POOL_SIZE, DEFAULT_POOL_SIZE)
+        return self._pool_size
+
+    @property
+    def timeout(self) -> float:
+        if self._timeout is None:
+            self._timeout = self._config_number(ConfigKey.HTTP_TIMEOUT, DEFAULT_TIMEOUT, float)
+        return self._timeout
+
+    def session(self, impersonate: Optional[str] = None):
+        """Get the shared session for a backend.
+
+        Args:
+            impersonate: curl_cffi browser target (e.g. ``"firefox"``,
+                ``"chrome110"``), or None for the default requests session.
+
+        Returns:
+            A ``requests.Session`` or ``curl_cffi.requests.Session``.
+        """
+        key = impersonate or "requests"
+        session = self._sessions.get(key)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._create_session(impersonate)
+                self._sessions[key] = session
+        return session
+
+    def _create_session(self, impersonate: Optional[str]):
+        if impersonate and HAS_CURL_CFFI:
+            debug(f"[HTTP] New curl_cffi session impersonating {impersonate}")
+            return curl_requests.Session(impersonate=impersonate)
+
+        if impersonate:
+            debug(f"[HTTP] curl_cffi not available, using requests for {impersonate}")
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_hosts, pool_maxsize=self.pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        return session
+
+    def request(self, method: str, url: str, impersonate: Optional[str] = None, **kwargs: Any):
+        """Send a request through a shared session.
+
+        Args:
+            method: HTTP method.
+            url: Target URL.
+            impersonate: Optional curl_cffi backend (see :meth:`session`).
+            **kwargs: Passed to ``Session.request``. ``timeout`` defaults
+                to the configured timeout.
+
+        Returns:
+            Response object of the selected backend.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session(impersonate).request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any):
+        """Send a GET request. See :meth:`request`."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any):
+        """Send a POST request. See :meth:`request`."""
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any):
+        """Send a PATCH request. See :meth:`request`."""
+        return self.request("PATCH", url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any):
+        """Send a HEAD request. See :meth:`request`."""
+        return self.request("HEAD", url, **kwargs)
+
+    def close(self) -> None:
+        """Close all sessions and their pooled connections."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
+
+
+http_client = HttpClient()
@@ -1,13 +1,48 @@
 import os
 import re
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from weeb_cli.config import config
 from weeb_cli.services.progress import progress_tracker
 
+VIDEO_EXTENSIONS = {'.mp4', '.mkv', '.avi', '.webm', '.m4v', '.ts'}
+
+# Folders modified this close to their last scan are rescanned next time,
+# since coarse mtimes (FAT, SMB) can hide a change made right after a scan.
+MTIME_SLACK_NS = 2_000_000_000
+
+
+@dataclass
+class IndexReport:
+    """Folder counts from an incremental indexing run.
+    
+    Attributes:
+        skipped: Folders whose signature was unchanged; not listed.
+        rescanned: Known folders that were listed again.
+        added: Folders newly added to the index.
+        removed: Folders dropped from the index.
+    """
+    
+    skipped: int = 0
+    rescanned: int = 0
+    added: int = 0
+    removed: int = 0
+    
+    def merge(self, other: "IndexReport") -> None:
+        self.skipped += other.skipped
+        self.rescanned += other.rescanned
+        self.added += other.added
+        self.removed += other.removed
+
+
 class LocalLibrary:
     def __init__(self):
         self._db = None
+        self._view_lock = threading.Lock()
+        self._view: Optional[Tuple[int, List[Dict]]] = None
     
     @property
     def db(self):
@@ -89,20 +124,32 @@ class LocalLibrary:
         return sorted(anime_list, key=lambda x: x["title"].lower())
     
     def _scan_anime_folder(self, folder: Path) -> List[Dict]:
+        return self._scan_anime_folder_with_stats(folder)[0]
+    
+    def _scan_anime_folder_with_stats(self, folder: Path) -> Tuple[List[Dict], int, int]:
+        """List a folder once and return (episodes, entry count, total file size)."""
         episodes = []
-        video_extensions = {'.mp4', '.mkv', '.avi', '.webm', '.m4v'}
-        
-        for file in folder.iterdir():
-            if file.is_file() and file.suffix.lower() in video_extensions:
-                ep_num = self._extract_episode_number(file.name)
-                episodes.append({
-                    "filename": file.name,
-                    "path": str(file),
-                    "number": ep_num,
-                    "size": file.stat().st_size
-                })
+        entry_count = 0
+        total_size = 0
         
-        return sorted(episodes, key=lambda x: x["number"])
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                entry_count += 1
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+                total_size += stat.st_size
+                if os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS:
+                    episodes.append({
+                        "filename": entry.name,
+                        "path": str(folder / entry.name),
+                        "season": self._extract_season_number(entry.name),
+                        "number": self._extract_episode_number(entry.name),
+                        "size": stat.st_size,
+                        "mtime_ns": stat.st_mtime_ns
+                    })
+        
+        return sorted(episodes, key=lambda x: (x["season"], x["number"])), entry_count, total_size
     
     def _extract_episode_number(self, filename: str) -> int:
         patterns = [
@@ -123,6 +170,46 @@ class LocalLibrary:
         
         return 0
     
+    def _extract_season_number(self, filename: str) -> int:
+        match = re.search(r'S(\d+)[EB]\d+', filename, re.IGNORECASE)
+        return int(match.group(1)) if match else 1
+    
+    def get_folder_episodes(self, anime: Dict) -> List[Dict]:
+        """Episodes of an indexed anime, read from the index.
+        
+        The folder is only listed again when its stored signature no longer
+        matches (or nothing is stored yet); otherwise the only disk access
+        is a single stat of the folder.
+        
+        Args:
+            anime: Indexed anime row (folder_path, source_path, source_name).
+        """
+        folder_path = anime["folder_path"]
+        folder = Path(folder_path)
+        try:
+            mtime_ns = folder.stat().st_mtime_ns
+        except OSError:
+            return self.db.get_folder_episodes(folder_path)
+        
+        if self._is_unchanged(self.db.get_folder_signature(folder_path), mtime_ns):
+            episodes = self.db.get_folder_episodes(folder_path)
+            if episodes:
+                return episodes
+        
+        episodes, signature = self._scan_with_signature(folder, mtime_ns)
+        self.db.replace_folder_episodes(folder_path, episodes)
+        self.db.save_folder_signatures(anime["source_path"], [signature])
+        if episodes and len(episodes) != anime.get("episode_count"):
+            self.db.index_anime(
+                title=folder.name,
+                source_path=anime["source_path"],
+                source_name=anime["source_name"],
+                folder_path=folder_path,
+                episode_count=len(episodes),
+                slug=self._title_to_slug(folder.name)
+            )
+        return episodes
+    
     def get_anime_progress(self, anime_title: str) -> Dict:
         slug = self._title_to_slug(anime_title)
         return progress_tracker.get_anime_progress(slug)
@@ -148,20 +235,17 @@ class LocalLibrary:
         if not connected_trackers:
             return
         
-        # First, try to sync any pending updates
+        # Queue the episode behind any pending updates and drain them together,
+        # so batching trackers send everything in as few requests as possible
         for name, tracker in connected_trackers:
             try:
-                synced_count = tracker.sync_pending()
-                if synced_count > 0:
+                synced_count = tracker.push_progress(anime_title, ep_number, total_episodes)
+                if synced_count > 1:
                     from weeb_cli.services.logger import info
                     info(f"{name}: Synced {synced_count} pending updates")
             except Exception as e:
                 from weeb_cli.services.logger import error
                 error(f"Failed to sync pending updates for {name}: {e}")
-        
-        # Try to sync current episode to all trackers
-        for name, tracker in connected_trackers:
-            tracker.update_progress(anime_title, ep_number, total_episodes)
     
     def _title_to_slug(self, title: str) -> str:
         slug = title.lower()
@@ -206,77 +290,127 @@ class LocalLibrary:
         self.db.clear_source_index(source_path)
         
         count = 0
+        signatures = []
         for anime_folder in path.iterdir():
             if not anime_folder.is_dir():
                 continue
             
-            episodes = self._scan_anime_folder(anime_folder)
+            episodes, signature = self._scan_with_signature(anime_folder)
+            signatures.append(signature)
+            self.db.replace_folder_episodes(str(anime_folder), episodes)
             if episodes:
                 self.db.index_anime(
                     title=anime_folder.name,
                     source_path=source_path,
                     source_name=source_name,
                     folder_path=str(anime_folder),
-                    episode_count=len(episodes)
+                    episode_count=len(episodes),
+                    slug=self._title_to_slug(anime_folder.name)
                 )
                 count += 1
         
+        self.db.save_folder_signatures(source_path, signatures)
         return count
     
-    def smart_index_source(self, source_path: str, source_name: str):
+    def _scan_with_signature(self, anime_folder: Path, mtime_ns: Optional[int] = None) -> Tuple[List[Dict], Dict]:
+        if mtime_ns is None:
+            mtime_ns = anime_folder.stat().st_mtime_ns
+        scanned_ns = time.time_ns()
+        episodes, entry_count, total_size = self._scan_anime_folder_with_stats(anime_folder)
+        return episodes, {
+            "folder_path": str(anime_folder),
+            "mtime_ns": mtime_ns,
+            "entry_count": entry_count,
+            "total_size": total_size,
+            "scanned_ns": scanned_ns,
+        }
+    
+    @staticmethod
+    def _is_unchanged(signature: Optional[Dict], mtime_ns: int) -> bool:
+        if not signature or signature["mtime_ns"] != mtime_ns:
+            return False
+        return signature["scanned_ns"] - mtime_ns > MTIME_SLACK_NS
+    
+    def smart_index_source(self, source_path: str, source_name: str) -> IndexReport:
+        """Update the index of one source, listing only folders that changed.
+        
+        Each folder's directory mtime, entry count and total file size are
+        stored after a scan, along with its episode files. A folder whose
+        mtime still matches is skipped without listing it; any other folder
+        is listed and re-indexed.
+        
+        Returns:
+            Counts of skipped, rescanned, added and removed folders.
+        """
+        report = IndexReport()
         path = Path(source_path)
         if not path.exists():
-            return 0
+            return report
         
         indexed = {a["folder_path"]: a for a in self.db.get_all_indexed_anime() if a["source_path"] == source_path}
+        signatures = self.db.get_folder_signatures(source_path)
         
         current_folders = set()
-        added = 0
+        new_signatures = []
         
-        for anime_folder in path.iterdir():
-            if not anime_folder.is_dir():
-                continue
-            
-            folder_path = str(anime_folder)
-            current_folders.add(folder_path)
-            
-            episodes = self._scan_anime_folder(anime_folder)
-            if not episodes:
-                continue
-            
-            if folder_path in indexed:
-                if indexed[folder_path]["episode_count"] != len(episodes):
-                    self.db.index_anime(
-                        title=anime_folder.name,
-                        source_path=source_path,
-                        source_name=source_name,
-                        folder_path=folder_path,
-                        episode_count=len(episodes)
-                    )
-            else:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                
+                anime_folder = path / entry.name
+                folder_path = str(anime_folder)
+                current_folders.add(folder_path)
+                
+                mtime_ns = entry.stat().st_mtime_ns
+                old = signatures.get(folder_path)
+                if self._is_unchanged(old, mtime_ns):
+                    report.skipped += 1
+                    continue
+                
+                episodes, signature = self._scan_with_signature(anime_folder, mtime_ns)
+                new_signatures.append(signature)
+                self.db.replace_folder_episodes(folder_path, episodes)
+                if old or folder_path in indexed:
+                    report.rescanned += 1
+                
+                if not episodes:
+                    if folder_path in indexed:
+                        self.db.remove_indexed_anime(folder_path)
+                        report.removed += 1
+                    continue
+                
+                if folder_path in indexed and indexed[folder_path]["episode_count"] == len(episodes):
+                    continue
+                
                 self.db.index_anime(
                     title=anime_folder.name,
                     source_path=source_path,
                     source_name=source_name,
                     folder_path=folder_path,
-                    episode_count=len(episodes)
+                    episode_count=len(episodes),
+                    slug=self._title_to_slug(anime_folder.name)
                 )
-                added += 1
+                if folder_path not in indexed:
+                    report.added += 1
         
-        for folder_path in indexed:
-            if folder_path not in current_folders:
-                self.db.remove_indexed_anime(folder_path)
+        for folder_path in (set(indexed) | set(signatures)) - current_folders:
+            self.db.remove_indexed_anime(folder_path)
+            if folder_path in indexed:
+                report.removed += 1
         
-        return added
+        self.db.save_folder_signatures(source_path, new_signatures)
+        return report
     
-    def smart_index_all(self):
+    def smart_index_all(self) -> IndexReport:
         from concurrent.futures import ThreadPoolExecutor, as_completed
+        from weeb_cli.services.logger import debug
         
+        report = IndexReport()
         sources = [s for s in self.get_all_sources() if s["available"]]
         if not sources:
-            return 0
+            return report
         
-        total = 0
         with ThreadPoolExecutor(max_workers=min(4, len(sources))) as executor:
             futures = {
                 executor.submit(self.smart_index_source, s["path"], s["name"]): s 
@@ -284,11 +418,15 @@ class LocalLibrary:
             }
             for future in as_completed(futures):
                 try:
-                    total += future.result()
+                    report.merge(future.result())
                 except Exception as e:
-                    from weeb_cli.services.logger import debug
                     debug(f"[Library] Indexing failed for source: {e}")
-        return total
+        
+        debug(
+            f"[Library] Indexed: {report.skipped} skipped, {report.rescanned} rescanned, "
+            f"{report.added} added, {report.removed} removed"
+        )
+        return report
     
     def index_all_sources(self):
         total = 0
@@ -300,6 +438,28 @@ class LocalLibrary:
     def get_indexed_anime(self) -> List[Dict]:
         return self.db.get_all_indexed_anime()
     
+    def get_library_view(self) -> List[Dict]:
+        """All indexed anime with watch progress and source availability.
+        
+        Progress comes from one joined query instead of a lookup per title,
+        and is memoized until the index or progress tables change. Source
+        availability is checked once per source on every call.
+        
+        Returns:
+            anime_index rows sorted by title, each with ``watched``
+            (count), ``last_watched`` and ``available``.
+        """
+        version = self.db.get_library_version()
+        with self._view_lock:
+            if self._view is None or self._view[0] != version:
+                self.db.fill_anime_slugs(self._title_to_slug)
+                version, rows = self.db.get_library_view()
+                self._view = (version, rows)
+            rows = self._view[1]
+        
+        available = {path: self.is_source_available(path) for path in {r["source_path"] for r in rows}}
+        return [{**row, "available": available[row["source_path"]]} for row in rows]
+    
     def search_all_indexed(self, query: str) -> List[Dict]:
         if not query:
             return self.db.get_all_indexed_anime()
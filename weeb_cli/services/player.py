@@ -6,8 +6,7 @@ import json
 import os
 import platform
 import tempfile
-from datetime import datetime
-from typing import Optional, Dict, Callable
+from typing import Optional, Dict, Callable, List, Tuple
 from rich.console import Console
 from weeb_cli.services.logger import debug as log_debug, error as log_error
 
@@ -18,6 +17,15 @@ from weeb_cli.services.aniskip import aniskip_service
 
 console = Console()
 
+IPC_CONNECT_TIMEOUT = 10.0
+IPC_CONNECT_INTERVAL = 0.05
+# Longest the monitor sleeps between reads of the mpv event stream
+IPC_MAX_IDLE = 1.0
+# Wake up this long before a skip segment so the seek lands at its start
+IPC_SKIP_LEAD = 0.25
+SAVE_INTERVAL = 15
+SAVE_MIN_DELTA = 5.0
+
 class Player:
     def __init__(self) -> None:
         self.mpv_path: Optional[str] = dependency_manager.check_dependency("mpv")
@@ -37,24 +45,67 @@ class Player:
         else:
             return os.path.join(tempfile.gettempdir(), f"mpv-ipc-{os.getpid()}.sock")
 
-    def _send_ipc_command(self, sock: socket.socket, command: list) -> Optional[Dict]:
+    def _post_ipc_command(self, sock: socket.socket, command: list) -> None:
+        """Send a command without waiting for its reply.
+        
+        Replies arrive on the same stream as property events and are
+        ignored by the event reader.
+        """
         try:
-            req = json.dumps({"command": command}) + "\n"
-            sock.sendall(req.encode("utf-8"))
-            
-            # Read response (simple line-based)
-            data = b""
-            while not data.endswith(b"\n"):
-                chunk = sock.recv(1024)
-                if not chunk: break
-                data += chunk
-            
-            if data:
-                return json.loads(data.decode("utf-8"))
-        except Exception:
-            pass
+            sock.sendall((json.dumps({"command": command}) + "\n").encode("utf-8"))
+        except OSError as e:
+            log_debug(f"[Player] IPC send failed: {e}")
+    
+    def _connect_ipc(self, ipc_path: str, timeout: float = IPC_CONNECT_TIMEOUT) -> Optional[socket.socket]:
+        """Connect to mpv's IPC socket as soon as it accepts connections."""
+        deadline = time.monotonic() + timeout
+        while not self._stop_monitor.is_set() and time.monotonic() < deadline:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(ipc_path)
+                return sock
+            except OSError:
+                sock.close()
+                self._stop_monitor.wait(IPC_CONNECT_INTERVAL)
         return None
     
+    @staticmethod
+    def _read_events(sock: socket.socket, buffer: bytes) -> Tuple[List[Dict], bytes, bool]:
+        """Read whatever mpv has sent and split it into JSON messages.
+        
+        Returns:
+            Tuple of (messages, unparsed remainder, connection still open).
+        """
+        try:
+            chunk = sock.recv(65536)
+        except socket.timeout:
+            return [], buffer, True
+        if not chunk:
+            return [], buffer, False
+        
+        *lines, buffer = (buffer + chunk).split(b"\n")
+        messages = []
+        for line in lines:
+            try:
+                messages.append(json.loads(line))
+            except ValueError:
+                continue
+        return messages, buffer, True
+    
+    def _next_check_delay(self, curr_pos: float) -> float:
+        """Seconds the monitor may sleep before the next skip segment starts.
+        
+        Events keep queueing in the socket while the monitor sleeps, so
+        it only wakes for every position update when a segment is close.
+        """
+        upcoming = [
+            start - curr_pos for skip_type, (start, end) in (self._skip_times or {}).items()
+            if skip_type not in self._skipped_segments and start > curr_pos
+        ]
+        if not upcoming:
+            return IPC_MAX_IDLE
+        return min(IPC_MAX_IDLE, max(0.0, min(upcoming) - IPC_SKIP_LEAD))
+    
     def _check_and_skip(self, sock: socket.socket, curr_pos: float) -> None:
         """Check if current position is in OP/ED range and skip if needed."""
         if not self._skip_times:
@@ -64,100 +115,106 @@ class Player:
             # Check if we're in the skip range and haven't skipped this segment yet
             if start <= curr_pos < end and skip_type not in self._skipped_segments:
                 # Seek to end of segment
-                self._send_ipc_command(sock, ["seek", end, "absolute"])
+                self._post_ipc_command(sock, ["seek", end, "absolute"])
                 self._skipped_segments.add(skip_type)
                 
                 # Show OSD message
                 skip_label = skip_type.upper()
-                self._send_ipc_command(sock, ["show-text", f"Skipped {skip_label}", 2000])
+                self._post_ipc_command(sock, ["show-text", f"Skipped {skip_label}", 2000])
                 log_debug(f"[AniSkip] Skipped {skip_label}: {start:.1f}s -> {end:.1f}s")
                 console.print(f"[cyan]⏩ Skipped {skip_label}[/cyan]")
 
     def _monitor_mpv(self, ipc_path: str, slug: str, anime_title: str, on_watched: Optional[Callable]):
+        """Follow playback through mpv property-change events.
+        
+        Observes ``time-pos``, ``duration`` and ``pause``. Skips are checked
+        against the latest position, and progress is written when the
+        position moved at least ``SAVE_MIN_DELTA`` seconds since the last
+        write (at most every ``SAVE_INTERVAL`` seconds), on pause and on exit.
+        """
         log_debug(f"[Player] Monitor started for {slug}")
-        self._stop_monitor.clear()
         
-        # Give MPV a moment to start and create the socket
-        time.sleep(2)
+        if platform.system() == "Windows":
+            # For Windows, we'd need a different approach for named pipes if using standard socket
+            log_debug("[Player] IPC Monitor on Windows is currently limited")
+            return
         
         from weeb_cli.services.database import db
         
-        sock = None
-        last_save_time = time.time()
+        sock = self._connect_ipc(ipc_path)
+        if sock is None:
+            log_debug("[Player] Could not connect to MPV IPC socket")
+            return
+        
+        episode = self._current_anime_data.get("episode_number", 0)
+        total = self._current_anime_data.get("total_episodes", 0)
+        curr_pos: Optional[float] = None
+        duration = 0.0
+        saved_pos: Optional[float] = None
+        last_save_time = time.monotonic()
         watched_triggered = False
         
-        try:
-            if platform.system() == "Windows":
-                # For Windows, we'd need a different approach for named pipes if using standard socket
-                # For now, we'll focus on Unix-like socket or skip monitor on Windows if complex
-                log_debug("[Player] IPC Monitor on Windows is currently limited")
+        def save(reason: str) -> None:
+            nonlocal saved_pos, last_save_time
+            if curr_pos is None or duration <= 0 or curr_pos == saved_pos:
                 return
+            db.save_playback_position(slug, anime_title, episode, total, current_time=curr_pos, duration=duration)
+            saved_pos, last_save_time = curr_pos, time.monotonic()
+            log_debug(f"[Player] Progress saved ({reason}): {curr_pos:.1f}/{duration:.1f}")
+        
+        try:
+            sock.settimeout(IPC_MAX_IDLE)
+            for request_id, name in enumerate(("time-pos", "duration", "pause"), 1):
+                self._post_ipc_command(sock, ["observe_property", request_id, name])
             
-            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            sock.connect(ipc_path)
-            sock.settimeout(2)
-            
+            buffer = b""
             while not self._stop_monitor.is_set():
-                # Get current position and duration
-                pos_resp = self._send_ipc_command(sock, ["get_property", "time-pos"])
-                dur_resp = self._send_ipc_command(sock, ["get_property", "duration"])
+                messages, buffer, alive = self._read_events(sock, buffer)
+                if not alive:
+                    break
+                
+                paused_now = False
+                for message in messages:
+                    if message.get("event") != "property-change" or message.get("data") is None:
+                        continue
+                    if message["name"] == "time-pos":
+                        curr_pos = float(message["data"])
+                    elif message["name"] == "duration":
+                        duration = float(message["data"])
+                    elif message["name"] == "pause" and message["data"]:
+                        paused_now = True
+                
+                if curr_pos is None:
+                    continue
+                
+                # AniSkip: Check if we should skip OP/ED
+                if self._skip_times and aniskip_service.is_enabled():
+                    self._check_and_skip(sock, curr_pos)
+                
+                # Auto-mark as watched at 80%
+                if duration > 0 and not watched_triggered and curr_pos / duration >= 0.8:
+                    log_debug(f"[Player] Auto-mark triggered for {slug} (%{curr_pos / duration * 100:.1f})")
+                    if on_watched:
+                        on_watched()
+                    watched_triggered = True
                 
-                if pos_resp and dur_resp and "data" in pos_resp and "data" in dur_resp:
-                    curr_pos = pos_resp["data"]
-                    duration = dur_resp["data"]
-                    
-                    if duration > 0:
-                        progress = (curr_pos / duration) * 100
-                        
-                        # AniSkip: Check if we should skip OP/ED
-                        if self._skip_times and aniskip_service.is_enabled():
-                            self._check_and_skip(sock, curr_pos)
-                        
-                        # Auto-mark as watched at 80%
-                        if progress >= 80 and not watched_triggered:
-                            log_debug(f"[Player] Auto-mark triggered for {slug} (%{progress:.1f})")
-                            if on_watched:
-                                on_watched()
-                            watched_triggered = True
-                        
-                        # Periodic save (every 15s)
-                        if time.time() - last_save_time > 15:
-                            db.save_progress(
-                                slug, 
-                                anime_title, 
-                                self._current_anime_data.get("episode_number", 0),
-                                self._current_anime_data.get("total_episodes", 0),
-                                db.get_progress(slug).get("completed", []),
-                                datetime.now().isoformat(),
-                                current_time=curr_pos,
-                                duration=duration
-                            )
-                            last_save_time = time.time()
-                            log_debug(f"[Player] Progress saved: {curr_pos:.1f}/{duration:.1f}")
+                if paused_now:
+                    save("pause")
+                elif (time.monotonic() - last_save_time >= SAVE_INTERVAL
+                      and (saved_pos is None or abs(curr_pos - saved_pos) >= SAVE_MIN_DELTA)):
+                    save("interval")
                 
-                time.sleep(5)
+                self._stop_monitor.wait(self._next_check_delay(curr_pos))
                 
         except Exception as e:
             log_debug(f"[Player] Monitor error: {e}")
         finally:
-            if sock:
-                try:
-                    # Final save before closing
-                    if 'curr_pos' in locals() and 'duration' in locals():
-                        db.save_progress(
-                            slug, 
-                            anime_title, 
-                            self._current_anime_data.get("episode_number", 0),
-                            self._current_anime_data.get("total_episodes", 0),
-                            db.get_progress(slug).get("completed", []),
-                            datetime.now().isoformat(),
-                            current_time=curr_pos,
-                            duration=duration
-                        )
-                    sock.close()
-                except Exception:
-                    pass
-            if os.path.exists(ipc_path) and platform.system() != "Windows":
+            try:
+                save("exit")
+            except Exception as e:
+                log_debug(f"[Player] Final progress save failed: {e}")
+            sock.close()
+            if os.path.exists(ipc_path):
                 try: os.unlink(ipc_path)
                 except Exception: pass
 
@@ -230,6 +287,7 @@ class Player:
             
         try:
             if slug and platform.system() != "Windows":
+                self._stop_monitor.clear()
                 self._monitor_thread = threading.Thread(
                     target=self._monitor_mpv, 
                     args=(ipc_path, slug, anime_title or "Anime", on_watched),
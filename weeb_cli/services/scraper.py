@@ -1,10 +1,30 @@
-from typing import List, Optional
+from typing import Callable, List, Optional, TypeVar
 from weeb_cli.config import config
 from weeb_cli.providers import get_provider, get_default_provider, list_providers
 from weeb_cli.providers.base import AnimeResult, AnimeDetails, Episode, StreamLink
 from weeb_cli.exceptions import ProviderError
 from weeb_cli.services.error_handler import handle_provider_error
 
+T = TypeVar("T")
+
+
+def provider_bound_loader(provider: str, fn: Callable[[], T]) -> Callable[[], Optional[T]]:
+    """Wrap a cache loader so it yields None once the source has changed.
+    
+    A stale-while-revalidate refresh can finish after the user switched
+    ``scraping_source``; its result would come from the new provider but be
+    stored under the old provider's key, so it is dropped instead.
+    
+    Args:
+        provider: Source name the cache key was built for.
+        fn: Loader to run while that source is still selected.
+    """
+    def load() -> Optional[T]:
+        if config.get("scraping_source", "None") != provider:
+            return None
+        return fn()
+    return load
+
 
 class Scraper:
     
@@ -0,0 +1,197 @@
+"""Startup orchestration for the interactive CLI.
+
+``weeb-cli start`` used to run every startup check one after another before
+the main menu could render. The pipeline here runs independent checks
+concurrently under one overall deadline, pushes work that the first menu
+does not need into background threads, and records how long every phase
+took so ``--startup-profile`` can print it.
+
+Example:
+    Running startup phases::
+        
+        pipeline = StartupPipeline()
+        
+        with pipeline.phase("setup"):
+            run_setup()
+        
+        results = pipeline.run_parallel({
+            "network": check_network,
+            "ffmpeg": find_ffmpeg,
+        })
+        pipeline.defer("tracker_sync", sync_tracker_pending)
+        
+        pipeline.print_report()
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from weeb_cli.services.logger import debug
+
+STARTUP_DEADLINE = 5.0
+
+#: Result placeholder for parallel tasks that missed the deadline.
+TIMED_OUT = object()
+
+
+@dataclass
+class PhaseTiming:
+    """Timing of one startup phase.
+    
+    Attributes:
+        name: Phase name.
+        kind: ``"blocking"``, ``"parallel"`` or ``"background"``.
+        started: ``perf_counter`` value when the phase started.
+        duration: Seconds taken, or None while still running.
+        status: ``"ok"``, ``"error"``, ``"timeout"`` or ``"running"``.
+    """
+    
+    name: str
+    kind: str
+    started: float
+    duration: Optional[float] = None
+    status: str = "running"
+
+
+class StartupPipeline:
+    """Runs and times startup phases.
+    
+    Attributes:
+        deadline: Overall seconds allowed for each parallel group.
+    """
+    
+    def __init__(self, deadline: float = STARTUP_DEADLINE) -> None:
+        self.deadline = deadline
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        self._timings: List[PhaseTiming] = []
+        self._background: List[threading.Thread] = []
+    
+    def _start(self, name: str, kind: str) -> PhaseTiming:
+        timing = PhaseTiming(name, kind, time.perf_counter())
+        with self._lock:
+            self._timings.append(timing)
+        return timing
+    
+    @staticmethod
+    def _finish(timing: PhaseTiming, status: str) -> None:
+        timing.duration = time.perf_counter() - timing.started
+        timing.status = status
+    
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a blocking phase run in the calling thread."""
+        timing = self._start(name, "blocking")
+        try:
+            yield
+        except BaseException:
+            self._finish(timing, "error")
+            raise
+        self._finish(timing, "ok")
+    
+    def _timed(self, timing: PhaseTiming, func: Callable[[], Any]) -> Any:
+        try:
+            result = func()
+        except Exception as e:
+            self._finish(timing, "error")
+            debug(f"[Startup] {timing.name} failed: {e}")
+            raise
+        self._finish(timing, "ok")
+        return result
+    
+    def run_parallel(self, tasks: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """Run independent tasks concurrently under the pipeline deadline.
+        
+        Tasks still running at the deadline are left to finish on their
+        worker threads and reported as ``TIMED_OUT``. A task that raises is
+        reported with its exception as the result.
+        
+        Args:
+            tasks: Mapping of phase name to a callable without arguments.
+        
+        Returns:
+            Mapping of phase name to the task's return value, exception,
+            or ``TIMED_OUT``.
+        """
+        if not tasks:
+            return {}
+        
+        executor = ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="startup")
+        try:
+            futures = {}
+            for name, func in tasks.items():
+                timing = self._start(name, "parallel")
+                futures[name] = (executor.submit(self._timed, timing, func), timing)
+            wait([f for f, _ in futures.values()], timeout=self.deadline)
+        finally:
+            executor.shutdown(wait=False)
+        
+        results = {}
+        for name, (future, timing) in futures.items():
+            if not future.done():
+                timing.status = "timeout"
+                debug(f"[Startup] {name} missed the {self.deadline}s deadline")
+                results[name] = TIMED_OUT
+            elif future.exception() is not None:
+                results[name] = future.exception()
+            else:
+                results[name] = future.result()
+        return results
+    
+    def defer(self, name: str, func: Callable[[], Any]) -> threading.Thread:
+        """Run a task in a background daemon thread without waiting for it."""
+        timing = self._start(name, "background")
+        
+        def run():
+            try:
+                self._timed(timing, func)
+            except Exception:
+                pass
+        
+        thread = threading.Thread(target=run, name=f"startup-{name}", daemon=True)
+        thread.start()
+        self._background.append(thread)
+        return thread
+    
+    def join_background(self, timeout: Optional[float] = None) -> None:
+        """Wait for deferred tasks, sharing one timeout between them."""
+        end = None if timeout is None else time.perf_counter() + timeout
+        for thread in self._background:
+            thread.join(None if end is None else max(end - time.perf_counter(), 0))
+    
+    @property
+    def timings(self) -> List[PhaseTiming]:
+        with self._lock:
+            return list(self._timings)
+    
+    def print_report(self, console: Optional[Console] = None, kinds: Optional[List[str]] = None) -> None:
+        """Print per-phase timings.
+        
+        Args:
+            console: Console to print to.
+            kinds: Only include phases of these kinds.
+        """
+        console = console or Console()
+        table = Table(title="Startup profile", show_lines=False)
+        table.add_column("Phase")
+        table.add_column("Kind", style="dim")
+        table.add_column("Start", justify="right")
+        table.add_column("Duration", justify="right")
+        table.add_column("Status")
+        
+        for t in self.timings:
+            if kinds and t.kind not in kinds:
+                continue
+            duration = f"{t.duration * 1000:.0f} ms" if t.duration is not None else "-"
+            offset = f"+{(t.started - self.started) * 1000:.0f} ms"
+            table.add_row(t.name, t.kind, offset, duration, t.status)
+        
+        console.print(table)
+        console.print(f"[dim]Elapsed: {(time.perf_counter() - self.started) * 1000:.0f} ms[/dim]")
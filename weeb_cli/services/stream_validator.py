@@ -1,11 +1,43 @@
-from typing import Any, Dict, List, Optional, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import requests
 
+from weeb_cli.services.host_scoreboard import HostScoreboard, host_scoreboard
+from weeb_cli.services.http_client import http_client
 from weeb_cli.services.logger import debug
 
+VALIDATION_WORKERS = 6
+VALIDATION_BUDGET = 8.0
+
+
+def _stream_url(stream: Any) -> Optional[str]:
+    return stream.url if hasattr(stream, "url") else stream.get("url")
+
+
+def _stream_server(stream: Any) -> Optional[str]:
+    return stream.server if hasattr(stream, "server") else stream.get("server")
+
+
+def _stream_headers(stream: Any, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    own = stream.headers if hasattr(stream, "headers") else stream.get("headers")
+    merged = dict(own or {})
+    if headers:
+        merged.update(headers)
+    return merged
+
 
 class StreamValidator:
+    """Checks stream URLs before they are played or downloaded.
+
+    Probes run concurrently on a bounded pool under an overall time budget,
+    and every probe outcome and latency is recorded in the host scoreboard.
+    """
+
+    def __init__(self, scoreboard: Optional[HostScoreboard] = None) -> None:
+        self._scoreboard = scoreboard
+
     @staticmethod
     def validate_url(
         url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 5
@@ -17,12 +49,12 @@ class StreamValidator:
             return False, "Invalid protocol"
 
         try:
-            response = requests.head(
+            response = http_client.head(
                 url, headers=headers or {}, timeout=timeout, allow_redirects=True
             )
 
             if response.status_code == 405:
-                response = requests.get(
+                response = http_client.get(
                     url, headers=headers or {}, timeout=timeout, stream=True
                 )
                 response.close()
@@ -52,34 +84,100 @@ class StreamValidator:
             debug(f"[VALIDATOR] Validation error: {e}")
             return False, str(e)
 
-    @staticmethod
-    def validate_streams(
-        streams: List[Any], headers: Optional[Dict[str, str]] = None
-    ) -> List[Any]:
-        validated = []
-
-        for stream in streams:
-            url = stream.url if hasattr(stream, "url") else stream.get("url")
-            stream_headers = (
-                stream.headers
-                if hasattr(stream, "headers")
-                else stream.get("headers", {})
-            )
-
-            if headers:
-                stream_headers.update(headers)
+    @property
+    def scoreboard(self) -> HostScoreboard:
+        return self._scoreboard or host_scoreboard
 
-            is_valid, error = StreamValidator.validate_url(
-                url, stream_headers, timeout=3
-            )
-
-            if is_valid:
-                validated.append(stream)
-                debug(f"[VALIDATOR] Valid stream: {url[:50]}...")
-            else:
-                debug(f"[VALIDATOR] Invalid stream: {url[:50]}... - {error}")
+    def probe(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = 3,
+        server: Optional[str] = None,
+    ) -> Tuple[bool, Optional[str]]:
+        """Validate a URL and record the outcome in the host scoreboard."""
+        start = time.monotonic()
+        is_valid, error = self.validate_url(url, headers, timeout)
+        self.scoreboard.record_probe(
+            url, server, is_valid, time.monotonic() - start if is_valid else None
+        )
+        return is_valid, error
+
+    def get_host_latency(self, url: str) -> Optional[float]:
+        """Get the smoothed time-to-first-byte in seconds for a URL's host."""
+        stats = self.scoreboard.get_stats(url=url).get("host")
+        return stats.ttfb if stats else None
+
+    def iter_valid(
+        self,
+        streams: Iterable[Any],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = 3,
+        budget: float = VALIDATION_BUDGET,
+        max_workers: int = VALIDATION_WORKERS,
+    ) -> Iterator[Any]:
+        """Yield valid streams in their given order while probing in parallel.
+
+        All streams are probed at once on a bounded pool. A stream is
+        yielded as soon as it is confirmed valid and every stream ranked
+        above it has been ruled out, so callers that pass a ranked list get
+        the best valid link without waiting for slower probes. Probes still
+        pending when ``budget`` seconds have passed are skipped, and closing
+        the generator cancels probes that have not started.
+
+        Args:
+            streams: Stream dicts or StreamLink objects, best first.
+            headers: Extra headers sent with every probe.
+            timeout: Per-probe timeout in seconds.
+            budget: Overall deadline in seconds for the whole batch.
+            max_workers: Maximum concurrent probes.
+
+        Yields:
+            Valid streams, in input order.
+        """
+        streams = [s for s in streams if _stream_url(s)]
+        if not streams:
+            return
+
+        deadline = time.monotonic() + budget
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_workers, len(streams)),
+            thread_name_prefix="stream-validator",
+        )
+        try:
+            futures = [
+                executor.submit(
+                    self.probe,
+                    _stream_url(s),
+                    _stream_headers(s, headers),
+                    timeout,
+                    _stream_server(s),
+                )
+                for s in streams
+            ]
+            for stream, future in zip(streams, futures):
+                url = _stream_url(stream)
+                try:
+                    is_valid, error = future.result(
+                        timeout=max(deadline - time.monotonic(), 0)
+                    )
+                except FuturesTimeout:
+                    future.cancel()
+                    debug(f"[VALIDATOR] Budget exceeded: {url[:50]}...")
+                    continue
+
+                if is_valid:
+                    debug(f"[VALIDATOR] Valid stream: {url[:50]}...")
+                    yield stream
+                else:
+                    debug(f"[VALIDATOR] Invalid stream: {url[:50]}... - {error}")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-        return validated
+    def validate_streams(
+        self, streams: List[Any], headers: Optional[Dict[str, str]] = None
+    ) -> List[Any]:
+        return list(self.iter_valid(streams, headers, timeout=3))
 
 
 stream_validator: StreamValidator = StreamValidator()
@@ -1,4 +1,3 @@
-import requests
 import webbrowser
 import time
 import json
@@ -7,6 +6,7 @@ import sys
 from pathlib import Path
 from urllib.parse import parse_qs
 from weeb_cli.services import logger
+from weeb_cli.services.http_client import http_client
 from weeb_cli.services._tracker_base import BaseTracker
 
 ANILIST_CLIENT_ID = "34596"
@@ -106,7 +106,25 @@ def wait_for_anilist_callback(timeout=120):
         except Exception:
             pass
 
+# Aliased fields per GraphQL document; keeps requests under AniList's complexity limit
+ANILIST_BATCH_SIZE = 25
+
+
+def _chunked(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _list_status(episode, total_episodes):
+    if total_episodes and episode >= total_episodes:
+        return "COMPLETED"
+    return "CURRENT"
+
+
 class AniListTracker(BaseTracker):
+    # AniList allows roughly 90 requests a minute and each update needs a search too
+    sync_min_interval = 1.5
+    sync_batch_size = ANILIST_BATCH_SIZE
+
     def __init__(self):
         super().__init__("anilist")
         self._token = None
@@ -137,7 +155,7 @@ class AniListTracker(BaseTracker):
 
     def _exchange_code(self, code):
         try:
-            resp = requests.post(
+            resp = http_client.post(
                 "https://anilist.co/api/v2/oauth/token",
                 json={
                     "grant_type": "authorization_code",
@@ -188,7 +206,7 @@ class AniListTracker(BaseTracker):
             return None
 
         try:
-            resp = requests.post(
+            resp = http_client.post(
                 "https://graphql.anilist.co",
                 json={"query": query, "variables": variables or {}},
                 headers={"Authorization": f"Bearer {self.token}"},
@@ -201,6 +219,126 @@ class AniListTracker(BaseTracker):
             logger.error(f"AniList request failed: {e}")
         return None
 
+    def _graphql_batch(self, query, variables):
+        """Run an aliased document, keeping the data of fields that succeeded.
+
+        AniList answers 404 with partial data when one of several ``Media``
+        lookups finds nothing, so the body is read regardless of status.
+        """
+        if not self.token:
+            return None
+
+        try:
+            resp = http_client.post(
+                "https://graphql.anilist.co",
+                json={"query": query, "variables": variables},
+                headers={"Authorization": f"Bearer {self.token}"},
+                timeout=20
+            )
+            body = resp.json()
+            data = body.get("data") if isinstance(body, dict) else None
+            if isinstance(data, dict):
+                return data
+            logger.error(f"AniList API error: {resp.status_code}")
+        except Exception as e:
+            logger.error(f"AniList request failed: {e}")
+        return None
+
+    def search_anime_many(self, titles):
+        """Look up several titles in one request.
+
+        Returns:
+            A list aligned with ``titles`` holding the media dict or None.
+        """
+        if not titles:
+            return []
+
+        params = ", ".join(f"$s{i}: String" for i in range(len(titles)))
+        fields = "\n".join(
+            f"m{i}: Media(search: $s{i}, type: ANIME) {{ id episodes }}" for i in range(len(titles))
+        )
+        data = self._graphql_batch(
+            f"query ({params}) {{\n{fields}\n}}",
+            {f"s{i}": title for i, title in enumerate(titles)}
+        ) or {}
+        return [data.get(f"m{i}") for i in range(len(titles))]
+
+    def save_entries(self, entries):
+        """Save several list entries in one mutation.
+
+        Args:
+            entries: ``(media_id, episode, total_episodes)`` tuples.
+
+        Returns:
+            A list aligned with ``entries`` holding the saved entry or None.
+        """
+        if not entries:
+            return []
+
+        params = ", ".join(
+            f"$m{i}: Int, $p{i}: Int, $s{i}: MediaListStatus" for i in range(len(entries))
+        )
+        fields = "\n".join(
+            f"u{i}: SaveMediaListEntry(mediaId: $m{i}, progress: $p{i}, status: $s{i}) {{ id progress status }}"
+            for i in range(len(entries))
+        )
+        variables = {}
+        for i, (media_id, episode, total_episodes) in enumerate(entries):
+            variables[f"m{i}"] = media_id
+            variables[f"p{i}"] = episode
+            variables[f"s{i}"] = _list_status(episode, total_episodes)
+        data = self._graphql_batch(f"mutation ({params}) {{\n{fields}\n}}", variables) or {}
+        return [data.get(f"u{i}") for i in range(len(entries))]
+
+    def update_progress_batch(self, updates):
+        """Send many updates with one lookup and one mutation per chunk.
+
+        Updates for the same title collapse to the highest episode; the
+        superseded ones count as synced once that one is saved.
+        """
+        if not self.is_authenticated():
+            for u in updates:
+                self._queue_update(u["title"], u["episode"], u.get("total"))
+            return [False] * len(updates)
+
+        latest = {}
+        for u in updates:
+            key = self._title_key(u["title"])
+            if key not in latest or u["episode"] > latest[key]["episode"]:
+                latest[key] = u
+
+        media_ids = {}
+        unresolved = []
+        for key, u in latest.items():
+            cached = self._cached_ids(u["title"])
+            if cached:
+                media_ids[key] = int(cached["media_id"])
+            else:
+                unresolved.append(key)
+
+        for chunk in _chunked(unresolved, ANILIST_BATCH_SIZE):
+            found = self.search_anime_many([latest[key]["title"] for key in chunk])
+            for key, media in zip(chunk, found):
+                if media:
+                    media_ids[key] = media["id"]
+                else:
+                    logger.warning(f"AniList: Anime not found: {latest[key]['title']}")
+
+        saved = set()
+        for chunk in _chunked([key for key in latest if key in media_ids], ANILIST_BATCH_SIZE):
+            results = self.save_entries([
+                (media_ids[key], latest[key]["episode"], latest[key].get("total")) for key in chunk
+            ])
+            for key, entry in zip(chunk, results):
+                if entry:
+                    saved.add(key)
+                    if key in unresolved:
+                        self._remember_ids(latest[key]["title"], media_ids[key])
+
+        if saved:
+            logger.info(f"AniList: Updated {len(saved)} anime in one batch")
+        return [self._title_key(u["title"]) in saved for u in updates]
+
     def _get_viewer(self):
         query = """
         query {
@@ -240,12 +378,15 @@ class AniListTracker(BaseTracker):
             self._queue_update(anime_title, episode, total_episodes)
             return False
 
-        media = self.search_anime(anime_title)
-        if not media:
-            logger.warning(f"AniList: Anime not found: {anime_title}")
-            return False
-
-        media_id = media["id"]
+        cached = self._cached_ids(anime_title)
+        if cached:
+            media_id = int(cached["media_id"])
+        else:
+            media = self.search_anime(anime_title)
+            if not media:
+                logger.warning(f"AniList: Anime not found: {anime_title}")
+                return False
+            media_id = media["id"]
 
         query = """
         mutation ($mediaId: Int, $progress: Int, $status: MediaListStatus) {
@@ -257,18 +398,16 @@ class AniListTracker(BaseTracker):
         }
         """
 
-        status = "CURRENT"
-        if total_episodes and episode >= total_episodes:
-            status = "COMPLETED"
-
         variables = {
             "mediaId": media_id,
             "progress": episode,
-            "status": status
+            "status": _list_status(episode, total_episodes)
         }
 
         result = self._graphql(query, variables)
         if result:
+            if not cached:
+                self._remember_ids(anime_title, media_id)
             logger.info(f"AniList: Updated {anime_title} to episode {episode}")
             return True
         return False
@@ -372,7 +511,7 @@ class MALTracker(BaseTracker):
 
     def start_auth_flow(self, timeout=120):
         try:
-            resp = requests.get(f"{MAL_PROXY_URL}/auth/url", timeout=10)
+            resp = http_client.get(f"{MAL_PROXY_URL}/auth/url", timeout=10)
             if resp.status_code != 200:
                 return None
 
@@ -393,7 +532,7 @@ class MALTracker(BaseTracker):
 
     def _exchange_code(self, code, code_verifier):
         try:
-            resp = requests.post(
+            resp = http_client.post(
                 f"{MAL_PROXY_URL}/auth/token",
                 json={"code": code, "code_verifier": code_verifier},
                 timeout=30
@@ -426,7 +565,7 @@ class MALTracker(BaseTracker):
             return False
 
         try:
-            resp = requests.post(
+            resp = http_client.post(
                 f"{MAL_PROXY_URL}/auth/refresh",
                 json={"refresh_token": self._refresh_token},
                 timeout=30
@@ -450,7 +589,7 @@ class MALTracker(BaseTracker):
             return None
 
         try:
-            resp = requests.get(
+            resp = http_client.get(
                 f"{MAL_PROXY_URL}/user",
                 params={"access_token": self._access_token},
                 timeout=10
@@ -483,7 +622,7 @@ class MALTracker(BaseTracker):
             return None
 
         try:
-            resp = requests.get(
+            resp = http_client.get(
                 f"{MAL_PROXY_URL}/search",
                 params={"access_token": self.access_token, "q": title, "limit": 5},
                 timeout=10
@@ -503,18 +642,21 @@ class MALTracker(BaseTracker):
             self._queue_update(anime_title, episode, total_episodes)
             return False
 
-        anime = self.search_anime(anime_title)
-        if not anime:
-            logger.warning(f"MAL: Anime not found: {anime_title}")
-            return False
-
-        anime_id = anime["id"]
+        cached = self._cached_ids(anime_title)
+        if cached:
+            anime_id = int(cached["media_id"])
+        else:
+            anime = self.search_anime(anime_title)
+            if not anime:
+                logger.warning(f"MAL: Anime not found: {anime_title}")
+                return False
+            anime_id = anime["id"]
         status = "watching"
         if total_episodes and episode >= total_episodes:
             status = "completed"
 
         try:
-            resp = requests.post(
+            resp = http_client.post(
                 f"{MAL_PROXY_URL}/anime/update",
                 json={
                     "access_token": self.access_token,
@@ -526,6 +668,8 @@ class MALTracker(BaseTracker):
             )
 
             if resp.status_code == 200:
+                if not cached:
+                    self._remember_ids(anime_title, anime_id)
                 logger.info(f"MAL: Updated {anime_title} to episode {episode}")
                 return True
         except Exception as e:
@@ -558,7 +702,7 @@ class KitsuTracker(BaseTracker):
 
     def authenticate(self, email, password):
         try:
-            resp = requests.post(
+            resp = http_client.post(
                 "https://kitsu.io/api/oauth/token",
                 json={
                     "grant_type": "password",
@@ -589,6 +733,7 @@ class KitsuTracker(BaseTracker):
     def logout(self):
         self._access_token = None
         self._user_id = None
+        self.db.clear_tracker_entries("kitsu")
         self.db.set_config("kitsu_access_token", None)
         self.db.set_config("kitsu_user_id", None)
         self.db.set_config("kitsu_username", None)
@@ -601,7 +746,7 @@ class KitsuTracker(BaseTracker):
             return None
 
         try:
-            resp = requests.get(
+            resp = http_client.get(
                 "https://kitsu.io/api/edge/users",
                 params={"filter[self]": "true"},
                 headers={"Authorization": f"Bearer {self.access_token}"},
@@ -619,7 +764,7 @@ class KitsuTracker(BaseTracker):
 
     def search_anime(self, title):
         try:
-            resp = requests.get(
+            resp = http_client.get(
                 "https://kitsu.io/api/edge/anime",
                 params={"filter[text]": title, "page[limit]": 5},
                 headers={"Accept": "application/vnd.api+json"},
@@ -640,7 +785,7 @@ class KitsuTracker(BaseTracker):
             return None
 
         try:
-            resp = requests.get(
+            resp = http_client.get(
                 "https://kitsu.io/api/edge/library-entries",
                 params={
                     "filter[user_id]": self.user_id,
@@ -660,18 +805,37 @@ class KitsuTracker(BaseTracker):
             logger.error(f"Kitsu get library entry error: {e}")
         return None
 
+    @staticmethod
+    def _created_entry_id(resp):
+        try:
+            data = resp.json()
+        except Exception:
+            return None
+        if isinstance(data, dict) and isinstance(data.get("data"), dict):
+            return data["data"].get("id")
+        return None
+
     def update_progress(self, anime_title, episode, total_episodes=None):
         if not self.is_authenticated():
             self._queue_update(anime_title, episode, total_episodes)
             return False
 
-        anime = self.search_anime(anime_title)
-        if not anime:
-            logger.warning(f"Kitsu: Anime not found: {anime_title}")
-            return False
+        cached = self._cached_ids(anime_title)
+        if cached:
+            anime_id = cached["media_id"]
+            entry_id = cached.get("entry_id")
+        else:
+            anime = self.search_anime(anime_title)
+            if not anime:
+                logger.warning(f"Kitsu: Anime not found: {anime_title}")
+                return False
+            anime_id = anime["id"]
+            entry_id = None
 
-        anime_id = anime["id"]
-        entry = self._get_library_entry(anime_id)
+        cached_entry = entry_id is not None
+        if not cached_entry:
+            entry = self._get_library_entry(anime_id)
+            entry_id = entry["id"] if entry else None
 
         status = "current"
         if total_episodes and episode >= total_episodes:
@@ -702,10 +866,9 @@ class KitsuTracker(BaseTracker):
         }
 
         try:
-            if entry:
-                entry_id = entry["id"]
+            if entry_id:
                 payload["data"]["id"] = entry_id
-                resp = requests.patch(
+                resp = http_client.patch(
                     f"https://kitsu.io/api/edge/library-entries/{entry_id}",
                     json=payload,
                     headers={
@@ -715,7 +878,7 @@ class KitsuTracker(BaseTracker):
                     timeout=10
                 )
             else:
-                resp = requests.post(
+                resp = http_client.post(
                     "https://kitsu.io/api/edge/library-entries",
                     json=payload,
                     headers={
@@ -726,8 +889,16 @@ class KitsuTracker(BaseTracker):
                 )
 
             if resp.status_code in [200, 201]:
+                if not entry_id:
+                    entry_id = self._created_entry_id(resp)
+                if not (cached and cached_entry):
+                    self._remember_ids(anime_title, anime_id, entry_id)
                 logger.info(f"Kitsu: Updated {anime_title} to episode {episode}")
                 return True
+            elif resp.status_code == 404 and cached_entry:
+                # The entry was removed on Kitsu; look it up again
+                self._remember_ids(anime_title, anime_id)
+                return self.update_progress(anime_title, episode, total_episodes)
             else:
                 logger.error(f"Kitsu update failed: {resp.status_code}")
         except Exception as e:
@@ -161,15 +161,29 @@ def update_via_pip():
 from weeb_cli.config import config
 import time
 
-def update_prompt():
+def refresh_update_info():
+    """Check GitHub for a newer release at most once a day.
+    
+    Safe to run in a background thread: the result is only stored in
+    config (``update_available``) for :func:`update_prompt` to pick up.
+    """
     last_check = float(config.get("last_update_check") or 0)
     if time.time() - last_check < 86400: # 24 hours
         return
 
-    is_available, latest_ver, assets = check_for_updates()
+    is_available, latest_ver, _ = check_for_updates()
     config.set("last_update_check", str(time.time()))
-    
-    if not is_available:
+    config.set("update_available", latest_ver if is_available else None)
+
+def update_prompt():
+    latest_ver = config.get("update_available")
+    if not latest_ver:
+        return
+    config.set("update_available", None)
+    try:
+        if version.parse(latest_ver) <= version.parse(__version__):
+            return
+    except version.InvalidVersion:
         return
     
     console.clear()
@@ -184,6 +198,7 @@ def update_prompt():
     if not should_update:
         return
     
+    _, _, assets = check_for_updates()
     install_method = get_install_method()
     
     if install_method == "exe":